@@ -0,0 +1,115 @@
+import argparse
+import gc
+import tracemalloc
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+from rpd_generator import main as rpd_generator
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.bdl_structure import base_definition, base_node
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+
+# Value of every simulation result while the objects are populated
+SIMULATION_RESULT = 1.0
+
+
+def benchmark_memory(bdl_path: Path) -> dict:
+    """
+    Measure the memory held by the parsed BDL file, by the RMD objects created from it and by the objects once they
+    are populated and inserted into the RPD, which is when the memory of a generation is largest.
+    Simulation results are replaced by a constant, so no eQUEST installation or simulation is required.
+    :param bdl_path: path of a BDL file with Diagnostic Comments
+    :return: dictionary of the number of objects and the memory in bytes after each step
+    """
+    bdl_input_reader = ModelInputReader()
+    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.object(
+                base_node,
+                "get_multiple_results",
+                lambda *args: [SIMULATION_RESULT] * len(args[-1]),
+            )
+        )
+        for module in (base_node, base_definition):
+            stack.enter_context(
+                patch.object(module, "get_string_result", lambda *args: "")
+            )
+        stack.enter_context(
+            patch.object(
+                Config, "EQUEST_INSTALL_PATH", Config.EQUEST_INSTALL_PATH or ""
+            )
+        )
+
+        gc.collect()
+        tracemalloc.start()
+        model_input_data = bdl_input_reader.read_input_bdl_file(str(bdl_path))
+        gc.collect()
+        parsed_memory = tracemalloc.get_traced_memory()[0]
+
+        rmd = rpd_generator.generate_rmd_from_model_input_data(
+            str(bdl_path), model_input_data
+        )
+        gc.collect()
+        created_memory = tracemalloc.get_traced_memory()[0]
+
+        rpd = RulesetProjectDescription()
+        rmd.bdl_obj_instances["ASHRAE 229"] = rpd
+        rmd.populate_rmd_data()
+        rmd.insert_to_rpd(rpd)
+        rpd.populate_data_group()
+        gc.collect()
+        populated_memory, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "objects": len(rmd.bdl_obj_instances),
+        "parsed": parsed_memory,
+        "created": created_memory,
+        "populated": populated_memory,
+        "peak": peak_memory,
+    }
+
+
+def get_largest_test_bdl_files(count: int) -> list:
+    test_directory = Path(__file__).parents[1] / "test" / "full_rpd_test"
+    bdl_files = sorted(
+        test_directory.rglob("*.BDL"), key=lambda path: path.stat().st_size
+    )
+    return bdl_files[-count:][::-1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report the memory used to parse BDL files and to create and populate their RMD objects."
+    )
+    parser.add_argument(
+        "bdl_files",
+        nargs="*",
+        type=Path,
+        help="BDL files to measure. Defaults to the largest test case BDL files.",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=5,
+        help="Number of test case BDL files to measure when none are given.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'Model':<50} {'Objects':>8} {'Parsed MB':>10} {'Created MB':>11} {'Populated MB':>13} {'Peak MB':>8} "
+        f"{'KB/object':>10}"
+    )
+    for bdl_file in args.bdl_files or get_largest_test_bdl_files(args.count):
+        result = benchmark_memory(bdl_file)
+        print(
+            f"{bdl_file.stem[:50]:<50} {result['objects']:>8} {result['parsed'] / 1e6:>10.2f} "
+            f"{result['created'] / 1e6:>11.2f} {result['populated'] / 1e6:>13.2f} {result['peak'] / 1e6:>8.2f} "
+            f"{result['populated'] / result['objects'] / 1e3:>10.2f}"
+        )
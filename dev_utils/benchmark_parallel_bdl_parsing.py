@@ -0,0 +1,111 @@
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.doe2_file_readers.parallel_bdl_reader import (
+    read_input_bdl_file_parallel,
+)
+
+
+def write_synthetic_bdl(source_bdl_path: Path, target_bdl_path: Path, copies: int):
+    """
+    Write a large BDL file made of copies of a test case BDL file. The objects of each copy get unique names, so
+    every copy is parsed.
+    :param source_bdl_path: path of a BDL file with Diagnostic Comments
+    :param target_bdl_path: path of the BDL file to write
+    :param copies: number of copies of the source file
+    """
+    with open(source_bdl_path, newline="") as source_file:
+        lines = source_file.read().splitlines(keepends=True)
+    u_names = {
+        ModelInputReader._parse_command_line(line)[0]
+        for line in lines
+        if '" = ' in line
+    }
+
+    with open(target_bdl_path, "w", newline="") as target_file:
+        for copy in range(copies):
+            for line in lines:
+                if '" = ' in line:
+                    u_name = ModelInputReader._parse_command_line(line)[0]
+                    line = line.replace(f'"{u_name}" = ', f'"{u_name} #{copy}" = ', 1)
+                elif "DATA FOR" in line and line[32:].rstrip() in u_names:
+                    content = line.rstrip("\r\n")
+                    line = f"{content} #{copy}{line[len(content):]}"
+                target_file.write(line)
+
+
+def time_read(read, repeat: int) -> float:
+    """
+    :return: float: the shortest time of the repeated reads, in seconds
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def get_largest_test_bdl_file() -> Path:
+    test_directory = Path(__file__).parents[1] / "test" / "full_rpd_test"
+    return max(test_directory.rglob("*.BDL"), key=lambda path: path.stat().st_size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report the speedup of parsing a large synthetic BDL file in parallel, by number of workers."
+    )
+    parser.add_argument(
+        "bdl_file",
+        nargs="?",
+        type=Path,
+        help="BDL file to copy. Defaults to the largest test case BDL file.",
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=100,
+        help="Number of copies of the BDL file in the synthetic file.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}),
+        help="Numbers of worker processes to measure.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of reads to time per setting."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bdl_path = Path(temp_dir) / "synthetic.BDL"
+        write_synthetic_bdl(
+            args.bdl_file or get_largest_test_bdl_file(), bdl_path, args.copies
+        )
+        # Build the index of the first phase once, as it is reused while the file is unchanged
+        read_input_bdl_file_parallel(str(bdl_path), 1)
+
+        model_input_reader = ModelInputReader()
+        sequential_time = time_read(
+            lambda: model_input_reader.read_input_bdl_file(str(bdl_path)),
+            args.repeat,
+        )
+        print(
+            f"{bdl_path.stat().st_size / 1e6:.1f} MB, {os.cpu_count()} processors\n"
+            f"{'Workers':>8} {'Seconds':>8} {'Speedup':>8}\n"
+            f"{'serial':>8} {sequential_time:>8.2f} {1:>8.2f}"
+        )
+        for workers in args.workers:
+            parallel_time = time_read(
+                lambda: read_input_bdl_file_parallel(str(bdl_path), workers),
+                args.repeat,
+            )
+            print(
+                f"{workers:>8} {parallel_time:>8.2f} {sequential_time / parallel_time:>8.2f}"
+            )
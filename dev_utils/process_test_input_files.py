@@ -4,7 +4,7 @@ from pathlib import Path
 
 from rpd_generator import main as rpd_generator
 from rpd_generator.config import Config
-from rpd_generator.doe2_file_readers.bdlcio32 import process_input_file
+from rpd_generator.doe2_file_readers.bdlcio32 import Bdlcio32Converter
 from rpd_generator.utilities import validate_configuration
 
 
@@ -15,33 +15,29 @@ def process_test_input_files():
 
     with tempfile.TemporaryDirectory() as temp_dir:
 
-        for test_inp_file in test_inp_files:
-            print(f"Processing INP File for Test Case {test_inp_file.parent.name}...")
+        # Prepare the inp files for processing and save the revised copies to the temporary directory
+        temp_inp_paths = [
+            Path(rpd_generator.prepare_inp(Path(test_inp_file), Path(temp_dir)))
+            for test_inp_file in test_inp_files
+        ]
 
-            # Prepare the inp file for processing and save the revised copy to the temporary directory
-            temp_file_path = rpd_generator.prepare_inp(
-                Path(test_inp_file), Path(temp_dir)
-            )
+        # Set the paths for the directories
+        doe23_path = Path(Config.DOE23_DATA_PATH) / "DOE23"
+        bdlcio32_path = Path(Config.EQUEST_INSTALL_PATH) / "Bdlcio32.dll"
 
-            # Set the paths for the inp file, json file, and the directories
-            temp_inp_path = Path(temp_file_path)
-            bdl_path = temp_inp_path.with_suffix(".BDL")
-            doe23_path = Path(Config.DOE23_DATA_PATH) / "DOE23"
-            bdlcio32_path = Path(Config.EQUEST_INSTALL_PATH) / "Bdlcio32.dll"
-
-            # Process the inp file to create the BDL file with Diagnostic Comments (defaults and evaluated values) in the temporary directory
-            process_input_file(
-                str(bdlcio32_path),
-                str(doe23_path) + "\\",
-                str(temp_inp_path.parent) + "\\",
-                temp_inp_path.name,
-            )
+        # Process the inp files to create the BDL files with Diagnostic Comments (defaults and evaluated values) in the temporary directory
+        print(f"Processing {len(temp_inp_paths)} INP Files...")
+        with Bdlcio32Converter(str(bdlcio32_path), str(doe23_path) + "\\") as converter:
+            bdl_paths = converter.convert_all(temp_inp_paths)
 
+        for test_inp_file, bdl_path in zip(test_inp_files, bdl_paths):
             # Copy the BDL file from the temporary directory back to the project directory
             shutil.copy(str(bdl_path), str(test_inp_file.parent))
 
-            print(f"Diagnostic-Commented BDL file created.")
-            print("----------------------------------------")
+            print(
+                f"Diagnostic-Commented BDL file created for Test Case {test_inp_file.parent.name}."
+            )
+        print("----------------------------------------")
 
 
 if __name__ == "__main__":
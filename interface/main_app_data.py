@@ -1,7 +1,5 @@
-import atexit
-import tempfile
-
 import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rpd_generator import main as rpd_generator
@@ -11,6 +9,7 @@ from rpd_generator.artifacts.ruleset_project_description import (
 from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
 from rpd_generator.config import Config
 from rpd_generator.schema.schema_enums import SchemaEnums
+from rpd_generator.utilities.progress import ProgressReporter
 
 
 class MainAppData:
@@ -113,9 +112,6 @@ class MainAppData:
     )
 
     def __init__(self):
-        self.processing_dir = tempfile.TemporaryDirectory()
-        atexit.register(self.processing_dir.cleanup)
-
         self.bdl_reader = ModelInputReader()
         RulesetProjectDescription.bdl_command_dict = self.bdl_reader.bdl_command_dict
         self.rpd = RulesetProjectDescription()
@@ -140,6 +136,10 @@ class MainAppData:
         self.installation_path.set(Config.EQUEST_INSTALL_PATH)
         self.configuration_data = {}
 
+        # Long-running jobs run one at a time off the Tk main thread
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.active_progress = None
+
     @staticmethod
     def verify_associated_files(file_path: str) -> bool:
         """
@@ -170,20 +170,44 @@ class MainAppData:
 
         return True
 
-    def generate_rmds(self):
-        for ruleset_model_type, file_path in self.ruleset_model_file_paths.items():
-            if file_path:
-                rmd = rpd_generator.generate_rmd_from_inp(
-                    file_path, self.processing_dir
-                )
-                rmd.bdl_obj_instances["ASHRAE 229"] = self.rpd
-
-                rmd.populate_rmd_data()
-                rmd.type = ruleset_model_type
-                self.rmds.append(rmd)
-
-    def call_write_rpd_json_from_inp(self):
-        rpd_generator.write_rpd_json_from_inp(str(self.test_inp_path.get()))
+    def submit_job(self, function):
+        """
+        Run a long-running job in the background.
+        :param function: function that accepts a progress keyword argument, e.g. generate_rmds
+        :return: tuple of the Future of the job and the ProgressReporter it publishes events to
+        """
+        progress = ProgressReporter()
+        self.active_progress = progress
+        future = self.executor.submit(function, progress=progress)
+        return future, progress
+
+    def shutdown(self):
+        """Cancel the running job, if any, and stop the background executor without waiting for it."""
+        if self.active_progress:
+            self.active_progress.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def generate_rmds(self, progress=None):
+        ruleset_model_types = [
+            ruleset_model_type
+            for ruleset_model_type, file_path in self.ruleset_model_file_paths.items()
+            if file_path
+        ]
+        # Each model is generated in its own worker process
+        rmds = rpd_generator.generate_populated_rmds(
+            [
+                self.ruleset_model_file_paths[ruleset_model_type]
+                for ruleset_model_type in ruleset_model_types
+            ],
+            self.rpd,
+            progress=progress,
+        )
+        for ruleset_model_type, rmd in zip(ruleset_model_types, rmds):
+            rmd.type = ruleset_model_type
+            self.rmds.append(rmd)
+
+    def call_write_rpd_json_from_inp(self, progress=None):
+        rpd_generator.write_rpd_json_from_inp(str(self.test_inp_path.get()), progress)
 
     def is_all_new_construction(self):
         is_all_new_construction = self.configuration_data.get("new_construction")
@@ -4,6 +4,7 @@ from interface.compliance_parameter_window import ComplianceParameterWindow
 from interface.install_config import InstallConfigWindow
 from interface.project_config import ProjectConfigWindow
 from interface.main_app_data import MainAppData
+from interface.progress_window import ProgressWindow
 
 from rpd_generator.config import Config
 from rpd_generator.utilities import validate_configuration
@@ -60,6 +61,20 @@ class MainApplication(tk.Tk):
                 self.install_config_window = InstallConfigWindow(self)
                 self.install_config_window.protocol("WM_DELETE_WINDOW", self.quit)
 
+    def run_in_background(self, function, on_complete=None, master=None):
+        """Run a long-running job off the Tk main thread and show its progress in a ProgressWindow.
+        :param function: function that accepts a progress keyword argument, e.g. MainAppData.generate_rmds
+        :param on_complete: function called on the main thread with the result of the job if it succeeds
+        :param master: window that started the job
+        """
+        future, progress = self.data.submit_job(function)
+        return ProgressWindow(master or self, future, progress, on_complete)
+
+    def quit(self):
+        """Cancel any running job so that the application does not hang waiting for it"""
+        self.data.shutdown()
+        super().quit()
+
     def install_config_complete(self):
         """Called by InstallConfigWindow when the user has successfully configured the installation path. Closes
         the InstallConfigWindow and opens the ProjectConfigWindow"""
@@ -0,0 +1,81 @@
+import customtkinter as ctk
+
+from interface.error_window import ErrorWindow
+from rpd_generator.utilities.progress import GenerationCancelled
+
+# Milliseconds between two polls of the progress events
+POLL_INTERVAL = 100
+
+
+class ProgressWindow(ctk.CTkToplevel):
+    """
+    Shows the progress of a job running in the background and lets the user cancel it. The window polls the job's
+    progress events from the Tk main thread, so the rest of the interface stays responsive.
+    """
+
+    def __init__(self, master, future, progress, on_complete=None):
+        """
+        :param master: window that started the job
+        :param future: Future of the job, see MainAppData.submit_job
+        :param progress: ProgressReporter the job publishes events to
+        :param on_complete: function called on the main thread with the result of the job if it succeeds
+        """
+        super().__init__(master)
+        self.future = future
+        self.progress = progress
+        self.on_complete = on_complete
+
+        self.title("Generating")
+        self.geometry("400x150")
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.stage_label = ctk.CTkLabel(self, text="Starting...", anchor="w")
+        self.stage_label.pack(fill="x", padx=10, pady=(15, 5))
+
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=10, pady=5)
+
+        self.cancel_button = ctk.CTkButton(self, text="Cancel", command=self.cancel)
+        self.cancel_button.pack(padx=10, pady=(10, 15))
+
+        # Keep the user from starting another job while this one runs: the window stays on top of the window that
+        # started the job, and takes every input of the application until it is destroyed. Tk only grabs the input
+        # of a window that is shown.
+        self.transient(master)
+        self.wait_visibility()
+        self.grab_set()
+        self.after(POLL_INTERVAL, self.poll)
+
+    def poll(self):
+        for event in self.progress.get_events():
+            self.show_event(event)
+
+        if not self.future.done():
+            self.after(POLL_INTERVAL, self.poll)
+            return
+
+        master = self.master
+        self.destroy()
+        error = self.future.exception()
+        if isinstance(error, GenerationCancelled):
+            return
+        if error is not None:
+            ErrorWindow(master, f"{type(error).__name__}: {error}")
+        elif self.on_complete:
+            self.on_complete(self.future.result())
+
+    def show_event(self, event):
+        if event["total"]:
+            self.stage_label.configure(
+                text=f"{event['stage']} ({event['completed']}/{event['total']})"
+            )
+            self.progress_bar.set(event["completed"] / event["total"])
+        else:
+            self.stage_label.configure(text=event["stage"])
+
+    def cancel(self):
+        self.progress.cancel()
+        self.stage_label.configure(text="Cancelling...")
+        self.cancel_button.configure(state="disabled")
@@ -346,8 +346,11 @@ class ProjectConfigWindow(ctk.CTkToplevel):
         # If there are no errors, generate RMDs and open the Main Application Window
         if len(self.main_app.data.errors) == 0:
             self.save_configuration_data()
-            self.main_app.data.generate_rmds()
-            self.main_app.project_config_complete()
+            self.main_app.run_in_background(
+                self.main_app.data.generate_rmds,
+                on_complete=lambda _: self.main_app.project_config_complete(),
+                master=self,
+            )
 
         else:
             self.raise_error_window("\n".join(self.main_app.data.errors))
@@ -0,0 +1,210 @@
+from tkinter.font import Font
+
+import customtkinter as ctk
+from tksheet import Sheet, num2alpha
+
+
+READONLY = "readonly"
+ALL_GROUPS = "All"
+# Number of rows whose text the columns are sized to, so that sizing does not grow with the size of the model
+COLUMN_SIZE_SAMPLE_ROWS = 100
+# Pixels added to the width of the text of a column, which leave room for the cell padding and dropdown arrow
+COLUMN_PADDING = 30
+
+
+class SheetColumn:
+    def __init__(
+        self, header, default="", options=None, checkbox=False, readonly=False
+    ):
+        """
+        :param header: (str) column header
+        :param default: value of the column's cells when the row is created
+        :param options: (list) values of the column's dropdown, if any
+        :param checkbox: (bool) whether the column's cells are checkboxes
+        :param readonly: (bool) whether the column's cells can be edited
+        """
+        self.header = header
+        self.default = default
+        self.options = options
+        self.checkbox = checkbox
+        self.readonly = readonly
+
+    def validate(self, value):
+        """Return the value to keep in a cell after it was edited to value."""
+        if isinstance(self.default, int) and not isinstance(self.default, bool):
+            try:
+                return max(int(value), 1)
+            except (TypeError, ValueError):
+                return self.default
+        return value
+
+
+class SheetSubview(ctk.CTkFrame):
+    """
+    Table of the objects of a view backed by a tksheet Sheet. The sheet only draws the cells that are visible, so a
+    view opens in about the same time whatever the size of the model. Rows are created from the RMD the first time the
+    subview is opened, and are filtered by name and by group (e.g. floor) through indexes built at the same time.
+    """
+
+    def __init__(self, master, columns, group_label=None):
+        """
+        :param master: frame the subview is placed in
+        :param columns: (list) SheetColumn of each column of the sheet
+        :param group_label: (str) label of the group filter, if the rows belong to groups
+        """
+        super().__init__(master)
+        self.columns = columns
+        self.group_label = group_label
+        self.is_subview_populated = False
+        self.row_names = []
+        # Lowercase name and group of each row, searched when the filter changes
+        self.search_keys = []
+        # {row name: row index}
+        self.rows_by_name = {}
+        # {group: [row indexes]}
+        self.rows_by_group = {}
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.filter_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.filter_frame.grid(row=0, column=0, sticky="w", pady=(0, 10))
+        self.search_entry = ctk.CTkEntry(
+            self.filter_frame, placeholder_text="Search", width=250
+        )
+        self.search_entry.bind("<KeyRelease>", lambda event: self.apply_filter())
+        self.search_entry.grid(row=0, column=0, padx=(0, 20))
+        self.group_combo = None
+        if group_label:
+            ctk.CTkLabel(self.filter_frame, text=f"{group_label}:").grid(
+                row=0, column=1, padx=(0, 5)
+            )
+            self.group_combo = ctk.CTkComboBox(
+                self.filter_frame,
+                values=[ALL_GROUPS],
+                state=READONLY,
+                command=lambda value: self.apply_filter(),
+            )
+            self.group_combo.set(ALL_GROUPS)
+            self.group_combo.grid(row=0, column=2, padx=(0, 20))
+
+        self.sheet = Sheet(self, headers=[column.header for column in columns])
+        self.sheet.enable_bindings(
+            "single_select",
+            "drag_select",
+            "row_select",
+            "column_width_resize",
+            "arrowkeys",
+            "copy",
+            "paste",
+            "edit_cell",
+        )
+        self.sheet.bind("<<SheetModified>>", self.on_sheet_modified)
+        self.sheet.grid(row=1, column=0, sticky="nsew")
+
+    def get_rows(self):
+        """
+        Yield the (name, group, values) of each row of the subview. Implemented by each subview.
+        """
+        return iter(())
+
+    def populate_subview(self):
+        data = []
+        for name, group, values in self.get_rows():
+            self.index_row(len(data), name, group)
+            data.append(values)
+        self.sheet.set_sheet_data(data, reset_col_positions=False, redraw=False)
+
+        for i, column in enumerate(self.columns):
+            span = self.sheet[num2alpha(i)]
+            if column.options is not None:
+                span.dropdown(values=column.options)
+            elif column.checkbox:
+                span.checkbox()
+            if column.readonly:
+                span.readonly()
+
+        if self.group_combo is not None:
+            self.group_combo.configure(values=[ALL_GROUPS, *self.rows_by_group])
+        self.size_columns(data[:COLUMN_SIZE_SAMPLE_ROWS])
+        self.sheet.redraw()
+        self.is_subview_populated = True
+
+    def size_columns(self, sample_rows):
+        """
+        Set the width of each column to the widest of its header and its cells in sample_rows.
+        :param sample_rows: (list) values of the rows to measure
+        """
+        header_font = Font(font=self.sheet.header_font())
+        cell_font = Font(font=self.sheet.font())
+        widths = []
+        for i, column in enumerate(self.columns):
+            texts = {str(values[i]) for values in sample_rows}
+            # The header is measured with the cells, so that subviews without rows are sized to their headers
+            widths.append(
+                max(
+                    [
+                        header_font.measure(column.header),
+                        *(cell_font.measure(text) for text in texts),
+                    ]
+                )
+                + COLUMN_PADDING
+            )
+        self.sheet.set_column_widths(widths)
+
+    def get_default_values(self, name):
+        """Return the values of a new row, with name in the first column."""
+        return [name] + [column.default for column in self.columns[1:]]
+
+    def index_row(self, row, name, group=None):
+        self.row_names.append(name)
+        self.rows_by_name[name] = row
+        self.search_keys.append(f"{name}\n{group or ''}".lower())
+        if group is not None:
+            self.rows_by_group.setdefault(group, []).append(row)
+
+    def filter_rows(self, search_text, group=None) -> list:
+        """
+        Return the indexes of the rows that belong to group and whose name or group contains every word of
+        search_text.
+        :param search_text: (str) words to search for, case-insensitive
+        :param group: group of the rows, or None for all groups
+        """
+        rows = (
+            self.rows_by_group.get(group, [])
+            if group is not None
+            else range(len(self.row_names))
+        )
+        words = search_text.lower().split()
+        return [
+            row for row in rows if all(word in self.search_keys[row] for word in words)
+        ]
+
+    def apply_filter(self):
+        group = self.group_combo.get() if self.group_combo is not None else ALL_GROUPS
+        group = None if group == ALL_GROUPS else group
+        rows = self.filter_rows(self.search_entry.get(), group)
+        if len(rows) == len(self.row_names):
+            self.sheet.display_rows(all_rows_displayed=True, redraw=True)
+        else:
+            self.sheet.display_rows(rows=rows, all_rows_displayed=False, redraw=True)
+
+    def on_sheet_modified(self, event):
+        for row, column in event.cells.table:
+            value = self.sheet.get_cell_data(row, column)
+            validated_value = self.columns[column].validate(value)
+            if validated_value != value:
+                self.sheet.set_cell_data(row, column, validated_value, redraw=True)
+
+    def get_value(self, name, header):
+        """
+        Return the value of a row's cell.
+        :param name: (str) name of the row
+        :param header: (str) header of the column
+        """
+        column = [column.header for column in self.columns].index(header)
+        return self.sheet.get_cell_data(self.rows_by_name[name], column)
+
+    def set_value(self, name, header, value):
+        column = [column.header for column in self.columns].index(header)
+        self.sheet.set_cell_data(self.rows_by_name[name], column, value)
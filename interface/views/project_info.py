@@ -265,7 +265,9 @@ class ProjectInfoView(BaseView):
         self.reload_model_files()
 
     def reload_model_files(self):
-        self.window.main_app.data.generate_rmds()
+        self.window.main_app.run_in_background(
+            self.window.main_app.data.generate_rmds, master=self.window
+        )
 
     def view_continue(self):
         self.window.show_view("Buildings")
@@ -1,12 +1,10 @@
 import customtkinter as ctk
 
-from interface.ctk_xyframe import CTkXYFrame
 from interface.base_view import BaseView
+from interface.sheet_view import SheetColumn, SheetSubview
 
 
 STANDARD_FONT = ("Arial", 16, "bold")
-READONLY = "readonly"
-LEFT = "left"
 W = "w"
 
 
@@ -19,14 +17,16 @@ class SurfacesView(BaseView):
         self.subview_frame = ctk.CTkFrame(self)
         self.current_subview = None
 
-        self.subviews = {
-            "Exterior": ExteriorSurfaceView(self.subview_frame),
-            "Interior": InteriorSurfaceView(self.subview_frame),
-            "Underground": UndergroundSurfaceView(self.subview_frame),
-            "Windows": WindowSurfaceView(self.subview_frame),
-            "Skylights": SkylightSurfaceView(self.subview_frame),
-            "Doors": DoorSurfaceView(self.subview_frame),
+        # Subviews are only created when first shown
+        self.subview_classes = {
+            "Exterior": ExteriorSurfaceView,
+            "Interior": InteriorSurfaceView,
+            "Underground": UndergroundSurfaceView,
+            "Windows": WindowSurfaceView,
+            "Skylights": SkylightSurfaceView,
+            "Doors": DoorSurfaceView,
         }
+        self.subviews = {}
 
         """Directions frame holds all directions info and will get 'gridded' within the surfaces view grid"""
         self.directions_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -117,6 +117,10 @@ class SurfacesView(BaseView):
             self.current_subview.grid_forget()
 
         # Show new subview
+        if subview_name not in self.subviews and subview_name in self.subview_classes:
+            self.subviews[subview_name] = self.subview_classes[subview_name](
+                self.subview_frame
+            )
         subview = self.subviews.get(subview_name)
         if subview:
             self.current_subview = subview
@@ -139,149 +143,80 @@ class SurfacesView(BaseView):
                 )
 
 
-class ExteriorSurfaceView(CTkXYFrame):
-    def __init__(self, subview_frame):
-        super().__init__(subview_frame)
-        self.surfaces_view = subview_frame.master
-        self.main_app_data = self.surfaces_view.window.main_app.data
-        self.is_subview_populated = False
-
-    def __repr__(self):
-        return "ExteriorSurfaceView"
-
-    def open_subview(self):
-        self.surfaces_view.toggle_active_subbutton("Exterior")
-        self.populate_subview() if not self.is_subview_populated else None
-
-    def populate_subview(self):
-        self.add_column_headers()
-
-        for i, ext_wall_name in enumerate(self.main_app_data.rmds[0].ext_wall_names):
-            self.add_row(i, ext_wall_name)
-
-        self.is_subview_populated = True
+class SurfaceSheetView(SheetSubview):
+    """Sheet of the surfaces of one type. Subclasses define the columns and the surfaces listed."""
 
-    def add_column_headers(self):
-        name_label = ctk.CTkLabel(self, text="Name", font=STANDARD_FONT)
-        name_label.grid(row=0, column=0, padx=(0, 20), pady=5)
-        status_label = ctk.CTkLabel(self, text="Status", font=STANDARD_FONT)
-        status_label.grid(row=0, column=1, padx=(0, 20), pady=5)
-
-    def add_row(self, i, ext_wall_name):
-        surface_label = ctk.CTkLabel(self, text=f"{ext_wall_name}")
-        surface_label.grid(row=(i + 1), column=0, padx=(0, 20), pady=(0, 20), sticky=W)
-        status_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.StatusDescriptions.get_list(),
-            state=READONLY,
-        )
-        status_combo._entry.configure(justify=LEFT)
-        status_combo.grid(row=(i + 1), column=1, padx=(0, 20), pady=(0, 20))
+    subview_name = None
 
-
-class InteriorSurfaceView(CTkXYFrame):
     def __init__(self, subview_frame):
-        super().__init__(subview_frame)
         self.surfaces_view = subview_frame.master
         self.main_app_data = self.surfaces_view.window.main_app.data
-        self.is_subview_populated = False
+        super().__init__(subview_frame, self.get_columns())
 
     def __repr__(self):
-        return "InteriorSurfaceView"
+        return self.__class__.__name__
 
     def open_subview(self):
-        self.surfaces_view.toggle_active_subbutton("Interior")
+        self.surfaces_view.toggle_active_subbutton(self.subview_name)
         self.populate_subview() if not self.is_subview_populated else None
 
-    def populate_subview(self):
-        self.add_column_headers()
-
-        for i, int_wall_name in enumerate(self.main_app_data.rmds[0].int_wall_names):
-            self.add_row(i, int_wall_name)
-
-        self.is_subview_populated = True
-
-    def add_column_headers(self):
-        name_label = ctk.CTkLabel(self, text="Name", font=STANDARD_FONT)
-        name_label.grid(row=0, column=0, padx=(0, 20), pady=5)
-        status_label = ctk.CTkLabel(self, text="Status", font=STANDARD_FONT)
-        status_label.grid(row=0, column=1, padx=(0, 20), pady=5)
-
-    def add_row(self, i, int_wall_name):
-        surface_label = ctk.CTkLabel(self, text=f"{int_wall_name}")
-        surface_label.grid(row=(i + 1), column=0, padx=(0, 20), pady=(0, 20), sticky=W)
-        status_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.StatusDescriptions.get_list(),
-            state=READONLY,
-        )
-        status_combo._entry.configure(justify=LEFT)
-        status_combo.grid(row=(i + 1), column=1, padx=(0, 20), pady=(0, 20))
+    def get_columns(self) -> list:
+        return [
+            SheetColumn("Name", readonly=True),
+            SheetColumn(
+                "Status", options=self.main_app_data.StatusDescriptions.get_list()
+            ),
+        ]
 
+    def get_surface_names(self) -> list:
+        return []
 
-class UndergroundSurfaceView(CTkXYFrame):
-    def __init__(self, subview_frame):
-        super().__init__(subview_frame)
-        self.surfaces_view = subview_frame.master
-        self.main_app_data = self.surfaces_view.window.main_app.data
-        self.is_subview_populated = False
-
-    def __repr__(self):
-        return "UndergroundSurfaceView"
-
-    def open_subview(self):
-        self.surfaces_view.toggle_active_subbutton("Underground")
-        self.populate_subview() if not self.is_subview_populated else None
+    def get_rows(self):
+        for surface_name in self.get_surface_names():
+            yield surface_name, None, self.get_default_values(surface_name)
 
-    def populate_subview(self):
-        self.add_column_headers()
 
-        for i, undg_wall_name in enumerate(self.main_app_data.rmds[0].undg_wall_names):
-            self.add_row(i, undg_wall_name)
+class ExteriorSurfaceView(SurfaceSheetView):
+    subview_name = "Exterior"
 
-        self.is_subview_populated = True
+    def get_surface_names(self):
+        return self.main_app_data.rmds[0].ext_wall_names
 
-    def add_column_headers(self):
-        name_label = ctk.CTkLabel(self, text="Name", font=STANDARD_FONT)
-        name_label.grid(row=0, column=0, padx=(0, 20), pady=5)
-        status_label = ctk.CTkLabel(self, text="Status", font=STANDARD_FONT)
-        status_label.grid(row=0, column=1, padx=(0, 20), pady=5)
 
-    def add_row(self, i, undg_wall_name):
-        surface_label = ctk.CTkLabel(self, text=f"{undg_wall_name}")
-        surface_label.grid(row=(i + 1), column=0, padx=(0, 20), pady=(0, 20), sticky=W)
-        status_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.StatusDescriptions.get_list(),
-            state=READONLY,
-        )
-        status_combo._entry.configure(justify=LEFT)
-        status_combo.grid(row=(i + 1), column=1, padx=(0, 20), pady=(0, 20))
+class InteriorSurfaceView(SurfaceSheetView):
+    subview_name = "Interior"
 
+    def get_surface_names(self):
+        return self.main_app_data.rmds[0].int_wall_names
 
-class WindowSurfaceView(CTkXYFrame):
-    def __init__(self, subview_frame):
-        super().__init__(subview_frame)
-        self.surfaces_view = subview_frame.master
-        self.main_app_data = self.surfaces_view.window.main_app.data
-        self.is_subview_populated = False
 
-    def __repr__(self):
-        return "WindowSurfaceView"
+class UndergroundSurfaceView(SurfaceSheetView):
+    subview_name = "Underground"
 
-    def open_subview(self):
-        self.surfaces_view.toggle_active_subbutton("Windows")
-        self.populate_subview() if not self.is_subview_populated else None
+    def get_surface_names(self):
+        return self.main_app_data.rmds[0].undg_wall_names
 
-    def populate_subview(self):
-        vertical_window_names = self.get_vertical_windows_subset()
 
-        self.add_column_headers()
+class WindowSurfaceView(SurfaceSheetView):
+    subview_name = "Windows"
 
-        for i, window_name in enumerate(vertical_window_names):
-            self.add_row(i, window_name)
+    def get_columns(self):
+        return super().get_columns() + [
+            SheetColumn(
+                "Classification",
+                options=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
+            ),
+            SheetColumn(
+                "Framing Type",
+                options=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
+            ),
+            SheetColumn("Operable?", default=False, checkbox=True),
+            SheetColumn("Open Sensor?", default=False, checkbox=True),
+            SheetColumn("Manual Interior Shades?", default=False, checkbox=True),
+        ]
 
-        self.is_subview_populated = True
+    def get_surface_names(self):
+        return self.get_vertical_windows_subset()
 
     def get_vertical_windows_subset(self):
         vertical_window_names = []
@@ -294,83 +229,27 @@ class WindowSurfaceView(CTkXYFrame):
                 vertical_window_names.append(window_name)
         return vertical_window_names
 
-    def add_column_headers(self):
-        name_label = ctk.CTkLabel(self, text="Name", font=STANDARD_FONT)
-        name_label.grid(row=0, column=0, padx=(0, 20), pady=5)
-        status_label = ctk.CTkLabel(self, text="Status", font=STANDARD_FONT)
-        status_label.grid(row=0, column=1, padx=(0, 20), pady=5)
-        classification_label = ctk.CTkLabel(
-            self, text="Classification", font=STANDARD_FONT
-        )
-        classification_label.grid(row=0, column=2, padx=(0, 20), pady=5)
-        framing_type_label = ctk.CTkLabel(self, text="Framing Type", font=STANDARD_FONT)
-        framing_type_label.grid(row=0, column=3, padx=(0, 20), pady=5)
-        operable_label = ctk.CTkLabel(self, text="Operable?", font=STANDARD_FONT)
-        operable_label.grid(row=0, column=4, padx=(0, 20), pady=5)
-        open_sensor_label = ctk.CTkLabel(self, text="Open Sensor?", font=STANDARD_FONT)
-        open_sensor_label.grid(row=0, column=5, padx=(0, 20), pady=5)
-        manual_interior_shades_label = ctk.CTkLabel(
-            self, text="Manual Interior Shades?", font=STANDARD_FONT
-        )
-        manual_interior_shades_label.grid(row=0, column=6, padx=(0, 20), pady=5)
-
-    def add_row(self, i, window_name):
-        surface_label = ctk.CTkLabel(self, text=f"{window_name}")
-        surface_label.grid(row=(i + 1), column=0, padx=(0, 20), pady=(0, 20), sticky=W)
-        status_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.StatusDescriptions.get_list(),
-            state=READONLY,
-        )
-        status_combo._entry.configure(justify=LEFT)
-        status_combo.grid(row=(i + 1), column=1, padx=(0, 20), pady=(0, 20))
-        classification_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
-            state=READONLY,
-        )
-        classification_combo._entry.configure(justify=LEFT)
-        classification_combo.grid(row=(i + 1), column=2, padx=(0, 20), pady=(0, 20))
-        framing_type_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
-            state=READONLY,
-        )
-        framing_type_combo._entry.configure(justify=LEFT)
-        framing_type_combo.grid(row=(i + 1), column=3, padx=(0, 20), pady=(0, 20))
-        operable_checkbox = ctk.CTkCheckBox(self, text="", width=30)
-        operable_checkbox.grid(row=(i + 1), column=4, padx=(0, 20), pady=(0, 20))
-        open_sensor_checkbox = ctk.CTkCheckBox(self, text="", width=30)
-        open_sensor_checkbox.grid(row=(i + 1), column=5, padx=(0, 20), pady=(0, 20))
-        manual_interior_shades_checkbox = ctk.CTkCheckBox(self, text="", width=30)
-        manual_interior_shades_checkbox.grid(
-            row=(i + 1), column=6, padx=(0, 20), pady=(0, 20)
-        )
-
-
-class SkylightSurfaceView(CTkXYFrame):
-    def __init__(self, subview_frame):
-        super().__init__(subview_frame)
-        self.surfaces_view = subview_frame.master
-        self.main_app_data = self.surfaces_view.window.main_app.data
-        self.is_subview_populated = False
-
-    def __repr__(self):
-        return "SkylightSurfaceView"
 
-    def open_subview(self):
-        self.surfaces_view.toggle_active_subbutton("Skylights")
-        self.populate_subview() if not self.is_subview_populated else None
+class SkylightSurfaceView(SurfaceSheetView):
+    subview_name = "Skylights"
 
-    def populate_subview(self):
-        skylight_names = self.get_skylights_subset()
+    def get_columns(self):
+        return super().get_columns() + [
+            SheetColumn(
+                "Classification",
+                options=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
+            ),
+            SheetColumn(
+                "Framing Type",
+                options=self.main_app_data.SubsurfaceFrameDescriptions2019ASHRAE901.get_list(),
+            ),
+            SheetColumn("Operable?", default=False, checkbox=True),
+            SheetColumn("Open Sensor?", default=False, checkbox=True),
+            SheetColumn("Manual Interior Shades?", default=False, checkbox=True),
+        ]
 
-        self.add_column_headers()
-
-        for i, skylight_name in enumerate(skylight_names):
-            self.add_row(i, skylight_name)
-
-        self.is_subview_populated = True
+    def get_surface_names(self):
+        return self.get_skylights_subset()
 
     def get_skylights_subset(self):
         skylight_names = []
@@ -383,106 +262,17 @@ class SkylightSurfaceView(CTkXYFrame):
                 skylight_names.append(window_name)
         return skylight_names
 
-    def add_column_headers(self):
-        name_label = ctk.CTkLabel(self, text="Name", font=STANDARD_FONT)
-        name_label.grid(row=0, column=0, padx=(0, 20), pady=5)
-        status_label = ctk.CTkLabel(self, text="Status", font=STANDARD_FONT)
-        status_label.grid(row=0, column=1, padx=(0, 20), pady=5)
-        classification_label = ctk.CTkLabel(
-            self, text="Classification", font=STANDARD_FONT
-        )
-        classification_label.grid(row=0, column=2, padx=(0, 20), pady=5)
-        framing_type_label = ctk.CTkLabel(self, text="Framing Type", font=STANDARD_FONT)
-        framing_type_label.grid(row=0, column=3, padx=(0, 20), pady=5)
-        operable_label = ctk.CTkLabel(self, text="Operable?", font=STANDARD_FONT)
-        operable_label.grid(row=0, column=4, padx=(0, 20), pady=5)
-        open_sensor_label = ctk.CTkLabel(self, text="Open Sensor?", font=STANDARD_FONT)
-        open_sensor_label.grid(row=0, column=5, padx=(0, 20), pady=5)
-        manual_interior_shades_label = ctk.CTkLabel(
-            self, text="Manual Interior Shades?", font=STANDARD_FONT
-        )
-        manual_interior_shades_label.grid(row=0, column=6, padx=(0, 20), pady=5)
-
-    def add_row(self, i, skylight_name):
-        surface_label = ctk.CTkLabel(self, text=f"{skylight_name}")
-        surface_label.grid(row=(i + 1), column=0, padx=(0, 20), pady=(0, 20), sticky=W)
-        status_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.StatusDescriptions.get_list(),
-            state=READONLY,
-        )
-        status_combo._entry.configure(justify=LEFT)
-        status_combo.grid(row=(i + 1), column=1, padx=(0, 20), pady=(0, 20))
-        classification_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
-            state=READONLY,
-        )
-        classification_combo._entry.configure(justify=LEFT)
-        classification_combo.grid(row=(i + 1), column=2, padx=(0, 20), pady=(0, 20))
-        framing_type_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.SubsurfaceFrameDescriptions2019ASHRAE901.get_list(),
-            state=READONLY,
-        )
-        framing_type_combo._entry.configure(justify=LEFT)
-        framing_type_combo.grid(row=(i + 1), column=3, padx=(0, 20), pady=(0, 20))
-        operable_checkbox = ctk.CTkCheckBox(self, text="", width=30)
-        operable_checkbox.grid(row=(i + 1), column=4, padx=(0, 20), pady=(0, 20))
-        open_sensor_checkbox = ctk.CTkCheckBox(self, text="", width=30)
-        open_sensor_checkbox.grid(row=(i + 1), column=5, padx=(0, 20), pady=(0, 20))
-        manual_interior_shades_checkbox = ctk.CTkCheckBox(self, text="", width=30)
-        manual_interior_shades_checkbox.grid(
-            row=(i + 1), column=6, padx=(0, 20), pady=(0, 20)
-        )
-
-
-class DoorSurfaceView(CTkXYFrame):
-    def __init__(self, subview_frame):
-        super().__init__(subview_frame)
-        self.surfaces_view = subview_frame.master
-        self.main_app_data = self.surfaces_view.window.main_app.data
-        self.is_subview_populated = False
-
-    def __repr__(self):
-        return "DoorSurfaceView"
-
-    def open_subview(self):
-        self.surfaces_view.toggle_active_subbutton("Doors")
-        self.populate_subview() if not self.is_subview_populated else None
 
-    def populate_subview(self):
-        self.add_column_headers()
+class DoorSurfaceView(SurfaceSheetView):
+    subview_name = "Doors"
 
-        for i, door_name in enumerate(self.main_app_data.rmds[0].door_names):
-            self.add_row(i, door_name)
+    def get_columns(self):
+        return super().get_columns() + [
+            SheetColumn(
+                "Classification",
+                options=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
+            ),
+        ]
 
-        self.is_subview_populated = True
-
-    def add_column_headers(self):
-        name_label = ctk.CTkLabel(self, text="Name", font=STANDARD_FONT)
-        name_label.grid(row=0, column=0, padx=(0, 20), pady=5)
-        status_label = ctk.CTkLabel(self, text="Status", font=STANDARD_FONT)
-        status_label.grid(row=0, column=1, padx=(0, 20), pady=5)
-        classification_label = ctk.CTkLabel(
-            self, text="Classification", font=STANDARD_FONT
-        )
-        classification_label.grid(row=0, column=2, padx=(0, 20), pady=5)
-
-    def add_row(self, i, door_name):
-        surface_label = ctk.CTkLabel(self, text=f"{door_name}")
-        surface_label.grid(row=(i + 1), column=0, padx=(0, 20), pady=(0, 20), sticky=W)
-        status_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.StatusDescriptions.get_list(),
-            state=READONLY,
-        )
-        status_combo._entry.configure(justify=LEFT)
-        status_combo.grid(row=(i + 1), column=1, padx=(0, 20), pady=(0, 20))
-        classification_combo = ctk.CTkComboBox(
-            self,
-            values=self.main_app_data.SubsurfaceSubclassificationDescriptions2019ASHRAE901.get_list(),
-            state=READONLY,
-        )
-        classification_combo._entry.configure(justify=LEFT)
-        classification_combo.grid(row=(i + 1), column=2, padx=(0, 20), pady=(0, 20))
+    def get_surface_names(self):
+        return self.main_app_data.rmds[0].door_names
@@ -31,7 +31,10 @@ class TestView(BaseView):
         create_rpd_button = ctk.CTkButton(
             self,
             text="Create JSON",
-            command=self.window.main_app.data.call_write_rpd_json_from_inp,
+            command=lambda: self.window.main_app.run_in_background(
+                self.window.main_app.data.call_write_rpd_json_from_inp,
+                master=self.window,
+            ),
         )
         create_rpd_button.grid(row=1, column=1, padx=10, pady=(20, 10), sticky="ew")
 
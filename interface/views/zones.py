@@ -1,15 +1,12 @@
 import customtkinter as ctk
-import interface.custom_widgets as cw
-from PIL import Image
 
-from interface.ctk_xyframe import CTkXYFrame
 from interface.base_view import BaseView
+from interface.sheet_view import ALL_GROUPS, SheetColumn, SheetSubview
 
 
 STANDARD_FONT = ("Arial", 16, "bold")
 READONLY = "readonly"
 LEFT = "left"
-W = "w"
 PAD20 = (0, 20)
 
 
@@ -69,94 +66,37 @@ class ZonesView(BaseView):
         zones_view.open_view()
 
 
-class ZonesSubview(CTkXYFrame):
+class ZonesSubview(SheetSubview):
     def __init__(self, view_frame):
-        super().__init__(view_frame)
         self.zones_view = view_frame.master
         self.main_app_data = self.zones_view.window.main_app.data
-        self.is_view_populated = False
-        self.child_space_window = None
-        self.zones_by_floor = {}
-        self.floor_comboboxes = {}
-        self.zone_comboboxes = {}
-        self.zone_widgets = {}
-
-        self.get_zones_by_floors()
-
-    def __repr__(self):
-        return "ZonesSubview"
-
-    def open_view(self):
-        self.populate_subview() if not self.is_view_populated else None
-
-    def populate_subview(self):
-        self.add_column_headers()
-
-        main_row = 0
-        for floor, zones in self.zones_by_floor.items():
-            self.add_main_row(main_row, floor)
-            main_row += 1
-            for zone in zones:
-                self.add_row(main_row, zone)
-                main_row += 1
-
-        self.is_view_populated = True
-
-    def add_column_headers(self):
-        collapse_expand_label = ctk.CTkLabel(self, text="", font=STANDARD_FONT)
-        collapse_expand_label.grid(row=0, column=0, padx=PAD20, pady=5)
-
-        zone_floor_label = ctk.CTkLabel(self, text="Floor/Zone", font=STANDARD_FONT)
-        zone_floor_label.grid(row=0, column=1, padx=PAD20, pady=5)
-        building_area_label = ctk.CTkLabel(
-            self, text="Building Area", font=STANDARD_FONT
-        )
-        building_area_label.grid(row=0, column=2, padx=PAD20, pady=5)
-        aggregated_zone_quantity_label = ctk.CTkLabel(
-            self, text="Aggregated Zone Qty", font=STANDARD_FONT
+        super().__init__(
+            view_frame,
+            [
+                SheetColumn("Zone", readonly=True),
+                SheetColumn("Floor", readonly=True),
+                # TODO: Placeholder for Building Areas tab data
+                SheetColumn(
+                    "Building Area",
+                    default="Building Area 1",
+                    options=["Building Area 1"],
+                ),
+                SheetColumn("Aggregated Zone Qty", default=1),
+                SheetColumn(
+                    "Measured Infiltration Rate?", default=False, checkbox=True
+                ),
+                SheetColumn("Child Spaces", default="+", readonly=True),
+            ],
+            group_label="Floor",
         )
-        aggregated_zone_quantity_label.grid(row=0, column=3, padx=PAD20, pady=5)
-        measured_infiltration_rate_label = ctk.CTkLabel(
-            self, text="Measured Infiltration Rate?", font=STANDARD_FONT
-        )
-        measured_infiltration_rate_label.grid(row=0, column=4, padx=PAD20, pady=5)
-        child_spaces_label = ctk.CTkLabel(self, text="Child Spaces", font=STANDARD_FONT)
-        child_spaces_label.grid(row=0, column=5, padx=PAD20, pady=5)
-
-    def add_main_row(self, i, floor_name):
-        # Frame spanning all columns with a different background color
-        main_row_frame = ctk.CTkFrame(self, fg_color="gray30")
-        main_row_frame.grid(row=(i + 1), column=0, columnspan=6, sticky="ew")
-
-        collapse_button = ctk.CTkButton(
-            self,
-            text="−",  # Default to expanded state
-            width=30,
-            height=30,
-            corner_radius=10,
-            command=lambda: self.toggle_zone_visibility(floor_name, collapse_button),
-            bg_color="gray30",  # Same color as the frame
-        )
-        collapse_button.grid(row=(i + 1), column=0, padx=(5, 0))
-
-        # Ensure the frame stretches across all columns
-        for col in range(5):
-            main_row_frame.grid_columnconfigure(col, weight=1)
+        self.child_space_window = None
 
-        floor_label = ctk.CTkLabel(
-            self,
-            text=f"{floor_name}",
-            width=135,
-            anchor=W,
-            font=("Arial", 14, "bold"),  # Larger, bold font
-            text_color="white",
-            bg_color="gray30",  # Same color as the frame
+        # Building Area combobox that assigns all zones of the selected floor
+        ctk.CTkLabel(self.filter_frame, text="Building Area of Floor:").grid(
+            row=0, column=3, padx=(0, 5)
         )
-        floor_label.grid(row=(i + 1), column=1, padx=20, pady=10, sticky=W)
-
-        # Place the Building Area ComboBox in `self` (not inside `main_row_frame`) to align properly
-        building_area_combo = ctk.CTkComboBox(
-            self,
+        self.floor_building_area_combo = ctk.CTkComboBox(
+            self.filter_frame,
             # TODO: Placeholder for Building Areas tab data
             values=["Building Area 1"],
             state=READONLY,
@@ -165,103 +105,46 @@ class ZonesSubview(CTkXYFrame):
             button_color="#3A7EBF",
             dropdown_fg_color="#5B9BD5",
             dropdown_hover_color="lightblue",
-            bg_color="gray30",  # Same color as the frame
-            command=lambda value, floor=floor_name: self.set_default_value_by_floor(
-                floor, value
+            command=lambda value: self.set_default_value_by_floor(
+                self.group_combo.get(), value
             ),
         )
-        building_area_combo.set("Building Area 1")
-        building_area_combo._entry.configure(justify=LEFT)
-        building_area_combo.grid(row=(i + 1), column=2, padx=PAD20, pady=10)
-
-        self.floor_comboboxes[floor_name] = building_area_combo
+        self.floor_building_area_combo.set("Building Area 1")
+        self.floor_building_area_combo._entry.configure(justify=LEFT)
+        self.floor_building_area_combo.grid(row=0, column=4)
 
-        # Add empty labels in `main_row_frame` for spacing
-        ctk.CTkLabel(main_row_frame, text="").grid(row=0, column=3, padx=PAD20, pady=10)
-        ctk.CTkLabel(main_row_frame, text="").grid(row=0, column=4, padx=PAD20, pady=10)
+        self.sheet.bind("<<SheetSelect>>", self.on_cell_selected)
 
-    def add_row(self, i, zone_name):
-        floor_label = ctk.CTkLabel(self, text=f"{zone_name}")
-        floor_label.grid(row=(i + 1), column=1, padx=20, pady=PAD20, sticky=W)
-        building_area_combo = ctk.CTkComboBox(
-            self,
-            # TODO: Placeholder for Building Areas tab data
-            values=["Building Area 1"],
-            state=READONLY,
-        )
-        building_area_combo.set("Building Area 1")
-        building_area_combo._entry.configure(justify=LEFT)
-        building_area_combo.grid(row=(i + 1), column=2, padx=PAD20, pady=PAD20)
-
-        self.zone_comboboxes[zone_name] = building_area_combo
-        # TODO: Apply numerical entry validation
-        aggregated_zone_qty_spinbox = cw.IntSpinbox(self, width=125, default_value=1)
-        aggregated_zone_qty_spinbox.grid(
-            row=(i + 1), column=3, padx=PAD20, pady=PAD20, sticky="nsew"
-        )
-        measured_infiltration_rate_checkbox = ctk.CTkCheckBox(self, text="", width=30)
-        measured_infiltration_rate_checkbox.grid(
-            row=(i + 1), column=4, padx=PAD20, pady=PAD20
-        )
-        image = ctk.CTkImage(
-            light_image=Image.open("interface/static/white_plus.png"),
-            dark_image=None,
-            size=(20, 20),
-        )
-        add_child_space_button = ctk.CTkButton(
-            self,
-            text="",
-            image=image,
-            width=30,
-            height=30,
-            corner_radius=10,
-            command=self.open_child_space_window,
-        )
-        add_child_space_button.grid(row=(i + 1), column=5, padx=PAD20, pady=PAD20)
+    def __repr__(self):
+        return "ZonesSubview"
 
-        self.zone_widgets[zone_name] = [
-            floor_label,
-            building_area_combo,
-            aggregated_zone_qty_spinbox,
-            measured_infiltration_rate_checkbox,
-            add_child_space_button,
-        ]
+    def open_view(self):
+        self.populate_subview() if not self.is_subview_populated else None
 
-    def get_zones_by_floors(self):
-        for zone_name in self.main_app_data.rmds[0].zone_names:
-            zone_obj = self.main_app_data.rmds[0].get_obj(zone_name)
-            if self.zones_by_floor.get(zone_obj.floor_name):
-                self.zones_by_floor[zone_obj.floor_name].append(zone_name)
-            else:
-                self.zones_by_floor[zone_obj.floor_name] = [zone_name]
+    def get_rows(self):
+        rmd = self.main_app_data.rmds[0]
+        for zone_name in rmd.zone_names:
+            floor_name = rmd.get_obj(zone_name).floor_name
+            values = self.get_default_values(zone_name)
+            values[1] = floor_name
+            yield zone_name, floor_name, values
 
     def set_default_value_by_floor(self, floor_name, selected_value):
-        """Update all zones under a floor with the selected value from the floor's combobox"""
-        for zone_name in self.main_app_data.rmds[0].zone_names:
-            zone_obj = self.main_app_data.rmds[0].get_obj(zone_name)
-            if zone_obj.floor_name == floor_name:
-                if zone_name in self.zone_comboboxes:
-                    self.zone_comboboxes[zone_name].set(selected_value)
-
-    def toggle_zone_visibility(self, floor_name, button):
-        """Toggles visibility of all zone rows under a given floor"""
-        if floor_name in self.zones_by_floor:
-            first_zone = self.zones_by_floor[floor_name][0]
-            is_visible = self.zone_widgets[first_zone][
-                0
-            ].winfo_ismapped()  # Check if first zone widget is visible
-            new_state = "hide" if is_visible else "show"
-
-            for zone_name in self.zones_by_floor[floor_name]:
-                if zone_name in self.zone_widgets:
-                    for widget in self.zone_widgets[zone_name]:
-                        if new_state == "hide":
-                            widget.grid_remove()
-                        else:
-                            widget.grid()
-
-            # Change button text accordingly
-            button.configure(text="+" if new_state == "hide" else "−")
+        """Update all zones under a floor, or all zones when every floor is shown, with the selected value from the
+        floor's combobox"""
+        rows = (
+            range(len(self.row_names))
+            if floor_name == ALL_GROUPS
+            else self.rows_by_group.get(floor_name, [])
+        )
+        for row in rows:
+            self.sheet.set_cell_data(row, 2, selected_value)
+        self.sheet.redraw()
+
+    def on_cell_selected(self, event):
+        selected = self.sheet.get_currently_selected()
+        if selected and selected.type_ == "cells" and selected.column == 5:
+            self.open_child_space_window()
 
     def open_child_space_window(self):
         if (
@@ -0,0 +1,43 @@
+import argparse
+
+from rpd_generator.utilities import generation_service
+from rpd_generator.utilities import validate_configuration
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="rpd_generator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a local service that generates and validates RPDs on warm worker processes.",
+    )
+    serve_parser.add_argument("--host", default=generation_service.DEFAULT_HOST)
+    serve_parser.add_argument(
+        "--port", type=int, default=generation_service.DEFAULT_PORT
+    )
+    serve_parser.add_argument(
+        "--workers", type=int, default=2, help="Number of worker processes."
+    )
+    serve_parser.add_argument(
+        "--max-queued-jobs",
+        type=int,
+        default=64,
+        help="Number of jobs that may wait for a worker before new jobs are rejected.",
+    )
+    serve_parser.add_argument(
+        "--equest-path",
+        default=None,
+        help="Directory to search for the eQUEST installation.",
+    )
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        validate_configuration.find_equest_installation(args.equest_path)
+        generation_service.serve(
+            args.host, args.port, args.workers, args.max_queued_jobs
+        )
+
+
+if __name__ == "__main__":
+    main()
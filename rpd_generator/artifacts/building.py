@@ -1,4 +1,5 @@
 from rpd_generator.bdl_structure.base_definition import BaseDefinition
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 class Building(BaseDefinition):
@@ -7,6 +8,17 @@ class Building(BaseDefinition):
     add/delete Buildings and assign DOE-2 FLOORs (eQUEST Shells) to them through the eQUEST 229RPDGenerator App UI.
     """
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "building_open_schedule",
+            "has_site_shading",
+            "number_of_floors_above_grade",
+            "number_of_floors_below_grade",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
 
@@ -36,20 +48,8 @@ class Building(BaseDefinition):
             "refrigerated_cases": self.refrigerated_cases,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "building_open_schedule",
-            "has_site_shading",
-            "number_of_floors_above_grade",
-            "number_of_floors_below_grade",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.building_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.building_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert building object into the rpd data structure."""
@@ -1,8 +1,22 @@
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
+
+
 class BuildingSegment:
     """
     This class is used to represent the BuildingSegment object in the 229 schema.
     """
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "number_of_floors_above_grade",
+            "number_of_floors_below_grade",
+            "is_all_new",
+            "area_type_vertical_fenestration",
+        ]
+    )
+
     def __init__(self, obj_id, parent_building):
         self.obj_id = obj_id
         self.parent_building = parent_building
@@ -34,20 +48,10 @@ class BuildingSegment:
             "heating_ventilating_air_conditioning_systems": self.hvac_systems,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "number_of_floors_above_grade",
-            "number_of_floors_below_grade",
-            "is_all_new",
-            "area_type_vertical_fenestration",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.building_segment_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(
+            self, self.building_segment_data_structure
+        )
 
     def insert_to_rpd(self):
         """Insert building segment object into the rpd data structure."""
@@ -1,9 +1,13 @@
-import copy
-
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.base_node import Base, BaseNode
 from rpd_generator.bdl_structure.base_definition import BaseDefinition
+from rpd_generator.bdl_structure.bdl_object_registry import BDLObjectRegistry
+from rpd_generator.bdl_structure.bdl_commands.window import Window
+from rpd_generator.bdl_structure.topology_index import TopologyIndex
+from rpd_generator.utilities.profiling import profiler
+from rpd_generator.utilities.projection import expand_projection, includes_output
+from rpd_generator.utilities.progress import NULL_PROGRESS
 
 EnergySourceOptions = SchemaEnums.schema_enums["EnergySourceOptions"]
 EndUseOptions = SchemaEnums.schema_enums["EndUseOptions"]
@@ -31,6 +35,180 @@ fuel_type_map = {
     EnergySourceOptions.ON_SITE_RENEWABLES: EnergySourceOptions.ON_SITE_RENEWABLES,
 }
 
+# End uses in the order they are reported by the simulation. The entry id of an end use result is the first entry id of
+# the result plus the index of the end use.
+OUTPUT_END_USES = [
+    "Lights",
+    "Task Lights",
+    "Misc Equip",
+    "Space Heating",
+    "Space Cooling",
+    "Heat Rejection",
+    "Pumps & Aux",
+    "Ventilation Fans",
+    "Refrigeration Display",
+    "Ht Pump Supplemental Heat",
+    "Domestic Hot Water",
+    "Exterior Usage",
+]
+
+# Meter: (description prefix, energy label, {metric: first entry id}). Fuel Meter outputs are requested per meter.
+METER_OUTPUTS = {
+    "Total Site Energy": (
+        "Total Site Energy (BTU)",
+        None,
+        {"energy": 2001001, "end_use_energy": 2001009},
+    ),
+    "Electricity": (
+        "Elec (all meters)",
+        "Elec Use",
+        {
+            "energy": 2305001,
+            "peak_demand": 2305002,
+            "end_use_energy": 2305006,
+            "end_use_peak": 2305019,
+            "end_use_coincident_peak": 2305186,
+        },
+    ),
+    "Fuel": (
+        "Fuel (all meters)",
+        "Fuel Use",
+        {
+            "energy": 2306001,
+            "peak_demand": 2306002,
+            "end_use_energy": 2306006,
+            "end_use_peak": 2306019,
+            "end_use_coincident_peak": 2306186,
+        },
+    ),
+    "Steam": (
+        "Steam (all meters)",
+        "Energy",
+        {
+            "energy": 2307001,
+            "peak_demand": 2307002,
+            "end_use_energy": 2307006,
+            "end_use_peak": 2307019,
+            "end_use_coincident_peak": 2307186,
+        },
+    ),
+    "Chilled Water": (
+        "Chilled Water (all meters)",
+        "Energy",
+        {
+            "energy": 2308001,
+            "peak_demand": 2308002,
+            "end_use_energy": 2308006,
+            "end_use_peak": 2308019,
+            "end_use_coincident_peak": 2308186,
+        },
+    ),
+    "Fuel Meter": (
+        "Fuel (meter {meter_name})",
+        "Fuel Use",
+        {
+            "energy": 2310003,
+            "peak_demand": 2310004,
+            "end_use_energy": 2310008,
+            "end_use_peak": 2310058,
+        },
+    ),
+}
+
+# Energy sources whose results are reported by a single meter
+ENERGY_SOURCE_METERS = {
+    EnergySourceOptions.ELECTRICITY: "Electricity",
+    EnergySourceOptions.PURCHASED_HOT_WATER: "Steam",
+    EnergySourceOptions.PURCHASED_CHILLED_WATER: "Chilled Water",
+}
+
+# End use result id, end use type, is_regulated, and the simulation end use it is populated from
+END_USE_RESULTS = [
+    ("Interior Lighting", EndUseOptions.INTERIOR_LIGHTING, True, "Lights"),
+    ("Misc Equipment", EndUseOptions.MISC_EQUIPMENT, False, "Misc Equip"),
+    ("Space Heating", EndUseOptions.SPACE_HEATING, True, "Space Heating"),
+    ("Space Cooling", EndUseOptions.SPACE_COOLING, True, "Space Cooling"),
+    ("Heat Rejection", EndUseOptions.HEAT_REJECTION, True, "Heat Rejection"),
+    ("Pumps & Aux", EndUseOptions.PUMPS, True, "Pumps & Aux"),
+    (
+        "Ventilation Fans",
+        EndUseOptions.FANS_INTERIOR_VENTILATION,
+        True,
+        "Ventilation Fans",
+    ),
+    (
+        "Refrigeration Display",
+        EndUseOptions.REFRIGERATION_EQUIPMENT,
+        True,
+        "Refrigeration Display",
+    ),
+    (
+        "Ht Pump Supplemental Heat",
+        EndUseOptions.HEAT_PUMP_SUPPLEMENTAL_HEATING,
+        True,
+        "Ht Pump Supplemental Heat",
+    ),
+    (
+        "Domestic Hot Water",
+        EndUseOptions.SERVICE_WATER_HEATING,
+        True,
+        "Domestic Hot Water",
+    ),
+]
+
+# End use result and the metric it is populated from
+END_USE_RESULT_METRICS = {
+    "site_energy_use": "end_use_energy",
+    "coincident_demand": "end_use_coincident_peak",
+    "non_coincident_demand": "end_use_peak",
+}
+
+
+def get_meter_output_description(meter, metric, end_use=None, meter_name=None) -> str:
+    """
+    Return the description under which a meter output is requested.
+    :param meter: (str) key of METER_OUTPUTS
+    :param metric: (str) one of the metrics of the meter
+    :param end_use: (str) simulation end use, required for the end use metrics
+    :param meter_name: (str) u_name of the meter, required for Fuel Meter outputs
+    """
+    prefix, energy_label, _ = METER_OUTPUTS[meter]
+    prefix = prefix.format(meter_name=meter_name)
+    if metric == "energy":
+        return f"{prefix} - {energy_label}" if energy_label else prefix
+    if metric == "peak_demand":
+        return f"{prefix} - Peak Demand"
+    label = {
+        "end_use_energy": energy_label,
+        "end_use_peak": "Peak",
+        "end_use_coincident_peak": "Coincident Peak",
+    }[metric]
+    return f"{prefix} - {label} - {end_use}" if label else f"{prefix} - {end_use}"
+
+
+def get_meter_output_requests(meter, meter_name=None) -> dict:
+    """
+    Return the output requests of every metric of a meter.
+    :param meter: (str) key of METER_OUTPUTS
+    :param meter_name: (str) u_name of the meter, required for Fuel Meter outputs
+    :return: dictionary of description: (entry id, report key, row key)
+    """
+    report_key = meter_name or ""
+    requests = {}
+    for metric, entry_id in METER_OUTPUTS[meter][2].items():
+        if metric in ("energy", "peak_demand"):
+            requests[get_meter_output_description(meter, metric, None, meter_name)] = (
+                entry_id,
+                report_key,
+                "",
+            )
+            continue
+        for i, end_use in enumerate(OUTPUT_END_USES):
+            requests[
+                get_meter_output_description(meter, metric, end_use, meter_name)
+            ] = (entry_id + i, report_key, "")
+    return requests
+
 
 class RulesetModelDescription(Base):
     """
@@ -89,8 +267,8 @@ class RulesetModelDescription(Base):
         self.doe2_version = None
         self.doe2_data_path = None
 
-        # store BDL objects for the model associated with the RMD
-        self.bdl_obj_instances = {}
+        # store BDL objects for the model associated with the RMD, bucketed by BDL command
+        self.bdl_obj_instances = BDLObjectRegistry()
         # store space names mapped to their zone objects for quick access
         self.space_map = {}
 
@@ -121,6 +299,11 @@ class RulesetModelDescription(Base):
         self.pump_names = []
         self.equip_ctrl_names = []
 
+        # reverse-reference index of the circulation loop topology, built once the inputs are loaded
+        self.topology_index = None
+        # populate step reached by populate_rmd_data, used to catch up deferred objects created after it started
+        self.populate_step = None
+
         self.building_azimuth = None
         # False by default, will set to True if a FIXED-SHADE object is found
         self.has_site_shading = False
@@ -183,39 +366,135 @@ class RulesetModelDescription(Base):
         self.output_instance_building_peak_cooling_load = None
         self.output_instance_annual_end_use_results = []
 
-    def populate_rmd_data(self, testing=False):
+    def populate_rmd_data(
+        self, testing=False, skipped_u_names=None, progress=None, projection=None
+    ):
+        """
+        Populate the data elements and data groups of every BDL object and insert them into the RMD.
+        :param testing: when True, the data groups are not inserted into the RMD
+        :param skipped_u_names: u_names of objects that are neither populated nor inserted, used when only part of the
+            RMD is regenerated
+        :param progress: (ProgressReporter) receives the number of objects populated, and may cancel the generation
+        :param projection: optional names of the parts of the RMD to populate, see projection.expand_projection.
+            Objects of other commands are neither populated nor inserted, and the simulation results of the model are
+            only requested when the projection includes the output data group.
+        """
+        skipped_u_names = skipped_u_names or set()
+        progress = progress or NULL_PROGRESS
+        projected_commands = expand_projection(projection)
+        if projected_commands is not None:
+            skipped_u_names = skipped_u_names | {
+                obj_instance.u_name
+                for command in self.bdl_obj_instances.commands()
+                # Objects that no BDL command produces, such as the default building, are always populated
+                if command is not None and command not in projected_commands
+                for obj_instance in self.bdl_obj_instances.objects(command)
+            }
+        self.topology_index = TopologyIndex(self)
+        with profiler.span("populate_output_data", "WINDOW"):
+            Window.populate_output_data(
+                [
+                    self.bdl_obj_instances[u_name]
+                    for u_name in self.window_names
+                    if u_name not in skipped_u_names
+                ]
+            )
+        self.populate_step = "populate_data_elements"
         sorted_commands = self.sort_commands()
-        for obj_instance in sorted_commands:
+        for i, obj_instance in enumerate(sorted_commands):
+            progress.report("Populating objects", i + 1, len(sorted_commands))
+            if obj_instance.u_name in skipped_u_names:
+                continue
             if isinstance(obj_instance, (BaseNode, BaseDefinition)):
-                obj_instance.populate_data_elements()
+                with profiler.span(
+                    "populate_data_elements",
+                    obj_instance.bdl_command,
+                    obj_instance.u_name,
+                ):
+                    obj_instance.populate_data_elements()
 
         # Repopulate the sorted commands in case objects were added during the populate_data_elements method
+        self.populate_step = "populate_data_group"
         sorted_commands = self.sort_commands()
-        for obj_instance in sorted_commands:
+        for i, obj_instance in enumerate(sorted_commands):
+            progress.report("Populating data groups", i + 1, len(sorted_commands))
+            if obj_instance.u_name in skipped_u_names:
+                continue
             if isinstance(obj_instance, BaseNode):
-                obj_instance.populate_data_group()
+                with profiler.span(
+                    "populate_data_group",
+                    obj_instance.bdl_command,
+                    obj_instance.u_name,
+                ):
+                    obj_instance.populate_data_group()
                 if not testing:
-                    obj_instance.insert_to_rpd(self)
+                    with profiler.span(
+                        "insert_to_rpd",
+                        obj_instance.bdl_command,
+                        obj_instance.u_name,
+                    ):
+                        obj_instance.insert_to_rpd(self)
 
         if not testing:
-            self.bdl_obj_instances["Default Building Segment"].populate_data_group()
-            self.bdl_obj_instances["Default Building Segment"].insert_to_rpd()
-            self.bdl_obj_instances["Default Building"].populate_data_group()
-            self.bdl_obj_instances["Default Building"].insert_to_rpd(self)
-            self.populate_data_elements()
-            self.populate_data_group()
+            progress.report("Populating model results")
+            with profiler.span("populate_data_group", "BUILDING"):
+                self.bdl_obj_instances["Default Building Segment"].populate_data_group()
+                self.bdl_obj_instances["Default Building Segment"].insert_to_rpd()
+                self.bdl_obj_instances["Default Building"].populate_data_group()
+                self.bdl_obj_instances["Default Building"].insert_to_rpd(self)
+            if includes_output(projection):
+                with profiler.span("populate_data_elements", "RMD", self.obj_id):
+                    self.populate_data_elements()
+            with profiler.span("populate_data_group", "RMD", self.obj_id):
+                self.populate_data_group()
+
+    def populate_deferred_obj(self, obj_instance):
+        """
+        Bring a deferred object that is created after populate_rmd_data started up to the populate step it reached.
+        Objects created during populate_data_elements have their data group populated with the other objects.
+        :param obj_instance: object created on first access
+        """
+        if self.populate_step is None:
+            return
+        with profiler.span(
+            "populate_data_elements", obj_instance.bdl_command, obj_instance.u_name
+        ):
+            obj_instance.populate_data_elements()
+        if self.populate_step == "populate_data_group" and isinstance(
+            obj_instance, BaseNode
+        ):
+            with profiler.span(
+                "populate_data_group", obj_instance.bdl_command, obj_instance.u_name
+            ):
+                obj_instance.populate_data_group()
 
     def sort_commands(self):
-        command_tuples = [
-            (obj.bdl_command, obj)
-            for obj in self.bdl_obj_instances.values()
-            if isinstance(obj, (BaseNode, BaseDefinition))
-        ]
         order_map = {cmd: i for i, cmd in enumerate(self.COMMAND_PROCESSING_ORDER)}
-        sorted_tuples = sorted(
-            command_tuples, key=lambda x: order_map.get(x[0], float("inf"))
+        commands = sorted(
+            self.bdl_obj_instances.commands(),
+            key=lambda command: order_map.get(command, float("inf")),
         )
-        return [t[1] for t in sorted_tuples]
+        return [
+            obj
+            for command in commands
+            for obj in self.bdl_obj_instances.objects(command)
+            if isinstance(obj, (BaseNode, BaseDefinition))
+        ]
+
+    def get_topology_index(self):
+        """
+        Return the circulation loop topology index, building it if the RMD has not been populated yet.
+        """
+        if self.topology_index is None:
+            self.topology_index = TopologyIndex(self)
+        return self.topology_index
+
+    def objects(self, command) -> list:
+        """
+        Return the object instances of a BDL command in the order they were added.
+        :param command: str
+        """
+        return self.bdl_obj_instances.objects(command)
 
     def get_obj(self, u_name):
         """
@@ -252,62 +531,6 @@ class RulesetModelDescription(Base):
             "Building Peak Heating Load"
         )
         energy_source_types = set()
-        energy_source_results = {
-            "Consumption": {
-                "site_energy_use": 0,
-                "peak_demand": 0,
-            },
-            "Interior Lighting": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Space Heating": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Heat Pump Supp.": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Space Cooling": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Pumps & Aux": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Heat Rejection": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Ventilation Fans": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Refrigeration Display": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Domestic Hot Water": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-            "Misc Equip": {
-                "site_energy_use": 0,
-                "coincident_demand": 0,
-                "non_coincident_demand": 0,
-            },
-        }
 
         # Populate the set of unique energy sources in the model
         if output_data.get("Elec (all meters) - Elec Use"):
@@ -334,1658 +557,213 @@ class RulesetModelDescription(Base):
 
         # Populate the energy source results for each energy source
         for energy_source in energy_source_types:
-            source_results = copy.deepcopy(energy_source_results)
-            if energy_source == EnergySourceOptions.ELECTRICITY:
-                source_results["Consumption"]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use"
-                )
-                source_results["Consumption"]["peak_demand"] = output_data.get(
-                    "Elec (all meters) - Peak Demand"
-                )
-
-                source_results["Interior Lighting"]["site_energy_use"] = (
-                    output_data.get("Elec (all meters) - Elec Use - Lights")
-                )
-                source_results["Interior Lighting"]["coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Coincident Peak - Lights")
-                )
-                source_results["Interior Lighting"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Lights")
-                )
-
-                source_results["Misc Equip"]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use - Misc Equip"
-                )
-                source_results["Misc Equip"]["coincident_demand"] = output_data.get(
-                    "Elec (all meters) - Coincident Peak - Misc Equip"
-                )
-                source_results["Misc Equip"]["non_coincident_demand"] = output_data.get(
-                    "Elec (all meters) - Peak - Misc Equip"
-                )
-
-                source_results["Space Heating"]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use - Space Heating"
-                )
-                source_results["Space Heating"]["coincident_demand"] = output_data.get(
-                    "Elec (all meters) - Coincident Peak - Space Heating"
-                )
-                source_results["Space Heating"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Space Heating")
-                )
-
-                source_results["Space Cooling"]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use - Space Cooling"
-                )
-                source_results["Space Cooling"]["coincident_demand"] = output_data.get(
-                    "Elec (all meters) - Coincident Peak - Space Cooling"
-                )
-                source_results["Space Cooling"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Space Cooling")
-                )
+            source_results = self.get_energy_source_results(energy_source, output_data)
+            self.output_instance_annual_source_results.append(
+                {
+                    # soure results data elements
+                    "id": energy_source,
+                    "energy_source": fuel_type_map.get(energy_source),
+                    "annual_consumption": source_results["Consumption"][
+                        "site_energy_use"
+                    ],
+                    "annual_demand": source_results["Consumption"]["peak_demand"],
+                    # "annual_cost": None,
+                }
+            )
 
-                source_results["Heat Rejection"]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use - Heat Rejection"
-                )
-                source_results["Heat Rejection"]["coincident_demand"] = output_data.get(
-                    "Elec (all meters) - Coincident Peak - Heat Rejection"
-                )
-                source_results["Heat Rejection"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Heat Rejection")
-                )
+            self.populate_energy_source_end_use_results(source_results, energy_source)
 
-                source_results["Pumps & Aux"]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use - Pumps & Aux"
-                )
-                source_results["Pumps & Aux"]["coincident_demand"] = output_data.get(
-                    "Elec (all meters) - Coincident Peak - Pumps & Aux"
-                )
-                source_results["Pumps & Aux"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Pumps & Aux")
-                )
+    def get_energy_source_results(self, energy_source, output_data) -> dict:
+        """
+        Collect the annual consumption and demand of an energy source, in total and for each end use.
+        :param energy_source: (str) energy source of the results
+        :param output_data: (dict) simulation outputs requested by get_output_requests
+        :return: dictionary of "Consumption" or end use id: dictionary of result: value
+        """
+        source_results = {"Consumption": {"site_energy_use": 0, "peak_demand": 0}}
+        for end_use_id, _, _, _ in END_USE_RESULTS:
+            source_results[end_use_id] = {
+                "site_energy_use": 0,
+                "coincident_demand": 0,
+                "non_coincident_demand": 0,
+            }
 
-                source_results["Ventilation Fans"]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use - Ventilation Fans"
-                )
-                source_results["Ventilation Fans"]["coincident_demand"] = (
-                    output_data.get(
-                        "Elec (all meters) - Coincident Peak - Ventilation Fans"
+        if energy_source in ENERGY_SOURCE_METERS:
+            meter = ENERGY_SOURCE_METERS[energy_source]
+            source_results["Consumption"]["site_energy_use"] = output_data.get(
+                get_meter_output_description(meter, "energy")
+            )
+            source_results["Consumption"]["peak_demand"] = output_data.get(
+                get_meter_output_description(meter, "peak_demand")
+            )
+            for end_use_id, _, _, output_end_use in END_USE_RESULTS:
+                for result, metric in END_USE_RESULT_METRICS.items():
+                    source_results[end_use_id][result] = output_data.get(
+                        get_meter_output_description(meter, metric, output_end_use)
                     )
-                )
-                source_results["Ventilation Fans"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Ventilation Fans")
-                )
 
-                source_results["Refrigeration Display"]["site_energy_use"] = (
-                    output_data.get(
-                        "Elec (all meters) - Elec Use - Refrigeration Display"
-                    )
-                )
-                source_results["Refrigeration Display"]["coincident_demand"] = (
-                    output_data.get(
-                        "Elec (all meters) - Coincident Peak - Refrigeration Display"
-                    )
-                )
-                source_results["Refrigeration Display"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Refrigeration Display")
+        elif energy_source == EnergySourceOptions.ON_SITE_RENEWABLES:
+            source_results["Consumption"]["site_energy_use"] = sum(
+                output_data.get(f"Elec (meter {generator_name}) - Elec Use")
+                for generator_name in self.elec_generator_names
+                if self.bdl_obj_instances.get(generator_name).get_inp(
+                    BDL_ElecGeneratorKeywords.TYPE
                 )
+                == BDL_ElecGeneratorTypes.PV_ARRAY
+            )
+            if len(self.elec_generator_names) == 1:
+                source_results["Consumption"]["peak_demand"] = output_data.get(
+                    f"Elec (meter {self.elec_generator_names[0]}) - Peak Demand"
+                )
+
+        else:
+            # Sum results from fuel meters that have the same type
+            for fuel_meter_name in self.fuel_meter_names:
+                fuel_meter = self.bdl_obj_instances.get(fuel_meter_name)
+                if not (
+                    fuel_meter
+                    and fuel_meter.get_inp(BDL_FuelMeterKeywords.TYPE) == energy_source
+                ):
+                    continue
+                source_results["Consumption"]["site_energy_use"] += output_data.get(
+                    get_meter_output_description(
+                        "Fuel Meter", "energy", meter_name=fuel_meter_name
+                    )
+                )
+                for end_use_id, _, _, output_end_use in END_USE_RESULTS:
+                    for result, metric in [
+                        ("site_energy_use", "end_use_energy"),
+                        ("non_coincident_demand", "end_use_peak"),
+                    ]:
+                        source_results[end_use_id][result] += output_data.get(
+                            get_meter_output_description(
+                                "Fuel Meter", metric, output_end_use, fuel_meter_name
+                            )
+                        )
 
-                source_results["Heat Pump Supp."]["site_energy_use"] = output_data.get(
-                    "Elec (all meters) - Elec Use - Ht Pump Supplemental Heat"
-                )
-                source_results["Heat Pump Supp."]["coincident_demand"] = (
-                    output_data.get(
-                        "Elec (all meters) - Coincident Peak - Ht Pump Supplemental Heat"
-                    )
+            # Coincident demand is only reported for all fuel meters together
+            if len(self.fuel_meter_names) == 1:
+                source_results["Consumption"]["peak_demand"] = output_data.get(
+                    get_meter_output_description("Fuel", "peak_demand")
                 )
-                source_results["Heat Pump Supp."]["non_coincident_demand"] = (
-                    output_data.get(
-                        "Elec (all meters) - Peak - Ht Pump Supplemental Heat"
+                for end_use_id, _, _, output_end_use in END_USE_RESULTS:
+                    source_results[end_use_id]["coincident_demand"] += output_data.get(
+                        get_meter_output_description(
+                            "Fuel", "end_use_coincident_peak", output_end_use
+                        )
                     )
-                )
 
-                source_results["Domestic Hot Water"]["site_energy_use"] = (
-                    output_data.get("Elec (all meters) - Elec Use - Domestic Hot Water")
-                )
-                source_results["Domestic Hot Water"]["coincident_demand"] = (
-                    output_data.get(
-                        "Elec (all meters) - Coincident Peak - Domestic Hot Water"
-                    )
-                )
-                source_results["Domestic Hot Water"]["non_coincident_demand"] = (
-                    output_data.get("Elec (all meters) - Peak - Domestic Hot Water")
-                )
+        return source_results
 
-            elif energy_source == EnergySourceOptions.PURCHASED_HOT_WATER:
-                source_results["Consumption"]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy"
-                )
-                source_results["Consumption"]["peak_demand"] = output_data.get(
-                    "Steam (all meters) - Peak Demand"
-                )
+    def get_output_requests(self):
+        requests = {
+            "Unmet Cooling Load Hours": (
+                2001022,
+                "",
+                "",
+            ),
+            "Unmet Heating Load Hours": (
+                2001023,
+                "",
+                "",
+            ),
+            "Building Peak Cooling Load": (
+                1003003,
+                "",
+                "",
+            ),
+            "Building Peak Heating Load": (
+                1003005,
+                "",
+                "",
+            ),
+        }
+        for meter in [
+            "Total Site Energy",
+            "Electricity",
+            "Fuel",
+            "Steam",
+            "Chilled Water",
+        ]:
+            requests.update(get_meter_output_requests(meter))
 
-                source_results["Interior Lighting"]["site_energy_use"] = (
-                    output_data.get("Steam (all meters) - Energy - Lights")
-                )
-                source_results["Interior Lighting"]["coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Coincident Peak - Lights")
-                )
-                source_results["Interior Lighting"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Lights")
-                )
+        string_requests = {}
+        for fuel_meter_name in self.fuel_meter_names:
+            string_requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use Units"] = (
+                2310001,
+                fuel_meter_name,
+                "",
+            )
+            string_requests[f"Fuel (meter {fuel_meter_name}) - Peak Demand Units"] = (
+                2310002,
+                fuel_meter_name,
+                "",
+            )
+            requests.update(get_meter_output_requests("Fuel Meter", fuel_meter_name))
 
-                source_results["Misc Equip"]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy - Misc Equip"
-                )
-                source_results["Misc Equip"]["coincident_demand"] = output_data.get(
-                    "Steam (all meters) - Coincident Peak - Misc Equip"
+        for elec_generator_name in self.elec_generator_names:
+            elec_generator = self.bdl_obj_instances[elec_generator_name]
+            if (
+                elec_generator
+                and elec_generator.get_inp(BDL_ElecGeneratorKeywords.TYPE)
+                == BDL_ElecGeneratorTypes.PV_ARRAY
+            ):
+                requests[f"PV Array {elec_generator_name} - Energy"] = (
+                    2303259,
+                    elec_generator_name,
+                    "",
                 )
-                source_results["Misc Equip"]["non_coincident_demand"] = output_data.get(
-                    "Steam (all meters) - Peak - Misc Equip"
+                requests[f"PV Array {elec_generator_name} - Peak Demand"] = (
+                    2303260,
+                    elec_generator_name,
+                    "",
                 )
 
-                source_results["Space Heating"]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy - Space Heating"
-                )
-                source_results["Space Heating"]["coincident_demand"] = output_data.get(
-                    "Steam (all meters) - Coincident Peak - Space Heating"
-                )
-                source_results["Space Heating"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Space Heating")
-                )
+        for utility_rate_name in self.utility_rate_names:
+            # TODO diagnose why Utility Rate output requests are not being fulfilled
+            pass
 
-                source_results["Space Cooling"]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy - Space Cooling"
-                )
-                source_results["Space Cooling"]["coincident_demand"] = output_data.get(
-                    "Steam (all meters) - Coincident Peak - Space Cooling"
-                )
-                source_results["Space Cooling"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Space Cooling")
-                )
+        return requests, string_requests
 
-                source_results["Heat Rejection"]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy - Heat Rejection"
-                )
-                source_results["Heat Rejection"]["coincident_demand"] = output_data.get(
-                    "Steam (all meters) - Coincident Peak - Heat Rejection"
-                )
-                source_results["Heat Rejection"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Heat Rejection")
-                )
+    def populate_data_group(self):
+        """Populate the RMD data structure."""
 
-                source_results["Pumps & Aux"]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy - Pumps & Aux"
-                )
-                source_results["Pumps & Aux"]["coincident_demand"] = output_data.get(
-                    "Steam (all meters) - Coincident Peak - Pumps & Aux"
-                )
-                source_results["Pumps & Aux"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Pumps & Aux")
-                )
+        self.output_instance = {
+            key: value
+            for key, value in {
+                "id": self.output_instance_id,
+                "ruleset_model_type": self.output_instance_ruleset_model_type,
+                "rotation_angle": self.output_instance_rotation_angle,
+                "unmet_load_hours": self.output_instance_unmet_load_hours,
+                "unmet_load_hours_heating": self.output_instance_unmet_load_hours_heating,
+                "unmet_occupied_load_hours_heating": self.output_instance_unmet_occupied_load_hours_heating,
+                "unmet_load_hours_cooling": self.output_instance_unmet_load_hours_cooling,
+                "unmet_occupied_load_hours_cooling": self.output_instance_unmet_occupied_load_hours_cooling,
+                "annual_source_results": self.output_instance_annual_source_results,
+                "building_peak_heating_load": self.output_instance_building_peak_heating_load,
+                "building_peak_cooling_load": self.output_instance_building_peak_cooling_load,
+                "annual_end_use_results": self.output_instance_annual_end_use_results,
+            }.items()
+            if value is not None
+        }
 
-                source_results["Ventilation Fans"]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy - Ventilation Fans"
-                )
-                source_results["Ventilation Fans"]["coincident_demand"] = (
-                    output_data.get(
-                        "Steam (all meters) - Coincident Peak - Ventilation Fans"
-                    )
-                )
-                source_results["Ventilation Fans"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Ventilation Fans")
-                )
-
-                source_results["Refrigeration Display"]["site_energy_use"] = (
-                    output_data.get(
-                        "Steam (all meters) - Energy - Refrigeration Display"
-                    )
-                )
-                source_results["Refrigeration Display"]["coincident_demand"] = (
-                    output_data.get(
-                        "Steam (all meters) - Coincident Peak - Refrigeration Display"
-                    )
-                )
-                source_results["Refrigeration Display"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Refrigeration Display")
-                )
-
-                source_results["Heat Pump Supp."]["site_energy_use"] = output_data.get(
-                    "Steam (all meters) - Energy - Ht Pump Supplemental Heat"
-                )
-                source_results["Heat Pump Supp."]["coincident_demand"] = (
-                    output_data.get(
-                        "Steam (all meters) - Coincident Peak - Ht Pump Supplemental Heat"
-                    )
-                )
-                source_results["Heat Pump Supp."]["non_coincident_demand"] = (
-                    output_data.get(
-                        "Steam (all meters) - Peak - Ht Pump Supplemental Heat"
-                    )
-                )
-
-                source_results["Domestic Hot Water"]["site_energy_use"] = (
-                    output_data.get("Steam (all meters) - Energy - Domestic Hot Water")
-                )
-                source_results["Domestic Hot Water"]["coincident_demand"] = (
-                    output_data.get(
-                        "Steam (all meters) - Coincident Peak - Domestic Hot Water"
-                    )
-                )
-                source_results["Domestic Hot Water"]["non_coincident_demand"] = (
-                    output_data.get("Steam (all meters) - Peak - Domestic Hot Water")
-                )
-
-            elif energy_source == EnergySourceOptions.PURCHASED_CHILLED_WATER:
-                source_results["Consumption"]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy"
-                )
-                source_results["Consumption"]["peak_demand"] = output_data.get(
-                    "Chilled Water (all meters) - Peak Demand"
-                )
-
-                source_results["Interior Lighting"]["site_energy_use"] = (
-                    output_data.get("Chilled Water (all meters) - Energy - Lights")
-                )
-                source_results["Interior Lighting"]["coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Coincident Peak - Lights"
-                    )
-                )
-                source_results["Interior Lighting"]["non_coincident_demand"] = (
-                    output_data.get("Chilled Water (all meters) - Peak - Lights")
-                )
-
-                source_results["Misc Equip"]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy - Misc Equip"
-                )
-                source_results["Misc Equip"]["coincident_demand"] = output_data.get(
-                    "Chilled Water (all meters) - Coincident Peak - Misc Equip"
-                )
-                source_results["Misc Equip"]["non_coincident_demand"] = output_data.get(
-                    "Chilled Water (all meters) - Peak - Misc Equip"
-                )
-
-                source_results["Space Heating"]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy - Space Heating"
-                )
-                source_results["Space Heating"]["coincident_demand"] = output_data.get(
-                    "Chilled Water (all meters) - Coincident Peak - Space Heating"
-                )
-                source_results["Space Heating"]["non_coincident_demand"] = (
-                    output_data.get("Chilled Water (all meters) - Peak - Space Heating")
-                )
-
-                source_results["Space Cooling"]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy - Space Cooling"
-                )
-                source_results["Space Cooling"]["coincident_demand"] = output_data.get(
-                    "Chilled Water (all meters) - Coincident Peak - Space Cooling"
-                )
-                source_results["Space Cooling"]["non_coincident_demand"] = (
-                    output_data.get("Chilled Water (all meters) - Peak - Space Cooling")
-                )
-
-                source_results["Heat Rejection"]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy - Heat Rejection"
-                )
-                source_results["Heat Rejection"]["coincident_demand"] = output_data.get(
-                    "Chilled Water (all meters) - Coincident Peak - Heat Rejection"
-                )
-                source_results["Heat Rejection"]["non_coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Peak - Heat Rejection"
-                    )
-                )
-
-                source_results["Pumps & Aux"]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy - Pumps & Aux"
-                )
-                source_results["Pumps & Aux"]["coincident_demand"] = output_data.get(
-                    "Chilled Water (all meters) - Coincident Peak - Pumps & Aux"
-                )
-                source_results["Pumps & Aux"]["non_coincident_demand"] = (
-                    output_data.get("Chilled Water (all meters) - Peak - Pumps & Aux")
-                )
-
-                source_results["Ventilation Fans"]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy - Ventilation Fans"
-                )
-                source_results["Ventilation Fans"]["coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Coincident Peak - Ventilation Fans"
-                    )
-                )
-                source_results["Ventilation Fans"]["non_coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Peak - Ventilation Fans"
-                    )
-                )
-
-                source_results["Refrigeration Display"]["site_energy_use"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Energy - Refrigeration Display"
-                    )
-                )
-                source_results["Refrigeration Display"]["coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Coincident Peak - Refrigeration Display"
-                    )
-                )
-                source_results["Refrigeration Display"]["non_coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Peak - Refrigeration Display"
-                    )
-                )
-
-                source_results["Heat Pump Supp."]["site_energy_use"] = output_data.get(
-                    "Chilled Water (all meters) - Energy - Ht Pump Supplemental Heat"
-                )
-                source_results["Heat Pump Supp."]["coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Coincident Peak - Ht Pump Supplemental Heat"
-                    )
-                )
-                source_results["Heat Pump Supp."]["non_coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Peak - Ht Pump Supplemental Heat"
-                    )
-                )
-
-                source_results["Domestic Hot Water"]["site_energy_use"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Energy - Domestic Hot Water"
-                    )
-                )
-                source_results["Domestic Hot Water"]["coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Coincident Peak - Domestic Hot Water"
-                    )
-                )
-                source_results["Domestic Hot Water"]["non_coincident_demand"] = (
-                    output_data.get(
-                        "Chilled Water (all meters) - Peak - Domestic Hot Water"
-                    )
-                )
-
-            elif energy_source == EnergySourceOptions.ON_SITE_RENEWABLES:
-                source_results["Consumption"]["site_energy_use"] = sum(
-                    output_data.get(f"Elec (meter {generator_name}) - Elec Use")
-                    for generator_name in self.elec_generator_names
-                    if self.bdl_obj_instances.get(generator_name).get_inp(
-                        BDL_ElecGeneratorKeywords.TYPE
-                    )
-                    == BDL_ElecGeneratorTypes.PV_ARRAY
-                )
-                if len(self.elec_generator_names) == 1:
-                    source_results["Consumption"]["peak_demand"] = output_data.get(
-                        f"Elec (meter {self.elec_generator_names[0]}) - Peak Demand"
-                    )
-
-            else:
-                # Sum results from fuel meters that have the same type
-                for fuel_meter_name in self.fuel_meter_names:
-                    fuel_meter = self.bdl_obj_instances.get(fuel_meter_name)
-                    if (
-                        fuel_meter
-                        and fuel_meter.get_inp(BDL_FuelMeterKeywords.TYPE)
-                        == energy_source
-                    ):
-                        source_results["Consumption"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use"
-                        )
-
-                        source_results["Interior Lighting"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Lights"
-                        )
-                        source_results["Interior Lighting"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Lights"
-                        )
-
-                        source_results["Misc Equip"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Misc Equip"
-                        )
-                        source_results["Misc Equip"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Misc Equip"
-                        )
-
-                        source_results["Space Heating"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Space Heating"
-                        )
-                        source_results["Space Heating"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Space Heating"
-                        )
-
-                        source_results["Space Cooling"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Space Cooling"
-                        )
-                        source_results["Space Cooling"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Space Cooling"
-                        )
-
-                        source_results["Heat Rejection"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Heat Rejection"
-                        )
-                        source_results["Heat Rejection"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Heat Rejection"
-                        )
-
-                        source_results["Pumps & Aux"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Pumps & Aux"
-                        )
-                        source_results["Pumps & Aux"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Pumps & Aux"
-                        )
-
-                        source_results["Ventilation Fans"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Ventilation Fans"
-                        )
-                        source_results["Ventilation Fans"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Ventilation Fans"
-                        )
-
-                        source_results["Refrigeration Display"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Refrigeration Display"
-                        )
-                        source_results["Refrigeration Display"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Refrigeration Display"
-                        )
-
-                        source_results["Heat Pump Supp."][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Ht Pump Supplemental Heat"
-                        )
-                        source_results["Heat Pump Supp."][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Ht Pump Supplemental Heat"
-                        )
-
-                        source_results["Domestic Hot Water"][
-                            "site_energy_use"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Fuel Use - Domestic Hot Water"
-                        )
-                        source_results["Domestic Hot Water"][
-                            "non_coincident_demand"
-                        ] += output_data.get(
-                            f"Fuel (meter {fuel_meter_name}) - Peak - Domestic Hot Water"
-                        )
-
-                if len(self.fuel_meter_names) == 1:
-                    source_results["Consumption"]["peak_demand"] = output_data.get(
-                        f"Fuel (all meters) - Peak Demand"
-                    )
-
-                    source_results["Interior Lighting"][
-                        "coincident_demand"
-                    ] += output_data.get("Fuel (all meters) - Coincident Peak - Lights")
-
-                    source_results["Misc Equip"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Misc Equip"
-                    )
-
-                    source_results["Space Heating"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Space Heating"
-                    )
-
-                    source_results["Space Cooling"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Space Cooling"
-                    )
-
-                    source_results["Heat Rejection"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Heat Rejection"
-                    )
-
-                    source_results["Pumps & Aux"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Pumps & Aux"
-                    )
-
-                    source_results["Ventilation Fans"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Ventilation Fans"
-                    )
-
-                    source_results["Refrigeration Display"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Refrigeration Display"
-                    )
-
-                    source_results["Heat Pump Supp."][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Ht Pump Supplemental Heat"
-                    )
-
-                    source_results["Domestic Hot Water"][
-                        "coincident_demand"
-                    ] += output_data.get(
-                        "Fuel (all meters) - Coincident Peak - Domestic Hot Water"
-                    )
-
-            self.output_instance_annual_source_results.append(
-                {
-                    # soure results data elements
-                    "id": energy_source,
-                    "energy_source": fuel_type_map.get(energy_source),
-                    "annual_consumption": source_results["Consumption"][
-                        "site_energy_use"
-                    ],
-                    "annual_demand": source_results["Consumption"]["peak_demand"],
-                    # "annual_cost": None,
-                }
-            )
-
-            self.populate_energy_source_end_use_results(source_results, energy_source)
-
-    def get_output_requests(self):
-        requests = {
-            "Total Site Energy (BTU)": (
-                2001001,
-                "",
-                "",
-            ),
-            "Unmet Cooling Load Hours": (
-                2001022,
-                "",
-                "",
-            ),
-            "Unmet Heating Load Hours": (
-                2001023,
-                "",
-                "",
-            ),
-            "Building Peak Cooling Load": (
-                1003003,
-                "",
-                "",
-            ),
-            "Building Peak Heating Load": (
-                1003005,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Lights": (
-                2001009,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Task Lights": (
-                2001010,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Misc Equip": (
-                2001011,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Space Heating": (
-                2001012,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Space Cooling": (
-                2001013,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Heat Rejection": (
-                2001014,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Pumps & Aux": (
-                2001015,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Ventilation Fans": (
-                2001016,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Refrigeration Display": (
-                2001017,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Ht Pump Supplemental Heat": (
-                2001018,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Domestic Hot Water": (
-                2001019,
-                "",
-                "",
-            ),
-            "Total Site Energy (BTU) - Exterior Usage": (
-                2001020,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use": (
-                2305001,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak Demand": (
-                2305002,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Lights": (
-                2305006,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Task Lights": (
-                2305007,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Misc Equip": (
-                2305008,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Space Heating": (
-                2305009,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Space Cooling": (
-                2305010,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Heat Rejection": (
-                2305011,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Pumps & Aux": (
-                2305012,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Ventilation Fans": (
-                2305013,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Refrigeration Display": (
-                2305014,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Ht Pump Supplemental Heat": (
-                2305015,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Domestic Hot Water": (
-                2305016,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Elec Use - Exterior Usage": (
-                2305017,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Lights": (
-                2305019,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Task Lights": (
-                2305020,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Misc Equip": (
-                2305021,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Space Heating": (
-                2305022,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Space Cooling": (
-                2305023,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Heat Rejection": (
-                2305024,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Pumps & Aux": (
-                2305025,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Ventilation Fans": (
-                2305026,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Refrigeration Display": (
-                2305027,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Ht Pump Supplemental Heat": (
-                2305028,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Domestic Hot Water": (
-                2305029,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Peak - Exterior Usage": (
-                2305030,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Lights": (
-                2305186,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Task Lights": (
-                2305187,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Misc Equip": (
-                2305188,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Space Heating": (
-                2305189,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Space Cooling": (
-                2305190,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Heat Rejection": (
-                2305191,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Pumps & Aux": (
-                2305192,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Ventilation Fans": (
-                2305193,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Refrigeration Display": (
-                2305194,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Ht Pump Supplemental Heat": (
-                2305195,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Domestic Hot Water": (
-                2305196,
-                "",
-                "",
-            ),
-            "Elec (all meters) - Coincident Peak - Exterior Usage": (
-                2305197,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use": (
-                2306001,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak Demand": (
-                2306002,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Lights": (
-                2306006,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Task Lights": (
-                2306007,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Misc Equip": (
-                2306008,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Space Heating": (
-                2306009,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Space Cooling": (
-                2306010,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Heat Rejection": (
-                2306011,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Pumps & Aux": (
-                2306012,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Ventilation Fans": (
-                2306013,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Refrigeration Display": (
-                2306014,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Ht Pump Supplemental Heat": (
-                2306015,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Domestic Hot Water": (
-                2306016,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Fuel Use - Exterior Usage": (
-                2306017,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Lights": (
-                2306019,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Task Lights": (
-                2306020,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Misc Equip": (
-                2306021,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Space Heating": (
-                2306022,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Space Cooling": (
-                2306023,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Heat Rejection": (
-                2306024,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Pumps & Aux": (
-                2306025,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Ventilation Fans": (
-                2306026,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Refrigeration Display": (
-                2306027,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Ht Pump Supplemental Heat": (
-                2306028,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Domestic Hot Water": (
-                2306029,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Peak - Exterior Usage": (
-                2306030,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Lights": (
-                2306186,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Task Lights": (
-                2306187,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Misc Equip": (
-                2306188,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Space Heating": (
-                2306189,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Space Cooling": (
-                2306190,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Heat Rejection": (
-                2306191,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Pumps & Aux": (
-                2306192,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Ventilation Fans": (
-                2306193,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Refrigeration Display": (
-                2306194,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Ht Pump Supplemental Heat": (
-                2306195,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Domestic Hot Water": (
-                2306196,
-                "",
-                "",
-            ),
-            "Fuel (all meters) - Coincident Peak - Exterior Usage": (
-                2306197,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy": (
-                2307001,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak Demand": (
-                2307002,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Lights": (
-                2307006,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Task Lights": (
-                2307007,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Misc Equip": (
-                2307008,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Space Heating": (
-                2307009,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Space Cooling": (
-                2307010,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Heat Rejection": (
-                2307011,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Pumps & Aux": (
-                2307012,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Ventilation Fans": (
-                2307013,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Refrigeration Display": (
-                2307014,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Ht Pump Supplemental Heat": (
-                2307015,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Domestic Hot Water": (
-                2307016,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Energy - Exterior Usage": (
-                2307017,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Lights": (
-                2307019,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Task Lights": (
-                2307020,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Misc Equip": (
-                2307021,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Space Heating": (
-                2307022,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Space Cooling": (
-                2307023,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Heat Rejection": (
-                2307024,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Pumps & Aux": (
-                2307025,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Ventilation Fans": (
-                2307026,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Refrigeration Display": (
-                2307027,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Ht Pump Supplemental Heat": (
-                2307028,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Domestic Hot Water": (
-                2307029,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Peak - Exterior Usage": (
-                2307030,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Lights": (
-                2307186,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Task Lights": (
-                2307187,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Misc Equip": (
-                2307188,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Space Heating": (
-                2307189,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Space Cooling": (
-                2307190,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Heat Rejection": (
-                2307191,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Pumps & Aux": (
-                2307192,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Ventilation Fans": (
-                2307193,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Refrigeration Display": (
-                2307194,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Ht Pump Supplemental Heat": (
-                2307195,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Domestic Hot Water": (
-                2307196,
-                "",
-                "",
-            ),
-            "Steam (all meters) - Coincident Peak - Exterior Usage": (
-                2307197,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy": (
-                2308001,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak Demand": (
-                2308002,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Lights": (
-                2308006,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Task Lights": (
-                2308007,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Misc Equip": (
-                2308008,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Space Heating": (
-                2308009,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Space Cooling": (
-                2308010,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Heat Rejection": (
-                2308011,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Pumps & Aux": (
-                2308012,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Ventilation Fans": (
-                2308013,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Refrigeration Display": (
-                2308014,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Ht Pump Supplemental Heat": (
-                2308015,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Domestic Hot Water": (
-                2308016,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Energy - Exterior Usage": (
-                2308017,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Lights": (
-                2308019,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Task Lights": (
-                2308020,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Misc Equip": (
-                2308021,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Space Heating": (
-                2308022,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Space Cooling": (
-                2308023,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Heat Rejection": (
-                2308024,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Pumps & Aux": (
-                2308025,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Ventilation Fans": (
-                2308026,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Refrigeration Display": (
-                2308027,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Ht Pump Supplemental Heat": (
-                2308028,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Domestic Hot Water": (
-                2308029,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Peak - Exterior Usage": (
-                2308030,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Lights": (
-                2308186,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Task Lights": (
-                2308187,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Misc Equip": (
-                2308188,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Space Heating": (
-                2308189,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Space Cooling": (
-                2308190,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Heat Rejection": (
-                2308191,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Pumps & Aux": (
-                2308192,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Ventilation Fans": (
-                2308193,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Refrigeration Display": (
-                2308194,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Ht Pump Supplemental Heat": (
-                2308195,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Domestic Hot Water": (
-                2308196,
-                "",
-                "",
-            ),
-            "Chilled Water (all meters) - Coincident Peak - Exterior Usage": (
-                2308197,
-                "",
-                "",
-            ),
-        }
-        string_requests = {}
-        for fuel_meter_name in self.fuel_meter_names:
-            string_requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use Units"] = (
-                2310001,
-                fuel_meter_name,
-                "",
-            )
-            string_requests[f"Fuel (meter {fuel_meter_name}) - Peak Demand Units"] = (
-                2310002,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use"] = (
-                2310003,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak Demand"] = (
-                2310004,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Lights"] = (
-                2310008,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Task Lights"] = (
-                2310009,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Misc Equip"] = (
-                2310010,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Space Heating"] = (
-                2310011,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Space Cooling"] = (
-                2310012,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Heat Rejection"] = (
-                2310013,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Pumps & Aux"] = (
-                2310014,
-                fuel_meter_name,
-                "",
-            )
-            requests[
-                f"Fuel (meter {fuel_meter_name}) - Fuel Use - Ventilation Fans"
-            ] = (
-                2310015,
-                fuel_meter_name,
-                "",
-            )
-            requests[
-                f"Fuel (meter {fuel_meter_name}) - Fuel Use - Refrigeration Display"
-            ] = (2310016, fuel_meter_name, "")
-            requests[
-                f"Fuel (meter {fuel_meter_name}) - Fuel Use - Ht Pump Supplemental Heat"
-            ] = (
-                2310017,
-                fuel_meter_name,
-                "",
-            )
-            requests[
-                f"Fuel (meter {fuel_meter_name}) - Fuel Use - Domestic Hot Water"
-            ] = (
-                2310018,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Fuel Use - Exterior Usage"] = (
-                2310019,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Lights"] = (
-                2310058,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Task Lights"] = (
-                2310059,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Misc Equip"] = (
-                2310060,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Space Heating"] = (
-                2310061,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Space Cooling"] = (
-                2310062,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Heat Rejection"] = (
-                2310063,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Pumps & Aux"] = (
-                2310064,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Ventilation Fans"] = (
-                2310065,
-                fuel_meter_name,
-                "",
-            )
-            requests[
-                f"Fuel (meter {fuel_meter_name}) - Peak - Refrigeration Display"
-            ] = (
-                2310066,
-                fuel_meter_name,
-                "",
-            )
-            requests[
-                f"Fuel (meter {fuel_meter_name}) - Peak - Ht Pump Supplemental Heat"
-            ] = (
-                2310067,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Domestic Hot Water"] = (
-                2310068,
-                fuel_meter_name,
-                "",
-            )
-            requests[f"Fuel (meter {fuel_meter_name}) - Peak - Exterior Usage"] = (
-                2310069,
-                fuel_meter_name,
-                "",
-            )
-
-        for elec_generator_name in self.elec_generator_names:
-            elec_generator = self.bdl_obj_instances[elec_generator_name]
-            if (
-                elec_generator
-                and elec_generator.get_inp(BDL_ElecGeneratorKeywords.TYPE)
-                == BDL_ElecGeneratorTypes.PV_ARRAY
-            ):
-                requests[f"PV Array {elec_generator_name} - Energy"] = (
-                    2303259,
-                    elec_generator_name,
-                    "",
-                )
-                requests[f"PV Array {elec_generator_name} - Peak Demand"] = (
-                    2303260,
-                    elec_generator_name,
-                    "",
-                )
-
-        for utility_rate_name in self.utility_rate_names:
-            # TODO diagnose why Utility Rate output requests are not being fulfilled
-            pass
-
-        return requests, string_requests
-
-    def populate_data_group(self):
-        """Populate the RMD data structure."""
-
-        self.output_instance = {
-            key: value
-            for key, value in {
-                "id": self.output_instance_id,
-                "ruleset_model_type": self.output_instance_ruleset_model_type,
-                "rotation_angle": self.output_instance_rotation_angle,
-                "unmet_load_hours": self.output_instance_unmet_load_hours,
-                "unmet_load_hours_heating": self.output_instance_unmet_load_hours_heating,
-                "unmet_occupied_load_hours_heating": self.output_instance_unmet_occupied_load_hours_heating,
-                "unmet_load_hours_cooling": self.output_instance_unmet_load_hours_cooling,
-                "unmet_occupied_load_hours_cooling": self.output_instance_unmet_occupied_load_hours_cooling,
-                "annual_source_results": self.output_instance_annual_source_results,
-                "building_peak_heating_load": self.output_instance_building_peak_heating_load,
-                "building_peak_cooling_load": self.output_instance_building_peak_cooling_load,
-                "annual_end_use_results": self.output_instance_annual_end_use_results,
-            }.items()
-            if value is not None
-        }
-
-        self.output = {
-            key: value
-            for key, value in {
-                "id": self.output_id,
-                "output_instance": self.output_instance,
-                "performance_cost_index": self.output_performance_cost_index,
-                "baseline_building_unregulated_energy_cost": self.output_baseline_building_unregulated_energy_cost,
-                "baseline_building_regulated_energy_cost": self.output_baseline_building_regulated_energy_cost,
-                "baseline_building_performance_energy_cost": self.output_baseline_building_performance_energy_cost,
-                "total_area_weighted_building_performance_factor": self.output_total_area_weighted_building_performance_factor,
-                "performance_cost_index_target": self.output_performance_cost_index_target,
-                "total_proposed_building_energy_cost_including_renewable_energy": self.output_total_proposed_building_energy_cost_including_renewable_energy,
-                "total_proposed_building_energy_cost_excluding_renewable_energy": self.output_total_proposed_building_energy_cost_excluding_renewable_energy,
-                "percent_renewable_energy_savings": self.output_percent_renewable_energy_savings,
-            }.items()
-            if value is not None
-        }
+        self.output = {
+            key: value
+            for key, value in {
+                "id": self.output_id,
+                "output_instance": self.output_instance,
+                "performance_cost_index": self.output_performance_cost_index,
+                "baseline_building_unregulated_energy_cost": self.output_baseline_building_unregulated_energy_cost,
+                "baseline_building_regulated_energy_cost": self.output_baseline_building_regulated_energy_cost,
+                "baseline_building_performance_energy_cost": self.output_baseline_building_performance_energy_cost,
+                "total_area_weighted_building_performance_factor": self.output_total_area_weighted_building_performance_factor,
+                "performance_cost_index_target": self.output_performance_cost_index_target,
+                "total_proposed_building_energy_cost_including_renewable_energy": self.output_total_proposed_building_energy_cost_including_renewable_energy,
+                "total_proposed_building_energy_cost_excluding_renewable_energy": self.output_total_proposed_building_energy_cost_excluding_renewable_energy,
+                "percent_renewable_energy_savings": self.output_percent_renewable_energy_savings,
+            }.items()
+            if value is not None
+        }
 
         self.rmd_data_structure = {
             key: value
@@ -2014,182 +792,21 @@ class RulesetModelDescription(Base):
     def populate_energy_source_end_use_results(
         self, source_results, energy_source_type
     ):
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Interior Lighting",
-                "type": EndUseOptions.INTERIOR_LIGHTING,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Interior Lighting"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Interior Lighting"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results[
-                    "Interior Lighting"
-                ]["non_coincident_demand"],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Misc Equipment",
-                "type": EndUseOptions.MISC_EQUIPMENT,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Misc Equip"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Misc Equip"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results["Misc Equip"][
-                    "non_coincident_demand"
-                ],
-                "is_regulated": False,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Space Heating",
-                "type": EndUseOptions.SPACE_HEATING,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Space Heating"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Space Heating"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results["Space Heating"][
-                    "non_coincident_demand"
-                ],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Space Cooling",
-                "type": EndUseOptions.SPACE_COOLING,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Space Cooling"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Space Cooling"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results["Space Cooling"][
-                    "non_coincident_demand"
-                ],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Heat Rejection",
-                "type": EndUseOptions.HEAT_REJECTION,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Heat Rejection"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Heat Rejection"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results["Heat Rejection"][
-                    "non_coincident_demand"
-                ],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Pumps & Aux",
-                "type": EndUseOptions.PUMPS,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Pumps & Aux"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Pumps & Aux"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results["Pumps & Aux"][
-                    "non_coincident_demand"
-                ],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Ventilation Fans",
-                "type": EndUseOptions.FANS_INTERIOR_VENTILATION,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Ventilation Fans"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Ventilation Fans"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results["Ventilation Fans"][
-                    "non_coincident_demand"
-                ],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Refrigeration Display",
-                "type": EndUseOptions.REFRIGERATION_EQUIPMENT,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Refrigeration Display"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results[
-                    "Refrigeration Display"
-                ]["coincident_demand"],
-                "annual_site_non_coincident_demand": source_results[
-                    "Refrigeration Display"
-                ]["non_coincident_demand"],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Ht Pump Supplemental Heat",
-                "type": EndUseOptions.HEAT_PUMP_SUPPLEMENTAL_HEATING,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Heat Pump Supp."][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Heat Pump Supp."][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results["Heat Pump Supp."][
-                    "non_coincident_demand"
-                ],
-                "is_regulated": True,
-            }
-        )
-
-        self.output_instance_annual_end_use_results.append(
-            {
-                "id": f"{energy_source_type} - Domestic Hot Water",
-                "type": EndUseOptions.SERVICE_WATER_HEATING,
-                "energy_source": energy_source_type,
-                "annual_site_energy_use": source_results["Domestic Hot Water"][
-                    "site_energy_use"
-                ],
-                "annual_site_coincident_demand": source_results["Domestic Hot Water"][
-                    "coincident_demand"
-                ],
-                "annual_site_non_coincident_demand": source_results[
-                    "Domestic Hot Water"
-                ]["non_coincident_demand"],
-                "is_regulated": True,
-            }
-        )
+        for end_use_id, end_use_type, is_regulated, _ in END_USE_RESULTS:
+            self.output_instance_annual_end_use_results.append(
+                {
+                    "id": f"{energy_source_type} - {end_use_id}",
+                    "type": end_use_type,
+                    "energy_source": energy_source_type,
+                    "annual_site_energy_use": source_results[end_use_id][
+                        "site_energy_use"
+                    ],
+                    "annual_site_coincident_demand": source_results[end_use_id][
+                        "coincident_demand"
+                    ],
+                    "annual_site_non_coincident_demand": source_results[end_use_id][
+                        "non_coincident_demand"
+                    ],
+                    "is_regulated": is_regulated,
+                }
+            )
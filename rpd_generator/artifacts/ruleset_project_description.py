@@ -1,5 +1,7 @@
 from time import strftime, gmtime
 
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
+
 OUTPUT_SCHEMA_ASHRAE901_2019 = "OUTPUT_SCHEMA_ASHRAE901_2019"
 
 
@@ -11,6 +13,16 @@ class RulesetProjectDescription:
     # BDL Command Dictionary maps BDL commands to their corresponding class in the bdl_commands package
     bdl_command_dict = None
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "data_timestamp",
+            "data_version",
+            "compliance_path",
+        ]
+    )
+
     def __init__(self):
 
         self.rpd_data_structure = {}
@@ -47,16 +59,5 @@ class RulesetProjectDescription:
             "weather": self.weather,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "data_timestamp",
-            "data_version",
-            "compliance_path",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.rpd_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.rpd_data_structure)
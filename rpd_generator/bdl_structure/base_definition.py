@@ -1,8 +1,10 @@
 from itertools import islice
 from pathlib import Path
 
+from rpd_generator.doe2_file_readers.bdl_value import BDLValue
 from rpd_generator.doe2_file_readers.model_output_reader import get_string_result
 from rpd_generator.config import Config
+from rpd_generator.utilities.profiling import profiler
 
 
 class BaseDefinition:
@@ -57,6 +59,7 @@ class BaseDefinition:
         :param entry_id: (int) id from NHRList.txt corresponding to the value to retrieve
         :return: value from binary simulation output files
         """
+        profiler.record_dll_call(1)
         return get_string_result(
             str(Path(Config.EQUEST_INSTALL_PATH) / "D2Result.dll"),
             self.rmd.doe2_data_path,
@@ -69,6 +72,9 @@ class BaseDefinition:
         """Attempt to convert a value to a float, returning None if it fails."""
         if value is None:
             return None
+        # Values read from the model input are decoded when they are read
+        if isinstance(value, BDLValue):
+            return value.number
         try:
             return float(value)
         except (ValueError, TypeError):
@@ -4,11 +4,14 @@ from itertools import islice
 from pathlib import Path
 
 
+from rpd_generator.doe2_file_readers.bdl_value import BDLValue
 from rpd_generator.doe2_file_readers.model_output_reader import (
     get_string_result,
     get_multiple_results,
 )
 from rpd_generator.config import Config
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
+from rpd_generator.utilities.profiling import profiler
 
 
 path_to_ureg = os.path.join(
@@ -23,26 +26,24 @@ ureg = pint.UnitRegistry(path_to_ureg, autoconvert_offset_to_baseunit=True)
 class Base:
 
     def populate_data_group_with_prefix(self, prefix):
-        attributes = [attr for attr in dir(self) if attr.startswith(prefix)]
-        keys = [attr.replace(prefix, "") for attr in attributes]
-
-        value_lists = []
-        for attr in attributes:
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                value_lists.append(value)
-            else:
-                value_lists.append([value])
-
-        result = []
-        for values in zip(*value_lists):
-            attr_dict = {
-                key: value for key, value in zip(keys, values) if value is not None
-            }
-            if attr_dict:
-                result.append(attr_dict)
-
-        return result
+        return self.get_prefix_serializer(prefix).serialize_groups(self)
+
+    def get_prefix_serializer(self, prefix, excluded_prefix=None):
+        """
+        Return the serializer of the attributes whose names start with prefix. It is created from the first object of
+        each class, whose prefixed attributes are all set in __init__.
+        :param prefix: (str) prefix of the attribute names, e.g. "terminals_"
+        :param excluded_prefix: (str) longer prefix of attribute names to leave out, e.g. "fan_sys" for "fan_"
+        """
+        serializers = type(self).__dict__.get("prefix_serializers")
+        if serializers is None:
+            serializers = {}
+            type(self).prefix_serializers = serializers
+        if (prefix, excluded_prefix) not in serializers:
+            serializers[(prefix, excluded_prefix)] = DataGroupSerializer.from_prefix(
+                self, prefix, excluded_prefix
+            )
+        return serializers[(prefix, excluded_prefix)]
 
     @staticmethod
     def get_single_string_output(rmd, entry_id, report_key="", row_key=""):
@@ -57,6 +58,7 @@ class Base:
         :param row_key: (str) to use when KT > 0 and when a report has multiple row where each row provides results for a separate building component or month of the year
         :return: value from binary simulation output files
         """
+        profiler.record_dll_call(1)
         return get_string_result(
             str(Path(Config.EQUEST_INSTALL_PATH) / "D2Result.dll"),
             rmd.doe2_data_path,
@@ -78,22 +80,24 @@ class Base:
         chunk_size = 12  # Max number of requests to process at a time
         results = {}  # To store the reassociated keys and values
 
-        # Split requests into chunks of at most 12
-        for chunk in _chunked_dict(requests, chunk_size):
-            # Extract and combine values into a list of tuples for get_multiple_results
-            values_list = list(chunk.values())
-
-            # Call the function with the current chunk of values
-            chunk_results = get_multiple_results(
-                str(Path(Config.EQUEST_INSTALL_PATH) / "D2Result.dll"),
-                rmd.doe2_data_path,
-                str(Path(rmd.file_path).with_suffix("")),
-                values_list,
-            )
-
-            # Reassociate returned values with their corresponding keys
-            if len(chunk_results) == len(chunk):
-                results.update(zip(chunk.keys(), chunk_results))
+        with profiler.span("get_output_data"):
+            # Split requests into chunks of at most 12
+            for chunk in _chunked_dict(requests, chunk_size):
+                # Extract and combine values into a list of tuples for get_multiple_results
+                values_list = list(chunk.values())
+
+                # Call the function with the current chunk of values
+                profiler.record_dll_call(len(values_list))
+                chunk_results = get_multiple_results(
+                    str(Path(Config.EQUEST_INSTALL_PATH) / "D2Result.dll"),
+                    rmd.doe2_data_path,
+                    str(Path(rmd.file_path).with_suffix("")),
+                    values_list,
+                )
+
+                # Reassociate returned values with their corresponding keys
+                if len(chunk_results) == len(chunk):
+                    results.update(zip(chunk.keys(), chunk_results))
 
         results = {key: value for key, value in results.items() if value != -99999}
         return results
@@ -166,6 +170,9 @@ class BaseNode(Base):
         """Attempt to convert a value to a float, returning None if it fails."""
         if value is None:
             return None
+        # Values read from the model input are decoded when they are read
+        if isinstance(value, BDLValue):
+            return value.number
         try:
             return float(value)
         except (ValueError, TypeError):
@@ -175,7 +182,7 @@ class BaseNode(Base):
     @staticmethod
     def try_int(value):
         """Attempt to convert a value to an int, returning None if it fails."""
-        if value is None:
+        if value is None or (isinstance(value, BDLValue) and value.number is None):
             return None
         try:
             return int(value)
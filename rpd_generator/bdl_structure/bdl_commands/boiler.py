@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 BoilerCombustionOptions = SchemaEnums.schema_enums["BoilerCombustionOptions"]
 EnergySourceOptions = SchemaEnums.schema_enums["EnergySourceOptions"]
@@ -40,6 +41,22 @@ class Boiler(BaseNode):
         BDL_BoilerTypes.HW_CONDENSING: None,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "loop",
+            "design_capacity",
+            "rated_capacity",
+            "minimum_load_ratio",
+            "draft_type",
+            "energy_source_type",
+            "auxiliary_power",
+            "operation_lower_limit",
+            "operation_upper_limit",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.boiler_names.append(u_name)
@@ -217,25 +234,8 @@ class Boiler(BaseNode):
             "output_validation_points": self.output_validation_points,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "loop",
-            "design_capacity",
-            "rated_capacity",
-            "minimum_load_ratio",
-            "draft_type",
-            "energy_source_type",
-            "auxiliary_power",
-            "operation_lower_limit",
-            "operation_upper_limit",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.boiler_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.boiler_data_structure)
 
     def insert_to_rpd(self, rmd):
         rmd.boilers.append(self.boiler_data_structure)
@@ -243,22 +243,19 @@ class Boiler(BaseNode):
     def populate_operation_limits(self):
         requests = {}
         boiler_capacities = {}
-        for boiler_name in self.rmd.boiler_names:
-            boiler = self.get_obj(boiler_name)
-            if boiler.rated_capacity:  # boiler is guaranteed to exist
-                boiler_capacities[boiler_name] = boiler.rated_capacity
+        for boiler in self.rmd.objects(BDL_Commands.BOILER):
+            if boiler.rated_capacity:
+                boiler_capacities[boiler.u_name] = boiler.rated_capacity
             else:
-                requests[boiler_name] = (
+                requests[boiler.u_name] = (
                     2315901,
-                    boiler_name,
+                    boiler.u_name,
                     "",
                 )
 
-        hw_loop_equip_ctrls = []
-        for equip_ctrl_name in self.rmd.equip_ctrl_names:
-            equip_ctrl = self.get_obj(equip_ctrl_name)
-            if equip_ctrl.get_inp(BDL_EquipCtrlKeywords.CIRCULATION_LOOP) == self.loop:
-                hw_loop_equip_ctrls.append(equip_ctrl)
+        hw_loop_equip_ctrls = self.rmd.get_topology_index().get_connected_objects(
+            self.loop, BDL_Commands.EQUIP_CTRL
+        )
 
         if len(hw_loop_equip_ctrls) > 1:
             return
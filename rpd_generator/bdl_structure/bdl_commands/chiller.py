@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 EnergySourceOptions = SchemaEnums.schema_enums["EnergySourceOptions"]
@@ -33,6 +34,29 @@ class Chiller(BaseNode):
         BDL_ChillerTypes.STRAINER_CYCLE: OMIT,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "cooling_loop",
+            "condensing_loop",
+            "compressor_type",
+            "energy_source_type",
+            "design_capacity",
+            "rated_capacity",
+            "rated_entering_condenser_temperature",
+            "rated_leaving_evaporator_temperature",
+            "minimum_load_ratio",
+            "design_flow_evaporator",
+            "design_flow_condenser",
+            "design_entering_condenser_temperature",
+            "design_leaving_evaporator_temperature",
+            "full_load_efficiency",
+            "is_chilled_water_pump_interlocked",
+            "is_condenser_water_pump_interlocked",
+            "heat_recovery_loop",
+            "heat_recovery_fraction",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.chiller_names.append(u_name)
@@ -262,32 +286,8 @@ class Chiller(BaseNode):
             "power_validation_points": self.power_validation_points,
         }
 
-        no_children_attributes = [
-            "cooling_loop",
-            "condensing_loop",
-            "compressor_type",
-            "energy_source_type",
-            "design_capacity",
-            "rated_capacity",
-            "rated_entering_condenser_temperature",
-            "rated_leaving_evaporator_temperature",
-            "minimum_load_ratio",
-            "design_flow_evaporator",
-            "design_flow_condenser",
-            "design_entering_condenser_temperature",
-            "design_leaving_evaporator_temperature",
-            "full_load_efficiency",
-            "is_chilled_water_pump_interlocked",
-            "is_condenser_water_pump_interlocked",
-            "heat_recovery_loop",
-            "heat_recovery_fraction",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.chiller_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.chiller_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert chiller object into the rpd data structure."""
@@ -299,18 +299,22 @@ class Chiller(BaseNode):
     def get_loop_energy_source(self, hot_water_loop):
         """Get the energy source type for the loop. Used for absorption chillers to populate the energy_source_type."""
         energy_source_set = set()
-        for boiler_name in self.rmd.boiler_names:
-            boiler = self.get_obj(boiler_name)
+        topology_index = self.rmd.get_topology_index()
+        for boiler in topology_index.get_connected_objects(
+            hot_water_loop.u_name, BDL_Commands.BOILER
+        ):
             if boiler.loop == hot_water_loop.u_name:
                 energy_source_set.add(boiler.energy_source_type)
 
-        for steam_meter_name in self.rmd.steam_meter_names:
-            steam_meter = self.get_obj(steam_meter_name)
+        for steam_meter in topology_index.get_connected_objects(
+            hot_water_loop.u_name, BDL_Commands.STEAM_METER
+        ):
             if steam_meter.loop == hot_water_loop.u_name:
                 energy_source_set.add(steam_meter.energy_source_type)
 
-        for chiller_name in self.rmd.chiller_names:
-            chiller = self.get_obj(chiller_name)
+        for chiller in topology_index.get_connected_objects(
+            hot_water_loop.u_name, BDL_Commands.CHILLER
+        ):
             if chiller.heat_recovery_loop == hot_water_loop.u_name:
                 energy_source_set.add(EnergySourceOptions.ELECTRICITY)
 
@@ -323,11 +327,14 @@ class Chiller(BaseNode):
         """Check if the chiller has a pump with interlocked operation."""
         chw_pump_interlocked = False
         cw_pump_interlocked = False
-        for pump_name in self.rmd.pump_names:
+        topology_index = self.rmd.get_topology_index()
+        for pump_name in topology_index.get_loop_pump_names(chw_loop_name):
             pump = self.get_obj(pump_name)
-            if pump.loop_or_piping == chw_loop_name:  # pump is guaranteed to exist
+            if pump and pump.loop_or_piping == chw_loop_name:
                 chw_pump_interlocked = bool(self.get_inp(BDL_ChillerKeywords.CHW_PUMP))
 
-            if pump.loop_or_piping == cw_loop_name:  # pump is guaranteed to exist
+        for pump_name in topology_index.get_loop_pump_names(cw_loop_name):
+            pump = self.get_obj(pump_name)
+            if pump and pump.loop_or_piping == cw_loop_name:
                 cw_pump_interlocked = bool(self.get_inp(BDL_ChillerKeywords.CW_PUMP))
         return chw_pump_interlocked, cw_pump_interlocked
@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 FluidLoopOptions = SchemaEnums.schema_enums["FluidLoopOptions"]
 FluidLoopOperationOptions = SchemaEnums.schema_enums["FluidLoopOperationOptions"]
@@ -68,6 +69,113 @@ class CirculationLoop(BaseNode):
         BDL_CirculationLoopTemperatureResetOptions.LOAD_RESET: TemperatureResetOptions.LOAD_RESET,
         BDL_CirculationLoopTemperatureResetOptions.WETBULB_RESET: TemperatureResetOptions.OTHER,
     }
+    # Connections that make a loop variable flow: (command, loop keyword, valve keywords, valve value, loop types).
+    # The loop is variable flow if an object of the command references the loop through the loop keyword and any of
+    # the valve keywords has the valve value. Loop types of None apply to every loop type.
+    variable_flow_connections = [
+        (
+            BDL_Commands.CIRCULATION_LOOP,
+            BDL_CirculationLoopKeywords.PRIMARY_LOOP,
+            [BDL_CirculationLoopKeywords.VALVE_TYPE_2ND],
+            BDL_SecondaryLoopValveTypes.TWO_WAY,
+            None,
+        ),
+        (
+            BDL_Commands.SYSTEM,
+            BDL_SystemKeywords.CHW_LOOP,
+            [BDL_SystemKeywords.CHW_VALVE_TYPE],
+            BDL_SystemCoolingValveTypes.TWO_WAY,
+            [BDL_CirculationLoopTypes.CHW, BDL_CirculationLoopTypes.PIPE2],
+        ),
+        (
+            BDL_Commands.SYSTEM,
+            BDL_SystemKeywords.HW_LOOP,
+            [BDL_SystemKeywords.HW_VALVE_TYPE, BDL_SystemKeywords.PHW_VALVE_TYPE],
+            BDL_SystemHeatingValveTypes.TWO_WAY,
+            [BDL_CirculationLoopTypes.HW],
+        ),
+        (
+            BDL_Commands.SYSTEM,
+            BDL_SystemKeywords.PHW_LOOP,
+            [BDL_SystemKeywords.HW_VALVE_TYPE, BDL_SystemKeywords.PHW_VALVE_TYPE],
+            BDL_SystemHeatingValveTypes.TWO_WAY,
+            [BDL_CirculationLoopTypes.HW],
+        ),
+        (
+            BDL_Commands.SYSTEM,
+            BDL_SystemKeywords.HW_LOOP,
+            [BDL_SystemKeywords.HW_VALVE_TYPE],
+            BDL_SystemHeatingValveTypes.TWO_WAY,
+            [BDL_CirculationLoopTypes.PIPE2],
+        ),
+        (
+            BDL_Commands.ZONE,
+            BDL_ZoneKeywords.CHW_LOOP,
+            [BDL_ZoneKeywords.CHW_VALVE_TYPE],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [BDL_CirculationLoopTypes.CHW, BDL_CirculationLoopTypes.PIPE2],
+        ),
+        (
+            BDL_Commands.ZONE,
+            BDL_ZoneKeywords.HW_LOOP,
+            [BDL_ZoneKeywords.HW_VALVE_TYPE],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [BDL_CirculationLoopTypes.HW, BDL_CirculationLoopTypes.PIPE2],
+        ),
+        (
+            BDL_Commands.ZONE,
+            BDL_ZoneKeywords.CW_LOOP,
+            [BDL_ZoneKeywords.CW_VALVE],
+            BDL_ZoneCondenserValveOptions.YES,
+            [BDL_CirculationLoopTypes.CW, BDL_CirculationLoopTypes.WLHP],
+        ),
+        (
+            BDL_Commands.CHILLER,
+            BDL_ChillerKeywords.CHW_LOOP,
+            [BDL_ChillerKeywords.CHW_FLOW_CTRL],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [BDL_CirculationLoopTypes.CHW, BDL_CirculationLoopTypes.PIPE2],
+        ),
+        (
+            BDL_Commands.CHILLER,
+            BDL_ChillerKeywords.HTREC_LOOP,
+            [BDL_ChillerKeywords.HTREC_FLOW_CTRL],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [BDL_CirculationLoopTypes.HW, BDL_CirculationLoopTypes.PIPE2],
+        ),
+        (
+            BDL_Commands.CHILLER,
+            BDL_ChillerKeywords.CW_LOOP,
+            [BDL_ChillerKeywords.CW_FLOW_CTRL],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [BDL_CirculationLoopTypes.CW],
+        ),
+        (
+            BDL_Commands.BOILER,
+            BDL_BoilerKeywords.HW_LOOP,
+            [BDL_BoilerKeywords.HW_FLOW_CTRL],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [
+                BDL_CirculationLoopTypes.HW,
+                BDL_CirculationLoopTypes.PIPE2,
+                BDL_CirculationLoopTypes.WLHP,
+            ],
+        ),
+        (
+            BDL_Commands.HEAT_REJECTION,
+            BDL_HeatRejectionKeywords.CW_LOOP,
+            [BDL_HeatRejectionKeywords.CW_FLOW_CTRL],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [BDL_CirculationLoopTypes.CW, BDL_CirculationLoopTypes.WLHP],
+        ),
+        (
+            BDL_Commands.GROUND_LOOP_HX,
+            BDL_GroundLoopHXKeywords.CIRCULATION_LOOP,
+            [BDL_GroundLoopHXKeywords.HX_FLOW_CTRL],
+            BDL_FlowControlOptions.VARIABLE_FLOW,
+            [BDL_CirculationLoopTypes.CW, BDL_CirculationLoopTypes.WLHP],
+        ),
+    ]
     piping_location_map = {
         BDL_CirculationLoopLocationOptions.OUTDOORS: ComponentLocationOptions.OUTSIDE,
         BDL_CirculationLoopLocationOptions.ZONE: ComponentLocationOptions.IN_ZONE,
@@ -75,6 +183,65 @@ class CirculationLoop(BaseNode):
         BDL_CirculationLoopLocationOptions.UNDERGROUND: ComponentLocationOptions.UNDERGROUND,
     }
 
+    design_and_control_elements = DataGroupSerializer(
+        [
+            "design_supply_temperature",
+            "design_return_temperature",
+            "is_sized_using_coincident_load",
+            "minimum_flow_fraction",
+            "operation",
+            "operation_schedule",
+            "flow_control",
+            "temperature_reset_type",
+            "outdoor_high_for_loop_supply_reset_temperature",
+            "outdoor_low_for_loop_supply_reset_temperature",
+            "loop_supply_temperature_at_outdoor_high",
+            "loop_supply_temperature_at_outdoor_low",
+            "loop_supply_temperature_at_low_load",
+            "has_integrated_waterside_economizer",
+        ]
+    )
+
+    # design_supply_temperature exists in both the circulation loop and the swh distribution system
+    service_water_heating_distribution_system_elements = DataGroupSerializer(
+        [
+            "swh_design_supply_temperature",
+            "design_supply_temperature_difference",
+            "is_central_system",
+            "distribution_compactness",
+            "control_type",
+            "configuration_type",
+            "is_recovered_heat_from_drain_used_by_water_heater",
+            "drain_heat_recovery_efficiency",
+            "drain_heat_recovery_type",
+            "flow_multiplier_schedule",
+            "entering_water_mains_temperature_schedule",
+            "is_ground_temperature_used_for_entering_water",
+        ],
+        prefix="swh_",
+    )
+
+    service_water_piping_elements = DataGroupSerializer(
+        [
+            "is_recirculation_loop",
+            "are_thermal_losses_modeled",
+            "insulation_thickness",
+            "loop_pipe_location",
+            "location_zone",
+            "length",
+            "diameter",
+        ]
+    )
+
+    fluid_loop_elements = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "type",
+            "pump_power_per_flow_rate",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.circulation_loop_names.append(u_name)
@@ -190,54 +357,10 @@ class CirculationLoop(BaseNode):
 
     def populate_data_group(self):
         """Populate schema structure for circulation loop object."""
-
-        design_and_control_elements = [
-            "design_supply_temperature",
-            "design_return_temperature",
-            "is_sized_using_coincident_load",
-            "minimum_flow_fraction",
-            "operation",
-            "operation_schedule",
-            "flow_control",
-            "temperature_reset_type",
-            "outdoor_high_for_loop_supply_reset_temperature",
-            "outdoor_low_for_loop_supply_reset_temperature",
-            "loop_supply_temperature_at_outdoor_high",
-            "loop_supply_temperature_at_outdoor_low",
-            "loop_supply_temperature_at_low_load",
-            "has_integrated_waterside_economizer",
-        ]
-
-        service_water_heating_distribution_system_elements = [
-            "design_supply_temperature",
-            "design_supply_temperature_difference",
-            "is_central_system",
-            "distribution_compactness",
-            "control_type",
-            "configuration_type",
-            "is_recovered_heat_from_drain_used_by_water_heater",
-            "drain_heat_recovery_efficiency",
-            "drain_heat_recovery_type",
-            "flow_multiplier_schedule",
-            "entering_water_mains_temperature_schedule",
-            "is_ground_temperature_used_for_entering_water",
-        ]
-
-        service_water_piping_elements = [
-            "is_recirculation_loop",
-            "are_thermal_losses_modeled",
-            "insulation_thickness",
-            "loop_pipe_location",
-            "location_zone",
-            "length",
-            "diameter",
-        ]
-
         if self.circulation_loop_type == "ServiceWaterPiping":
-            for attr in design_and_control_elements:
-                value_list = getattr(self, attr, None)
-                if value_list[1] is not None:
-                    self.service_water_heating_design_and_control[attr] = value_list[1]
+            self.design_and_control_elements.serialize_index(
+                self, 1, self.service_water_heating_design_and_control
+            )
 
             self.data_structure = {
                 "id": self.u_name,
@@ -245,26 +368,21 @@ class CirculationLoop(BaseNode):
                 "service_water_heating_design_and_control": self.service_water_heating_design_and_control,
             }
 
-            for attr in service_water_piping_elements:
-                value = getattr(self, attr, None)
-                if value is not None:
-                    self.data_structure[attr] = value
+            self.service_water_piping_elements.serialize(self, self.data_structure)
 
         elif self.circulation_loop_type == "ServiceWaterHeatingDistributionSystem":
-            for attr in design_and_control_elements:
-                value_list = getattr(self, attr, None)
-                if value_list[1] is not None:
-                    self.service_water_heating_design_and_control[attr] = value_list[1]
+            self.design_and_control_elements.serialize_index(
+                self, 1, self.service_water_heating_design_and_control
+            )
 
             primary_service_water_piping = {
                 "id": self.u_name + " ServiceWaterPiping",
                 "child": self.child,
                 "service_water_heating_design_and_control": self.service_water_heating_design_and_control,
             }
-            for attr in service_water_piping_elements:
-                value = getattr(self, attr, None)
-                if value is not None:
-                    primary_service_water_piping[attr] = value
+            self.service_water_piping_elements.serialize(
+                self, primary_service_water_piping
+            )
 
             self.service_water_piping.append(primary_service_water_piping)
 
@@ -274,22 +392,17 @@ class CirculationLoop(BaseNode):
                 "service_water_piping": self.service_water_piping,
             }
 
-            for attr in service_water_heating_distribution_system_elements:
-                # design_supply_temperature exists in both the circulation loop and the swh distribution system
-                if attr == "design_supply_temperature":
-                    value = self.swh_design_supply_temperature
-                else:
-                    value = getattr(self, attr, None)
-                if value is not None:
-                    self.data_structure[attr] = value
+            self.service_water_heating_distribution_system_elements.serialize(
+                self, self.data_structure
+            )
 
         else:
-            for attr in design_and_control_elements:
-                value_list = getattr(self, attr, None)
-                if value_list[0] is not None:
-                    self.cooling_or_condensing_design_and_control[attr] = value_list[0]
-                if value_list[1] is not None:
-                    self.heating_design_and_control[attr] = value_list[1]
+            self.design_and_control_elements.serialize_index(
+                self, 0, self.cooling_or_condensing_design_and_control
+            )
+            self.design_and_control_elements.serialize_index(
+                self, 1, self.heating_design_and_control
+            )
 
             self.data_structure = {
                 "id": self.u_name,
@@ -298,18 +411,8 @@ class CirculationLoop(BaseNode):
                 "child_loops": self.child_loops,
             }
 
-            fluid_loop_elements = [
-                "reporting_name",
-                "notes",
-                "type",
-                "pump_power_per_flow_rate",
-            ]
-
-            # Iterate over the no_children_attributes list and populate if the value is not None
-            for attr in fluid_loop_elements:
-                value = getattr(self, attr, None)
-                if value is not None:
-                    self.data_structure[attr] = value
+            # Populate the attributes that are not None
+            self.fluid_loop_elements.serialize(self, self.data_structure)
 
     def insert_to_rpd(self, rmd):
 
@@ -741,236 +844,30 @@ class CirculationLoop(BaseNode):
     def determine_loop_flow_control(self):
         """Determine the flow control type for the circulation loop"""
         loop_type = self.get_inp(BDL_CirculationLoopKeywords.TYPE)
-
-        for circulation_loop_name in self.rmd.circulation_loop_names:
-            circulation_loop = self.get_obj(circulation_loop_name)
-            primary_loop = circulation_loop.get_inp(
-                BDL_CirculationLoopKeywords.PRIMARY_LOOP
-            )
-            valve_type = circulation_loop.get_inp(
-                BDL_CirculationLoopKeywords.VALVE_TYPE_2ND
-            )
-
-            if (
-                primary_loop == self.u_name
-                and valve_type == BDL_SecondaryLoopValveTypes.TWO_WAY
+        topology_index = self.rmd.get_topology_index()
+
+        for (
+            command,
+            loop_keyword,
+            valve_keywords,
+            variable_flow_value,
+            loop_types,
+        ) in self.variable_flow_connections:
+            if loop_types is not None and loop_type not in loop_types:
+                continue
+            for obj in topology_index.get_connected_objects(
+                self.u_name, command, loop_keyword
             ):
-                return FluidLoopFlowControlOptions.VARIABLE_FLOW
-
-        for system_name in self.rmd.system_names:
-            system = self.get_obj(system_name)
-            if loop_type == BDL_CirculationLoopTypes.CHW:
-                cooling_loop = system.get_inp(BDL_SystemKeywords.CHW_LOOP)
-                valve_type = system.get_inp(BDL_SystemKeywords.CHW_VALVE_TYPE)
-                if (
-                    cooling_loop == self.u_name
-                    and valve_type == BDL_SystemCoolingValveTypes.TWO_WAY
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.HW:
-                heating_loops = [
-                    system.get_inp(BDL_SystemKeywords.HW_LOOP),
-                    system.get_inp(BDL_SystemKeywords.PHW_LOOP),
-                ]
-                valve_types = [
-                    system.get_inp(BDL_SystemKeywords.HW_VALVE_TYPE),
-                    system.get_inp(BDL_SystemKeywords.PHW_VALVE_TYPE),
-                ]
-                if (
-                    self.u_name in heating_loops
-                    and BDL_SystemHeatingValveTypes.TWO_WAY in valve_types
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.CW:
-                pass
-            elif loop_type == BDL_CirculationLoopTypes.PIPE2:
-                cooling_loop = system.get_inp(BDL_SystemKeywords.CHW_LOOP)
-                heating_loop = system.get_inp(BDL_SystemKeywords.HW_LOOP)
-                cooling_valve_type = system.get_inp(BDL_SystemKeywords.CHW_VALVE_TYPE)
-                heating_valve_type = system.get_inp(BDL_SystemKeywords.HW_VALVE_TYPE)
-                if (
-                    cooling_loop == self.u_name
-                    and cooling_valve_type == BDL_SystemCoolingValveTypes.TWO_WAY
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-                if (
-                    heating_loop == self.u_name
-                    and heating_valve_type == BDL_SystemHeatingValveTypes.TWO_WAY
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.WLHP:
-                # This only sets the default value for zones, which are captured below
-                pass
-
-        for zone_name in self.rmd.zone_names:
-            zone = self.get_obj(zone_name)
-            if loop_type == BDL_CirculationLoopTypes.CHW:
-                cooling_loop = zone.get_inp(BDL_ZoneKeywords.CHW_LOOP)
-                valve_type = zone.get_inp(BDL_ZoneKeywords.CHW_VALVE_TYPE)
-                if (
-                    cooling_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.HW:
-                heating_loop = zone.get_inp(BDL_ZoneKeywords.HW_LOOP)
-                valve_type = zone.get_inp(BDL_ZoneKeywords.HW_VALVE_TYPE)
-                if (
-                    heating_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type in [
-                BDL_CirculationLoopTypes.CW,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                condensing_loop = zone.get_inp(BDL_ZoneKeywords.CW_LOOP)
-                has_valve = zone.get_inp(BDL_ZoneKeywords.CW_VALVE)
-                if (
-                    condensing_loop == self.u_name
-                    and has_valve == BDL_ZoneCondenserValveOptions.YES
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.PIPE2:
-                heating_loop = zone.get_inp(BDL_ZoneKeywords.HW_LOOP)
-                cooling_loop = zone.get_inp(BDL_ZoneKeywords.CHW_LOOP)
-                heating_valve_type = zone.get_inp(BDL_ZoneKeywords.HW_VALVE_TYPE)
-                cooling_valve_type = zone.get_inp(BDL_ZoneKeywords.CHW_VALVE_TYPE)
-                if (
-                    heating_loop == self.u_name
-                    and heating_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-                if (
-                    cooling_loop == self.u_name
-                    and cooling_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-
-        for chiller_name in self.rmd.chiller_names:
-            chiller = self.get_obj(chiller_name)
-            if loop_type == BDL_CirculationLoopTypes.CHW:
-                cooling_loop = chiller.get_inp(BDL_ChillerKeywords.CHW_LOOP)
-                valve_type = chiller.get_inp(BDL_ChillerKeywords.CHW_FLOW_CTRL)
-                if (
-                    cooling_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.HW:
-                heating_loop = chiller.get_inp(BDL_ChillerKeywords.HTREC_LOOP)
-                valve_type = chiller.get_inp(BDL_ChillerKeywords.HTREC_FLOW_CTRL)
-                if (
-                    heating_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.CW:
-                condensing_loop = chiller.get_inp(BDL_ChillerKeywords.CW_LOOP)
-                valve_type = chiller.get_inp(BDL_ChillerKeywords.CW_FLOW_CTRL)
-                if (
-                    condensing_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.PIPE2:
-                cooling_loop = chiller.get_inp(BDL_ChillerKeywords.CHW_LOOP)
-                heating_loop = chiller.get_inp(BDL_ChillerKeywords.HTREC_LOOP)
-                cooling_valve_type = chiller.get_inp(BDL_ChillerKeywords.CHW_FLOW_CTRL)
-                heating_valve_type = chiller.get_inp(
-                    BDL_ChillerKeywords.HTREC_FLOW_CTRL
-                )
-                if (
-                    cooling_loop == self.u_name
-                    and cooling_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-                if (
-                    heating_loop == self.u_name
-                    and heating_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.WLHP:
-                pass  # Unused for chillers
-
-        for boiler_name in self.rmd.boiler_names:
-            boiler = self.get_obj(boiler_name)
-
-            if loop_type in [
-                BDL_CirculationLoopTypes.CHW,
-                BDL_CirculationLoopTypes.CW,
-            ]:
-                pass  # Unused for boilers
-
-            elif loop_type in [
-                BDL_CirculationLoopTypes.HW,
-                BDL_CirculationLoopTypes.PIPE2,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                heating_loop = boiler.get_inp(BDL_BoilerKeywords.HW_LOOP)
-                valve_type = boiler.get_inp(BDL_BoilerKeywords.HW_FLOW_CTRL)
-                if (
-                    heating_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-
-        for heat_rejection_name in self.rmd.heat_rejection_names:
-            heat_rejection = self.get_obj(heat_rejection_name)
-
-            if loop_type in [
-                BDL_CirculationLoopTypes.CHW,
-                BDL_CirculationLoopTypes.HW,
-                BDL_CirculationLoopTypes.PIPE2,
-            ]:
-                pass  # Unused for heat rejections
-
-            elif loop_type in [
-                BDL_CirculationLoopTypes.CW,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                condensing_loop = heat_rejection.get_inp(
-                    BDL_HeatRejectionKeywords.CW_LOOP
-                )
-                valve_type = heat_rejection.get_inp(
-                    BDL_HeatRejectionKeywords.CW_FLOW_CTRL
-                )
-                if (
-                    condensing_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-
-        for ground_loop_hx_name in self.rmd.ground_loop_hx_names:
-            ground_loop_hx = self.get_obj(ground_loop_hx_name)
-
-            if loop_type in [
-                BDL_CirculationLoopTypes.CHW,
-                BDL_CirculationLoopTypes.HW,
-                BDL_CirculationLoopTypes.PIPE2,
-            ]:
-                pass  # Unused for ground loop heat exchangers
-            elif loop_type in [
-                BDL_CirculationLoopTypes.CW,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                condensing_loop = ground_loop_hx.get_inp(
-                    BDL_GroundLoopHXKeywords.CIRCULATION_LOOP
-                )
-                valve_type = ground_loop_hx.get_inp(
-                    BDL_GroundLoopHXKeywords.HX_FLOW_CTRL
-                )
-                if (
-                    condensing_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
+                if any(
+                    obj.get_inp(valve_keyword) == variable_flow_value
+                    for valve_keyword in valve_keywords
                 ):
                     return FluidLoopFlowControlOptions.VARIABLE_FLOW
 
         return FluidLoopFlowControlOptions.FIXED_FLOW
 
     def is_loop_operation_continuous(self):
-        for system_name in self.rmd.system_names:
-            system = self.get_obj(system_name)
+        for system in self.rmd.objects(BDL_Commands.SYSTEM):
             system_fan_schedule = system.get_inp(BDL_SystemKeywords.FAN_SCHEDULE)
             if system_fan_schedule:
                 if self.is_operation_schedule_continuous(system_fan_schedule):
@@ -980,10 +877,9 @@ class CirculationLoop(BaseNode):
     def is_operation_schedule_continuous(self, schedule_u_name):
         schedule = self.get_obj(schedule_u_name)
         if schedule:
-            hourly_values = schedule.hourly_values
-            if hourly_values:
+            if schedule.hourly_values:
                 # If hourly_values contains any 0 or -1, the system is not continuous
-                return not any([x == 0 or x == -1 for x in hourly_values])
+                return not (schedule.has_value(0) or schedule.has_value(-1))
         else:
             raise ValueError(f"Schedule {schedule_u_name} not found in the RMD.")
 
@@ -1,10 +1,14 @@
+import copy
+
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 BDL_Commands = BDLEnums.bdl_enums["Commands"]
 BDL_ConstructionKeywords = BDLEnums.bdl_enums["ConstructionKeywords"]
 BDL_MaterialTypes = BDLEnums.bdl_enums["MaterialTypes"]
+BDL_ConstructionTypes = BDLEnums.bdl_enums["ConstructionTypes"]
 
 
 class Construction(BaseNode):
@@ -12,12 +16,29 @@ class Construction(BaseNode):
 
     bdl_command = BDL_Commands.CONSTRUCTION
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "classification",
+            "surface_construction_input_option",
+            "fraction_framing",
+            "u_factor",
+            "c_factor",
+            "f_factor",
+            "has_radiant_heating",
+            "has_radiant_cooling",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.bdl_obj_instances[u_name] = self
 
         self.construction_data_structure = {}
         self.material_references = None
+        # {(exterior air film resistance, interior air film resistance): construction data structure}
+        self.surface_constructions = {}
 
         # data elements with children
         self.primary_layers = []
@@ -74,21 +95,38 @@ class Construction(BaseNode):
             "r_values": self.r_values,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "classification",
-            "surface_construction_input_option",
-            "fraction_framing",
-            "u_factor",
-            "c_factor",
-            "f_factor",
-            "has_radiant_heating",
-            "has_radiant_cooling",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.construction_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.construction_data_structure)
+
+    def get_surface_construction(
+        self, ext_air_film_resistance=0.0, int_air_film_resistance=0.0
+    ) -> dict:
+        """
+        Return the construction data structure as used by a surface, with the exterior air film resistance added to
+        the u_factor and the interior air film resistance removed from a simplified construction's simplified material
+        r_value. Each variant is created once and shared by all surfaces that use it, so it must not be modified.
+        :param ext_air_film_resistance: (float) exterior air film resistance to add to the u_factor
+        :param int_air_film_resistance: (float) total interior air film resistance of the surface
+        :return: construction data structure
+        """
+        key = (ext_air_film_resistance, int_air_film_resistance)
+        surface_construction = self.surface_constructions.get(key)
+        if surface_construction is not None:
+            return surface_construction
+
+        surface_construction = copy.deepcopy(self.construction_data_structure)
+        u_factor = surface_construction.get("u_factor")
+        if u_factor:
+            if ext_air_film_resistance:
+                surface_construction["u_factor"] = 1 / (
+                    1 / u_factor + ext_air_film_resistance
+                )
+            if (
+                self.get_inp(BDL_ConstructionKeywords.TYPE)
+                == BDL_ConstructionTypes.U_VALUE
+            ):
+                surface_construction["primary_layers"][0]["r_value"] = (
+                    1 / u_factor - int_air_film_resistance
+                )
+        self.surface_constructions[key] = surface_construction
+        return surface_construction
@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 EnergySourceOptions = SchemaEnums.schema_enums["EnergySourceOptions"]
@@ -28,6 +29,44 @@ class DomesticWaterHeater(BaseNode):
         BDL_DWHeaterLocationOptions.ZONE: ComponentLocationOptions.IN_ZONE,
     }
 
+    tank_data_elements = DataGroupSerializer(
+        [
+            "storage_capacity",
+            "type",
+            "height",
+            "interior_insulation",
+            "exterior_insulation",
+            "location",
+            "location_zone",
+        ]
+    )
+
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "heater_fuel_type",
+            "distribution_system",
+            "efficiency_metric_types",
+            "efficiency_metric_values",
+            "first_hour_rating",
+            "input_power",
+            "rated_capacity",
+            "minimum_capacity",
+            "recovery_efficiency",
+            "setpoint_temperature",
+            "compressor_location",
+            "compressor_zone",
+            "compressor_heat_rejection_source",
+            "compressor_heat_rejection_zone",
+            "draft_fan_power",
+            "has_electrical_ignition",
+            "heater_type",
+            "status_type",
+            "hot_water_loop",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.domestic_water_heater_names.append(u_name)
@@ -190,50 +229,10 @@ class DomesticWaterHeater(BaseNode):
 
         if self.storage_capacity is not None and self.storage_capacity > 0:
             self.tank["id"] = self.u_name + " Tank"
-            tank_data_elements = [
-                "storage_capacity",
-                "type",
-                "height",
-                "interior_insulation",
-                "exterior_insulation",
-                "location",
-                "location_zone",
-            ]
-
-            for attr in tank_data_elements:
-                value = getattr(self, attr, None)
-                if value is not None:
-                    self.tank[attr] = value
-
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "heater_fuel_type",
-            "distribution_system",
-            "efficiency_metric_types",
-            "efficiency_metric_values",
-            "first_hour_rating",
-            "input_power",
-            "rated_capacity",
-            "minimum_capacity",
-            "recovery_efficiency",
-            "setpoint_temperature",
-            "compressor_location",
-            "compressor_zone",
-            "compressor_heat_rejection_source",
-            "compressor_heat_rejection_zone",
-            "draft_fan_power",
-            "has_electrical_ignition",
-            "heater_type",
-            "status_type",
-            "hot_water_loop",
-        ]
+            self.tank_data_elements.serialize(self, self.tank)
 
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert window object into the rpd data structure."""
@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.child_node import ChildNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 SubsurfaceClassificationOptions = SchemaEnums.schema_enums[
@@ -30,6 +31,30 @@ class Door(ChildNode):
 
     bdl_command = BDL_Commands.DOOR
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "classification",
+            "subclassification",
+            "is_operable",
+            "framing_type",
+            "glazed_area",
+            "opaque_area",
+            "u_factor",
+            "dynamic_glazing_type",
+            "solar_heat_gain_coefficient",
+            "maximum_solar_heat_gain_coefficient",
+            "has_shading_overhang",
+            "has_shading_sidefins",
+            "has_manual_interior_shades",
+            "solar_transmittance_multiplier_summer",
+            "solar_transmittance_multiplier_winter",
+            "has_automatic_shades",
+            "status_type",
+        ]
+    )
+
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
         self.rmd.door_names.append(u_name)
@@ -79,33 +104,8 @@ class Door(ChildNode):
             "id": self.u_name,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "classification",
-            "subclassification",
-            "is_operable",
-            "framing_type",
-            "glazed_area",
-            "opaque_area",
-            "u_factor",
-            "dynamic_glazing_type",
-            "solar_heat_gain_coefficient",
-            "maximum_solar_heat_gain_coefficient",
-            "has_shading_overhang",
-            "has_shading_sidefins",
-            "has_manual_interior_shades",
-            "solar_transmittance_multiplier_summer",
-            "solar_transmittance_multiplier_winter",
-            "has_automatic_shades",
-            "status_type",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.door_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.door_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert window object into the rpd data structure."""
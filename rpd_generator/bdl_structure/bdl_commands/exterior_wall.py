@@ -1,9 +1,8 @@
-import copy
-
 from rpd_generator.bdl_structure.parent_node import ParentNode
 from rpd_generator.bdl_structure.child_node import ChildNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 SurfaceClassificationOptions = SchemaEnums.schema_enums["SurfaceClassificationOptions"]
@@ -30,6 +29,34 @@ class ExteriorWall(ChildNode, ParentNode):
     CEILING_TILT_THRESHOLD = 60
     FLOOR_TILT_THRESHOLD = 120
 
+    optical_property_attributes = DataGroupSerializer(
+        [
+            "optical_property_id",
+            "absorptance_thermal_exterior",
+            "absorptance_solar_exterior",
+            "absorptance_visible_exterior",
+            "absorptance_thermal_interior",
+            "absorptance_solar_interior",
+            "absorptance_visible_interior",
+        ],
+        prefix="optical_property_",
+    )
+
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "classification",
+            "area",
+            "tilt",
+            "azimuth",
+            "adjacent_to",
+            "adjacent_zone",
+            "does_cast_shade",
+            "status_type",
+        ]
+    )
+
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
         self.rmd.ext_wall_names.append(u_name)
@@ -140,28 +167,9 @@ class ExteriorWall(ChildNode, ParentNode):
 
     def populate_data_group(self):
         """Populate schema structure for exterior wall object."""
-        self.construction = copy.deepcopy(
-            self.get_obj(
-                self.get_inp(BDL_ExteriorWallKeywords.CONSTRUCTION)
-            ).construction_data_structure
-        )
         self.account_for_air_film_resistance()
 
-        optical_property_attributes = [
-            "optical_property_id",
-            "absorptance_thermal_exterior",
-            "absorptance_solar_exterior",
-            "absorptance_visible_exterior",
-            "absorptance_thermal_interior",
-            "absorptance_solar_interior",
-            "absorptance_visible_interior",
-        ]
-
-        for attr in optical_property_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                attr = attr.replace("optical_property_", "")
-                self.optical_properties[attr] = value
+        self.optical_property_attributes.serialize(self, self.optical_properties)
 
         self.exterior_wall_data_structure = {
             "id": self.u_name,
@@ -170,23 +178,8 @@ class ExteriorWall(ChildNode, ParentNode):
             "optical_properties": self.optical_properties,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "classification",
-            "area",
-            "tilt",
-            "azimuth",
-            "adjacent_to",
-            "adjacent_zone",
-            "does_cast_shade",
-            "status_type",
-        ]
-
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.exterior_wall_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.exterior_wall_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert exterior wall object into the rpd data structure."""
@@ -195,25 +188,19 @@ class ExteriorWall(ChildNode, ParentNode):
 
     def account_for_air_film_resistance(self):
         """
-        Add exterior air film resistance to the construction object's u_factor.
-        Remove interior air film resistance from a simplified construction's simplified material r_value.
+        Use the construction with exterior air film resistance added to its u_factor, and with interior air film
+        resistance removed from a simplified construction's simplified material r_value.
         """
         construction_obj = self.get_obj(
             self.get_inp(BDL_ExteriorWallKeywords.CONSTRUCTION)
         )
-        spec_method = construction_obj.get_inp(BDL_ConstructionKeywords.TYPE)
-        u_factor = self.construction.get("u_factor")
         ext_air_film_resistance = 0.17
-        if u_factor:
-            self.construction["u_factor"] = 1 / (1 / u_factor + ext_air_film_resistance)
-
-            if spec_method == BDL_ConstructionTypes.U_VALUE:
-                location = self.get_inp(BDL_ExteriorWallKeywords.LOCATION)
-                int_air_film_resistance = (
-                    0.61
-                    if location == BDL_WallLocationOptions.TOP
-                    else 0.92 if location == BDL_WallLocationOptions.BOTTOM else 0.68
-                )
-                self.construction["primary_layers"][0]["r_value"] = (
-                    1 / u_factor - int_air_film_resistance
-                )
+        location = self.get_inp(BDL_ExteriorWallKeywords.LOCATION)
+        int_air_film_resistance = (
+            0.61
+            if location == BDL_WallLocationOptions.TOP
+            else 0.92 if location == BDL_WallLocationOptions.BOTTOM else 0.68
+        )
+        self.construction = construction_obj.get_surface_construction(
+            ext_air_film_resistance, int_air_film_resistance
+        )
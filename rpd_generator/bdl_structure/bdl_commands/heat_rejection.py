@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 HeatRejectionOptions = SchemaEnums.schema_enums["HeatRejectionOptions"]
@@ -38,6 +39,27 @@ class HeatRejection(BaseNode):
         BDL_HeatRejectionFanSpeedControlOptions.DISCHARGE_DAMPER: HeatRejectionFanSpeedControlOptions.OTHER,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "loop",
+            "type",
+            "fan_type",
+            "fluid",
+            "range",
+            "approach",
+            "fan_shaft_power",
+            "fan_motor_efficiency",
+            "fan_motor_nameplate_power",
+            "fan_speed_control",
+            "design_wetbulb_temperature",
+            "design_water_flowrate",
+            "rated_water_flowrate",
+            "leaving_water_setpoint_temperature",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.heat_rejection_names.append(u_name)
@@ -122,30 +144,8 @@ class HeatRejection(BaseNode):
             "id": self.u_name,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "loop",
-            "type",
-            "fan_type",
-            "fluid",
-            "range",
-            "approach",
-            "fan_shaft_power",
-            "fan_motor_efficiency",
-            "fan_motor_nameplate_power",
-            "fan_speed_control",
-            "design_wetbulb_temperature",
-            "design_water_flowrate",
-            "rated_water_flowrate",
-            "leaving_water_setpoint_temperature",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.heat_rejection_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.heat_rejection_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert window object into the rpd data structure."""
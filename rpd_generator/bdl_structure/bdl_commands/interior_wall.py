@@ -1,9 +1,8 @@
-import copy
-
 from rpd_generator.bdl_structure.parent_node import ParentNode
 from rpd_generator.bdl_structure.child_node import ChildNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 SurfaceClassificationOptions = SchemaEnums.schema_enums["SurfaceClassificationOptions"]
@@ -40,6 +39,34 @@ class InteriorWall(
         BDL_InteriorWallTypes.INTERNAL: SurfaceAdjacencyOptions.INTERIOR,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "classification",
+            "area",
+            "tilt",
+            "azimuth",
+            "adjacent_to",
+            "adjacent_zone",
+            "does_cast_shade",
+            "status_type",
+        ]
+    )
+
+    optical_property_attributes = DataGroupSerializer(
+        [
+            "optical_property_id",
+            "absorptance_thermal_exterior",
+            "absorptance_solar_exterior",
+            "absorptance_visible_exterior",
+            "absorptance_thermal_interior",
+            "absorptance_solar_interior",
+            "absorptance_visible_interior",
+        ],
+        prefix="optical_property_",
+    )
+
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
         self.rmd.int_wall_names.append(u_name)
@@ -166,29 +193,9 @@ class InteriorWall(
 
     def populate_data_group(self):
         """Populate schema structure for interior wall object."""
-        self.construction = copy.deepcopy(
-            self.get_obj(
-                self.get_inp(BDL_InteriorWallKeywords.CONSTRUCTION)
-            ).construction_data_structure
-        )
-
         self.account_for_air_film_resistance()
 
-        optical_property_attributes = [
-            "optical_property_id",
-            "absorptance_thermal_exterior",
-            "absorptance_solar_exterior",
-            "absorptance_visible_exterior",
-            "absorptance_thermal_interior",
-            "absorptance_solar_interior",
-            "absorptance_visible_interior",
-        ]
-
-        for attr in optical_property_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                attr = attr.replace("optical_property_", "")
-                self.optical_properties[attr] = value
+        self.optical_property_attributes.serialize(self, self.optical_properties)
 
         self.interior_wall_data_structure = {
             "id": self.u_name,
@@ -197,24 +204,8 @@ class InteriorWall(
             "optical_properties": self.optical_properties,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "classification",
-            "area",
-            "tilt",
-            "azimuth",
-            "adjacent_to",
-            "adjacent_zone",
-            "does_cast_shade",
-            "status_type",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.interior_wall_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.interior_wall_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert interior wall object into the rpd data structure."""
@@ -223,14 +214,13 @@ class InteriorWall(
 
     def account_for_air_film_resistance(self):
         """
-        Set the r_value for a simplified construction's simplified material based on the u_factor.
+        Use the construction with interior air film resistance on both sides removed from a simplified construction's
+        simplified material r_value.
         """
         construction_obj = self.get_obj(
             self.get_inp(BDL_InteriorWallKeywords.CONSTRUCTION)
         )
-        spec_method = construction_obj.get_inp(BDL_ConstructionKeywords.TYPE)
         wall_type = self.get_inp(BDL_InteriorWallKeywords.INT_WALL_TYPE)
-        u_factor = self.construction.get("u_factor")
         int_air_film_resistance = 0
         if wall_type in [
             BDL_InteriorWallTypes.STANDARD,
@@ -242,7 +232,6 @@ class InteriorWall(
                 if location == BDL_WallLocationOptions.TOP
                 else 0.92 if location == BDL_WallLocationOptions.BOTTOM else 0.68
             )
-        if u_factor and spec_method == BDL_ConstructionTypes.U_VALUE:
-            self.construction["primary_layers"][0]["r_value"] = (
-                1 / u_factor - 2 * int_air_film_resistance
-            )
+        self.construction = construction_obj.get_surface_construction(
+            int_air_film_resistance=2 * int_air_film_resistance
+        )
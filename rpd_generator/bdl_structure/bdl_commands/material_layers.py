@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.bdl_structure.base_definition import BaseDefinition
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 BDL_Commands = BDLEnums.bdl_enums["Commands"]
@@ -14,6 +15,18 @@ class Material(BaseNode):
 
     bdl_command = BDL_Commands.MATERIAL
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "thickness",
+            "thermal_conductivity",
+            "density",
+            "specific_heat",
+            "r_value",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.bdl_obj_instances[u_name] = self
@@ -57,21 +70,8 @@ class Material(BaseNode):
         """Populate schema structure for material object."""
         self.material_data_structure["id"] = self.u_name
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "thickness",
-            "thermal_conductivity",
-            "density",
-            "specific_heat",
-            "r_value",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.material_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.material_data_structure)
 
 
 class Layer(BaseDefinition):
@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 PumpSpecificationMethodOptions = SchemaEnums.schema_enums[
@@ -23,6 +24,20 @@ class Pump(BaseNode):
         BDL_PumpCapacityControlOptions.VAR_SPEED_PUMP: PumpSpeedControlOptions.VARIABLE_SPEED,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "loop_or_piping",
+            "specification_method",
+            "design_electric_power",
+            "design_head",
+            "impeller_efficiency",
+            "motor_efficiency",
+            "speed_control",
+            "design_flow",
+            "is_flow_sized_based_on_design_day",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.pump_names.append(u_name)
@@ -105,29 +120,13 @@ class Pump(BaseNode):
     def populate_data_group(self):
         """Populate the schema data structure for the pump object."""
 
-        no_children_attributes = [
-            "loop_or_piping",
-            "specification_method",
-            "design_electric_power",
-            "design_head",
-            "impeller_efficiency",
-            "motor_efficiency",
-            "speed_control",
-            "design_flow",
-            "is_flow_sized_based_on_design_day",
-        ]
-
         for i in range(self.qty):
             pump_data_structure = {
                 "id": self.u_name + f" {i}".replace(" 0", ""),
                 "output_validation_points": [],
             }
-            # Iterate over the no_children_attributes list and populate if the value is not None
-            for attr in no_children_attributes:
-                values = getattr(self, attr, None)
-                value = values[i]
-                if value is not None:
-                    pump_data_structure[attr] = value
+            # Populate the i-th value of the attributes that are not None
+            self.no_children_attributes.serialize_index(self, i, pump_data_structure)
             self.pump_data_structures.append(pump_data_structure)
 
     def insert_to_rpd(self, rmd):
@@ -2,6 +2,7 @@ from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.bdl_structure.base_definition import BaseDefinition
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 ScheduleOptions = SchemaEnums.schema_enums["ScheduleOptions"]
 ScheduleSequenceOptions = SchemaEnums.schema_enums["ScheduleSequenceOptions"]
@@ -130,6 +131,27 @@ class Schedule(BaseNode):
         BDL_ScheduleTypes.FRAC_DESIGN: ScheduleOptions.MULTIPLIER_DIMENSIONLESS,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "purpose",
+            "sequence_type",
+            "hourly_values",
+            "hourly_heating_design_day",
+            "hourly_cooling_design_day",
+            "event_times",
+            "event_values",
+            "event_times_heating_design_day",
+            "event_values_heating_design_day",
+            "event_times_cooling_design_day",
+            "event_values_cooling_design_day",
+            "type",
+            "prescribed_type",
+            "is_modified_for_workaround",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.bdl_obj_instances[u_name] = self
@@ -156,9 +178,86 @@ class Schedule(BaseNode):
         self.prescribed_type = PrescribedScheduleOptions.NOT_APPLICABLE
         self.is_modified_for_workaround = None
 
+        # Statistics of hourly_values, computed on first request and shared by every object that uses the schedule
+        self.statistics = {}
+        self.statistics_hourly_values = None
+
     def __repr__(self):
         return f"Schedule(u_name='{self.u_name}')"
 
+    def get_statistic(self, key, calculate):
+        """
+        Return a statistic of the hourly values, calculating it only on the first request.
+        :param key: (tuple) identifies the statistic
+        :param calculate: function without arguments that calculates the statistic
+        """
+        # hourly_values may be replaced after the schedule is populated, e.g. the ground temperature schedule
+        if self.statistics_hourly_values is not self.hourly_values:
+            self.statistics = {}
+            self.statistics_hourly_values = self.hourly_values
+        if key not in self.statistics:
+            self.statistics[key] = calculate()
+        return self.statistics[key]
+
+    def get_max_value(self):
+        """Return the maximum hourly value, or None if there are no hourly values."""
+        return self.get_statistic(("max",), lambda: self.try_max(self.hourly_values))
+
+    def get_min_value(self):
+        """Return the minimum hourly value, or None if there are no hourly values."""
+        return self.get_statistic(
+            ("min",),
+            lambda: (
+                min(self.hourly_values)
+                if isinstance(self.hourly_values, list) and self.hourly_values
+                else None
+            ),
+        )
+
+    def get_value_mask(self, value) -> int:
+        """
+        Return a bit mask of the hours whose value is equal to value. Bit i is set when hour i has the value.
+        :param value: (float) hourly value, e.g. the -999 flag
+        """
+
+        def calculate():
+            if not self.hourly_values:
+                return 0
+            return int(
+                "".join(
+                    "1" if hourly_value == value else "0"
+                    for hourly_value in reversed(self.hourly_values)
+                ),
+                2,
+            )
+
+        return self.get_statistic(("mask", value), calculate)
+
+    def has_value(self, value) -> bool:
+        """Return True if any hour has the value."""
+        return self.get_value_mask(value) != 0
+
+    def is_always_value(self, value) -> bool:
+        """Return True if every hour has the value."""
+        return (
+            bool(self.hourly_values)
+            and self.get_value_mask(value) == (1 << len(self.hourly_values)) - 1
+        )
+
+    def has_value_during(self, value, schedule, schedule_value) -> bool:
+        """
+        Return True if any hour has the value while another schedule has schedule_value, e.g. a -999 flag of a
+        minimum outdoor air schedule while the fan schedule is on.
+        :param value: (float) hourly value of this schedule
+        :param schedule: (Schedule) other schedule
+        :param schedule_value: (float) hourly value of the other schedule
+        """
+        return self.get_statistic(
+            ("during", value, schedule.u_name, schedule_value),
+            lambda: self.get_value_mask(value) & schedule.get_value_mask(schedule_value)
+            != 0,
+        )
+
     def populate_data_elements(self):
         """Populate data elements for schedule object."""
         # Get the type of schedule
@@ -180,7 +279,7 @@ class Schedule(BaseNode):
                 if isinstance(self.get_inp(BDL_ScheduleKeywords.MONTH), list)
                 else [self.get_inp(BDL_ScheduleKeywords.MONTH)]
             )
-            ann_months = [int(float(val)) for val in ann_months]
+            ann_months = [int(self.try_float(val)) for val in ann_months]
 
             # Get the day value where a new week-schedule begins
             ann_days = (
@@ -188,7 +287,7 @@ class Schedule(BaseNode):
                 if isinstance(self.get_inp(BDL_ScheduleKeywords.DAY), list)
                 else [self.get_inp(BDL_ScheduleKeywords.DAY)]
             )
-            ann_days = [int(float(val)) for val in ann_days]
+            ann_days = [int(self.try_float(val)) for val in ann_days]
 
             week_schedules = self.get_inp(BDL_ScheduleKeywords.WEEK_SCHEDULES)
             week_schedules = (
@@ -272,30 +371,8 @@ class Schedule(BaseNode):
             "id": self.u_name,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "purpose",
-            "sequence_type",
-            "hourly_values",
-            "hourly_heating_design_day",
-            "hourly_cooling_design_day",
-            "event_times",
-            "event_values",
-            "event_times_heating_design_day",
-            "event_values_heating_design_day",
-            "event_times_cooling_design_day",
-            "event_values_cooling_design_day",
-            "type",
-            "prescribed_type",
-            "is_modified_for_workaround",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.schedule_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.schedule_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert window object into the rpd data structure."""
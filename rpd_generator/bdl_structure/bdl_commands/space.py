@@ -2,6 +2,7 @@ from rpd_generator.bdl_structure.parent_node import ParentNode
 from rpd_generator.bdl_structure.child_node import ChildNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 EnergySourceOptions = SchemaEnums.schema_enums["EnergySourceOptions"]
@@ -18,6 +19,55 @@ class Space(ChildNode, ParentNode):
     Derived from ParentNode to access the child INTERIOR-WALL, EXTERIOR-WALL, UNDERGROUND-WALL object(s) through the 'children' attribute.
     """
 
+    # Every attribute of a space is set in __init__ and stored in a slot, so spaces do not allocate a __dict__
+    __slots__ = (
+        "rmd",
+        "u_name",
+        "reporting_name",
+        "notes",
+        "keyword_value_pairs",
+        "children",
+        "parent",
+        "space_data_structure",
+        "zone",
+        "interior_lighting",
+        "miscellaneous_equipment",
+        "service_water_heating_uses",
+        "floor_area",
+        "number_of_occupants",
+        "occupant_multiplier_schedule",
+        "occupant_sensible_heat_gain",
+        "occupant_latent_heat_gain",
+        "status_type",
+        "function",
+        "envelope_space_type",
+        "lighting_space_type",
+        "ventilation_space_type",
+        "service_water_heating_space_type",
+        "int_ltg_id",
+        "int_ltg_reporting_name",
+        "int_ltg_notes",
+        "int_ltg_purpose_type",
+        "int_ltg_power_per_area",
+        "int_ltg_lighting_multiplier_schedule",
+        "int_ltg_occupancy_control_type",
+        "int_ltg_daylighting_control_type",
+        "int_ltg_are_schedules_used_for_modeling_occupancy_control",
+        "int_ltg_are_schedules_used_for_modeling_daylighting_control",
+        "misc_eq_id",
+        "misc_eq_reporting_name",
+        "misc_eq_notes",
+        "misc_eq_energy_type",
+        "misc_eq_power",
+        "misc_eq_multiplier_schedule",
+        "misc_eq_sensible_fraction",
+        "misc_eq_latent_fraction",
+        "misc_eq_remaining_fraction_to_loop",
+        "misc_eq_energy_from_loop",
+        "misc_eq_type",
+        "misc_eq_has_automatic_control",
+    )
+
     bdl_command = BDL_Commands.SPACE
 
     infiltration_algorithm_map = {
@@ -36,6 +86,24 @@ class Space(ChildNode, ParentNode):
         BDL_InternalEnergySourceOptions.PROCESS: EnergySourceOptions.NONE,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "floor_area",
+            "number_of_occupants",
+            "occupant_multiplier_schedule",
+            "occupant_sensible_heat_gain",
+            "occupant_latent_heat_gain",
+            "status_type",
+            "function",
+            "envelope_space_type",
+            "lighting_space_type",
+            "ventilation_space_type",
+            "service_water_heating_space_type",
+        ]
+    )
+
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
         ParentNode.__init__(self, u_name, rmd)
@@ -131,27 +199,8 @@ class Space(ChildNode, ParentNode):
             "service_water_heating_uses": self.service_water_heating_uses,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "floor_area",
-            "number_of_occupants",
-            "occupant_multiplier_schedule",
-            "occupant_sensible_heat_gain",
-            "occupant_latent_heat_gain",
-            "status_type",
-            "function",
-            "envelope_space_type",
-            "lighting_space_type",
-            "ventilation_space_type",
-            "service_water_heating_space_type",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.space_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.space_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert space object into the rpd data structure."""
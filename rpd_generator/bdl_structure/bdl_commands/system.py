@@ -64,6 +64,145 @@ BDL_ReturnAirPathOptions = BDLEnums.bdl_enums["SystemReturnAirPathOptions"]
 class System(ParentNode):
     """System object in the tree."""
 
+    # Systems hold the largest number of attributes of any object, which are stored in slots instead of a __dict__
+    __slots__ = (
+        "rmd",
+        "u_name",
+        "reporting_name",
+        "notes",
+        "keyword_value_pairs",
+        "children",
+        "parent_building_segment",
+        "sys_id",
+        "system_data_structure",
+        "omit",
+        "is_terminal",
+        "is_zonal_system",
+        "is_derived_system",
+        "bdl_output_cool_type",
+        "bdl_output_heat_type",
+        "fan_system",
+        "heating_system",
+        "cooling_system",
+        "preheat_system",
+        "fan_sys_id",
+        "fan_sys_reporting_name",
+        "fan_sys_notes",
+        "fan_sys_supply_fans",
+        "fan_sys_return_fans",
+        "fan_sys_exhaust_fans",
+        "fan_sys_relief_fans",
+        "fan_sys_air_economizer",
+        "fan_sys_air_energy_recovery",
+        "fan_sys_temperature_control",
+        "fan_sys_operation_during_occupied",
+        "fan_sys_operation_during_unoccupied",
+        "fan_sys_has_lockout_central_heat_during_unoccupied",
+        "fan_sys_fan_control",
+        "fan_sys_reset_differential_temperature",
+        "fan_sys_supply_air_temperature_reset_load_fraction",
+        "fan_sys_supply_air_temperature_reset_schedule",
+        "fan_sys_fan_volume_reset_type",
+        "fan_sys_fan_volume_reset_fraction",
+        "fan_sys_operating_schedule",
+        "fan_sys_minimum_airflow",
+        "fan_sys_minimum_outdoor_airflow",
+        "fan_sys_maximum_outdoor_airflow",
+        "fan_sys_air_filter_merv_rating",
+        "fan_sys_has_fully_ducted_return",
+        "fan_sys_demand_control_ventilation_control",
+        "heat_sys_id",
+        "heat_sys_reporting_name",
+        "heat_sys_notes",
+        "heat_sys_type",
+        "heat_sys_energy_source_type",
+        "heat_sys_hot_water_loop",
+        "heat_sys_water_source_heat_pump_loop",
+        "heat_sys_design_capacity",
+        "heat_sys_rated_capacity",
+        "heat_sys_oversizing_factor",
+        "heat_sys_is_sized_based_on_design_day",
+        "heat_sys_heating_coil_setpoint",
+        "heat_sys_efficiency_metric_values",
+        "heat_sys_efficiency_metric_types",
+        "heat_sys_heatpump_auxiliary_heat_type",
+        "heat_sys_heatpump_auxiliary_heat_high_shutoff_temperature",
+        "heat_sys_heatpump_low_shutoff_temperature",
+        "heat_sys_humidification_type",
+        "cool_sys_id",
+        "cool_sys_reporting_name",
+        "cool_sys_notes",
+        "cool_sys_type",
+        "cool_sys_design_total_cool_capacity",
+        "cool_sys_design_sensible_cool_capacity",
+        "cool_sys_rated_total_cool_capacity",
+        "cool_sys_rated_sensible_cool_capacity",
+        "cool_sys_oversizing_factor",
+        "cool_sys_is_sized_based_on_design_day",
+        "cool_sys_chilled_water_loop",
+        "cool_sys_condenser_water_loop",
+        "cool_sys_efficiency_metric_values",
+        "cool_sys_efficiency_metric_types",
+        "cool_sys_dehumidification_type",
+        "cool_sys_turndown_ratio",
+        "preheat_sys_id",
+        "preheat_sys_reporting_name",
+        "preheat_sys_notes",
+        "preheat_sys_type",
+        "preheat_sys_energy_source_type",
+        "preheat_sys_hot_water_loop",
+        "preheat_sys_water_source_heat_pump_loop",
+        "preheat_sys_design_capacity",
+        "preheat_sys_rated_capacity",
+        "preheat_sys_oversizing_factor",
+        "preheat_sys_is_sized_based_on_design_day",
+        "preheat_sys_heating_coil_setpoint",
+        "preheat_sys_efficiency_metric_values",
+        "preheat_sys_efficiency_metric_types",
+        "preheat_sys_heatpump_auxiliary_heat_type",
+        "preheat_sys_heatpump_auxiliary_heat_high_shutoff_temperature",
+        "preheat_sys_heatpump_low_shutoff_temperature",
+        "preheat_sys_humidification_type",
+        "cooling_supply_fan",
+        "return_fan",
+        "relief_fan",
+        "heating_supply_fan",
+        "fan_id",
+        "fan_reporting_name",
+        "fan_notes",
+        "fan_design_airflow",
+        "fan_is_airflow_sized_based_on_design_day",
+        "fan_specification_method",
+        "fan_design_electric_power",
+        "fan_design_pressure_rise",
+        "fan_motor_nameplate_power",
+        "fan_shaft_power",
+        "fan_total_efficiency",
+        "fan_motor_efficiency",
+        "fan_motor_heat_to_airflow_fraction",
+        "fan_motor_heat_to_zone_fraction",
+        "fan_motor_location_zone",
+        "fan_status_type",
+        "fan_output_validation_points",
+        "air_econ_id",
+        "air_econ_reporting_name",
+        "air_econ_notes",
+        "air_econ_type",
+        "air_econ_high_limit_shutoff_temperature",
+        "air_econ_is_integrated",
+        "air_energy_recovery_id",
+        "air_energy_recovery_reporting_name",
+        "air_energy_recovery_notes",
+        "air_energy_recovery_type",
+        "air_energy_recovery_enthalpy_recovery_ratio",
+        "air_energy_recovery_energy_recovery_operation",
+        "air_energy_recovery_energy_recovery_supply_air_temperature_control",
+        "air_energy_recovery_design_sensible_effectiveness",
+        "air_energy_recovery_design_latent_effectiveness",
+        "air_energy_recovery_outdoor_airflow",
+        "air_energy_recovery_exhaust_airflow",
+    )
+
     bdl_command = BDL_Commands.SYSTEM
     zonal_system_types = [
         BDL_SystemTypes.UHT,
@@ -847,53 +986,34 @@ class System(ParentNode):
             return
 
         else:
-            for attr in dir(self):
-                value = getattr(self, attr, None)
-
-                if value is None:
-                    continue
-
-                if attr.startswith("fan_sys_"):
-                    self.fan_system[attr.split("fan_sys_")[1]] = value
-
-                elif attr.startswith("heat_sys_"):
-                    self.heating_system[attr.split("heat_sys_")[1]] = value
-
-                elif attr.startswith("cool_sys_"):
-                    self.cooling_system[attr.split("cool_sys_")[1]] = value
-
-                elif attr.startswith("preheat_sys_"):
-                    self.preheat_system[attr.split("preheat_sys_")[1]] = value
-
-                elif attr.startswith("fan_") and attr[4:7] != "sys":
-                    key = attr.split("fan_")[1]  # Get the key by removing 'fan_' prefix
-                    for i, fan_dict_name in enumerate(
-                        [
-                            "cooling_supply_fan",
-                            "return_fan",
-                            "relief_fan",
-                            "heating_supply_fan",
-                        ]
-                    ):
-                        # Check if there is a non-None value for the current fan type
-                        if getattr(self, "fan_id")[i] is not None:
-                            fan_dict = getattr(self, fan_dict_name)
-                            if getattr(self, attr)[i] is not None:
-                                fan_dict[key] = getattr(self, attr)[i]
-                            # update the fan dictionary
-                            setattr(self, fan_dict_name, fan_dict)
-
-                elif attr.startswith("air_econ_"):
-                    value = getattr(self, attr, None)
-                    if value is not None:
-                        self.fan_sys_air_economizer[attr.split("air_econ_")[1]] = value
-
-                elif attr.startswith("air_energy_recovery_"):
-                    value = getattr(self, attr, None)
-                    if value is not None:
-                        self.fan_sys_air_energy_recovery[
-                            attr.split("air_energy_recovery_")[1]
-                        ] = value
+            self.get_prefix_serializer("fan_sys_").serialize(self, self.fan_system)
+            self.get_prefix_serializer("heat_sys_").serialize(self, self.heating_system)
+            self.get_prefix_serializer("cool_sys_").serialize(self, self.cooling_system)
+            self.get_prefix_serializer("preheat_sys_").serialize(
+                self, self.preheat_system
+            )
+            self.get_prefix_serializer("air_econ_").serialize(
+                self, self.fan_sys_air_economizer
+            )
+            self.get_prefix_serializer("air_energy_recovery_").serialize(
+                self, self.fan_sys_air_energy_recovery
+            )
+
+            # Fan attributes are lists of the cooling supply, return, relief and heating supply fan values
+            fan_serializer = self.get_prefix_serializer("fan_", "fan_sys")
+            for i, fan_dict_name in enumerate(
+                [
+                    "cooling_supply_fan",
+                    "return_fan",
+                    "relief_fan",
+                    "heating_supply_fan",
+                ]
+            ):
+                # Check if there is a non-None value for the current fan type
+                if self.fan_id[i] is not None:
+                    fan_serializer.serialize_index(
+                        self, i, getattr(self, fan_dict_name)
+                    )
 
             for fan_dict_name in [
                 "cooling_supply_fan",
@@ -1596,23 +1716,28 @@ class System(ParentNode):
     def get_loop_energy_source(self, loop):
         """Get the energy source type for the loop. Used to populate the energy_source_type."""
         energy_source_set = set()
-        for boiler_name in self.rmd.boiler_names:
-            boiler = self.get_obj(boiler_name)
+        topology_index = self.rmd.get_topology_index()
+        for boiler in topology_index.get_connected_objects(
+            loop.u_name, BDL_Commands.BOILER
+        ):
             if boiler.loop == loop.u_name:
                 energy_source_set.add(boiler.energy_source_type)
 
-        for steam_meter_name in self.rmd.steam_meter_names:
-            steam_meter = self.get_obj(steam_meter_name)
+        for steam_meter in topology_index.get_connected_objects(
+            loop.u_name, BDL_Commands.STEAM_METER
+        ):
             if steam_meter.loop == loop.u_name:
                 energy_source_set.add(steam_meter.energy_source_type)
 
-        for chiller_name in self.rmd.chiller_names:
-            chiller = self.get_obj(chiller_name)
+        for chiller in topology_index.get_connected_objects(
+            loop.u_name, BDL_Commands.CHILLER
+        ):
             if chiller.heat_recovery_loop == loop.u_name:
                 energy_source_set.add(EnergySourceOptions.ELECTRICITY)
 
-        for domestic_water_heater_name in self.rmd.domestic_water_heater_names:
-            domestic_water_heater = self.get_obj(domestic_water_heater_name)
+        for domestic_water_heater in topology_index.get_connected_objects(
+            loop.u_name, BDL_Commands.DW_HEATER
+        ):
             if domestic_water_heater.hot_water_loop == loop.u_name:
                 energy_source_set.add(domestic_water_heater.heater_fuel_type)
 
@@ -2,6 +2,7 @@ from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.bdl_structure.base_definition import BaseDefinition
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
 from rpd_generator.schema.schema_enums import SchemaEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 EnergySourceOptions = SchemaEnums.schema_enums["EnergySourceOptions"]
@@ -105,6 +106,16 @@ class SteamMeter(BaseNode):
 
     bdl_command = BDL_Commands.STEAM_METER
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "loop",
+            "type",
+            "energy_source_type",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.steam_meter_names.append(u_name)
@@ -130,19 +141,8 @@ class SteamMeter(BaseNode):
             "id": self.u_name,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "loop",
-            "type",
-            "energy_source_type",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.data_structure)
 
     def insert_to_rpd(self, rmd):
         rmd.external_fluid_sources.append(self.data_structure)
@@ -153,6 +153,16 @@ class CHWMeter(BaseNode):
 
     bdl_command = BDL_Commands.CHW_METER
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "loop",
+            "type",
+            "energy_source_type",
+        ]
+    )
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.chilled_water_meter_names.append(u_name)
@@ -178,19 +188,8 @@ class CHWMeter(BaseNode):
             "id": self.u_name,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "loop",
-            "type",
-            "energy_source_type",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.data_structure)
 
     def insert_to_rpd(self, rmd):
         rmd.external_fluid_sources.append(self.data_structure)
@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.child_node import ChildNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 
 SubsurfaceClassificationOptions = SchemaEnums.schema_enums[
@@ -31,12 +32,42 @@ class Window(ChildNode):
 
     bdl_command = BDL_Commands.WINDOW
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "classification",
+            "subclassification",
+            "is_operable",
+            "has_open_sensor",
+            "framing_type",
+            "glazed_area",
+            "opaque_area",
+            "u_factor",
+            "dynamic_glazing_type",
+            "solar_heat_gain_coefficient",
+            "maximum_solar_heat_gain_coefficient",
+            "visible_transmittance",
+            "minimum_visible_transmittance",
+            "depth_of_overhang",
+            "has_shading_overhang",
+            "has_shading_sidefins",
+            "has_manual_interior_shades",
+            "solar_transmittance_multiplier_summer",
+            "solar_transmittance_multiplier_winter",
+            "has_automatic_shades",
+            "status_type",
+        ]
+    )
+
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
         self.rmd.window_names.append(u_name)
         self.rmd.bdl_obj_instances[u_name] = self
 
         self.window_data_structure = {}
+        # Simulation outputs fetched for all windows at once by populate_output_data
+        self.output_data = None
 
         # data elements with no children
         self.classification = None
@@ -67,8 +98,9 @@ class Window(ChildNode):
     def populate_data_elements(self):
         """Populate data elements for window object."""
 
-        output_requests = self.get_output_requests()
-        output_data = self.get_output_data(output_requests)
+        if self.output_data is None:
+            self.output_data = self.get_output_data(self.get_output_requests())
+        output_data = self.output_data
 
         height = self.try_float(self.get_inp(BDL_WindowKeywords.HEIGHT))
         width = self.try_float(self.get_inp(BDL_WindowKeywords.WIDTH))
@@ -182,43 +214,36 @@ class Window(ChildNode):
         }
         self.populate_data_elements()
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "classification",
-            "subclassification",
-            "is_operable",
-            "has_open_sensor",
-            "framing_type",
-            "glazed_area",
-            "opaque_area",
-            "u_factor",
-            "dynamic_glazing_type",
-            "solar_heat_gain_coefficient",
-            "maximum_solar_heat_gain_coefficient",
-            "visible_transmittance",
-            "minimum_visible_transmittance",
-            "depth_of_overhang",
-            "has_shading_overhang",
-            "has_shading_sidefins",
-            "has_manual_interior_shades",
-            "solar_transmittance_multiplier_summer",
-            "solar_transmittance_multiplier_winter",
-            "has_automatic_shades",
-            "status_type",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.window_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.window_data_structure)
 
     def insert_to_rpd(self, rmd):
         """Insert window object into the rpd data structure."""
         surface = self.get_obj(self.parent.u_name)
         surface.subsurfaces.append(self.window_data_structure)
 
+    @staticmethod
+    def populate_output_data(windows: list):
+        """
+        Get the simulation outputs of all windows with batched requests instead of one request per window.
+        Windows whose outputs are not all returned request them again when populating their data elements.
+        :param windows: list of Window objects of one RMD
+        """
+        requests = {}
+        for window in windows:
+            for description, request in window.get_output_requests().items():
+                requests[(window.u_name, description)] = request
+        if not requests:
+            return
+
+        output_data = windows[0].get_output_data(requests)
+        for window in windows:
+            descriptions = window.get_output_requests()
+            if all((window.u_name, key) in output_data for key in descriptions):
+                window.output_data = {
+                    key: output_data[(window.u_name, key)] for key in descriptions
+                }
+
     def get_output_requests(self):
         """Get the output requests for the window object."""
 
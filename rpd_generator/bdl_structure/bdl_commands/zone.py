@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.child_node import ChildNode
 from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
 
 HeatingSourceOptions = SchemaEnums.schema_enums["HeatingSourceOptions"]
 CoolingSourceOptions = SchemaEnums.schema_enums["CoolingSourceOptions"]
@@ -46,6 +47,95 @@ BDL_MinFlowControlOptions = BDLEnums.bdl_enums["MinFlowControlOptions"]
 class Zone(ChildNode):
     """Zone object in the tree."""
 
+    # Zones have more attributes than an instance dictionary shares keys for, so they are stored in slots instead
+    __slots__ = (
+        "rmd",
+        "u_name",
+        "reporting_name",
+        "notes",
+        "keyword_value_pairs",
+        "parent",
+        "parent_building_segment",
+        "zone_data_structure",
+        "spaces",
+        "surfaces",
+        "terminals",
+        "zonal_exhaust_fan",
+        "infiltration",
+        "floor_name",
+        "volume",
+        "conditioning_type",
+        "design_thermostat_cooling_setpoint",
+        "thermostat_cooling_setpoint_schedule",
+        "design_thermostat_heating_setpoint",
+        "thermostat_heating_setpoint_schedule",
+        "minimum_humidity_setpoint_schedule",
+        "maximum_humidity_setpoint_schedule",
+        "served_by_service_water_heating_system",
+        "transfer_airflow_rate",
+        "transfer_airflow_source_zone",
+        "exhaust_airflow_rate_multiplier_schedule",
+        "makeup_airflow_rate",
+        "non_mechanical_cooling_fan_power",
+        "non_mechanical_cooling_fan_airflow",
+        "air_distribution_effectiveness",
+        "aggregation_factor",
+        "terminals_id",
+        "terminals_reporting_name",
+        "terminals_notes",
+        "terminals_type",
+        "terminals_served_by_heating_ventilating_air_conditioning_system",
+        "terminals_heating_source",
+        "terminals_heating_from_loop",
+        "terminals_cooling_source",
+        "terminals_cooling_from_loop",
+        "terminals_fan",
+        "terminals_fan_configuration",
+        "terminals_primary_airflow",
+        "terminals_secondary_airflow",
+        "terminals_max_heating_airflow",
+        "terminals_supply_design_heating_setpoint_temperature",
+        "terminals_supply_design_cooling_setpoint_temperature",
+        "terminals_temperature_control",
+        "terminals_minimum_airflow",
+        "terminals_minimum_outdoor_airflow",
+        "terminals_minimum_outdoor_airflow_multiplier_schedule",
+        "terminals_heating_capacity",
+        "terminals_cooling_capacity",
+        "terminals_is_supply_ducted",
+        "terminals_has_demand_control_ventilation",
+        "terminals_is_fan_first_stage_heat",
+        "terminal_fan_id",
+        "terminal_fan_reporting_name",
+        "terminal_fan_notes",
+        "terminal_fan_design_airflow",
+        "terminal_fan_is_airflow_sized_based_on_design_day",
+        "terminal_fan_specification_method",
+        "terminal_fan_design_electric_power",
+        "terminal_fan_design_pressure_rise",
+        "terminal_fan_motor_efficiency",
+        "terminal_fan_total_efficiency",
+        "terminal_fan_output_validation_points",
+        "zone_exhaust_fan_id",
+        "zone_exhaust_fan_reporting_name",
+        "zone_exhaust_fan_notes",
+        "zone_exhaust_fan_design_airflow",
+        "zone_exhaust_fan_is_airflow_sized_based_on_design_day",
+        "zone_exhaust_fan_specification_method",
+        "zone_exhaust_fan_design_electric_power",
+        "zone_exhaust_fan_design_pressure_rise",
+        "zone_exhaust_fan_total_efficiency",
+        "zone_exhaust_fan_output_validation_points",
+        "infil_id",
+        "infil_reporting_name",
+        "infil_notes",
+        "infil_modeling_method",
+        "infil_algorithm_name",
+        "infil_measured_air_leakage_rate",
+        "infil_flow_rate",
+        "infil_multiplier_schedule",
+    )
+
     bdl_command = BDL_Commands.ZONE
 
     heat_source_map = {
@@ -70,6 +160,32 @@ class Zone(ChildNode):
         BDL_ZoneFanControlOptions.VARIABLE_VOLUME: TerminalOptions.VARIABLE_AIR_VOLUME,
     }
 
+    no_children_attributes = DataGroupSerializer(
+        [
+            "reporting_name",
+            "notes",
+            "floor_name",
+            "volume",
+            "conditioning_type",
+            "design_thermostat_cooling_setpoint",
+            "thermostat_cooling_setpoint_schedule",
+            "design_thermostat_heating_setpoint",
+            "thermostat_heating_setpoint_schedule",
+            "minimum_humidity_setpoint_schedule",
+            "maximum_humidity_setpoint_schedule",
+            "served_by_service_water_heating_system",
+            "transfer_airflow_rate",
+            "transfer_airflow_source_zone",
+            "zonal_exhaust_flow",
+            "exhaust_airflow_rate_multiplier_schedule",
+            "makeup_airflow_rate",
+            "non_mechanical_cooling_fan_power",
+            "non_mechanical_cooling_fan_airflow",
+            "air_distribution_effectiveness",
+            "aggregation_factor",
+        ]
+    )
+
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
         self.rmd.zone_names.append(u_name)
@@ -609,35 +725,8 @@ class Zone(ChildNode):
             "infiltration": self.infiltration,
         }
 
-        no_children_attributes = [
-            "reporting_name",
-            "notes",
-            "floor_name",
-            "volume",
-            "conditioning_type",
-            "design_thermostat_cooling_setpoint",
-            "thermostat_cooling_setpoint_schedule",
-            "design_thermostat_heating_setpoint",
-            "thermostat_heating_setpoint_schedule",
-            "minimum_humidity_setpoint_schedule",
-            "maximum_humidity_setpoint_schedule",
-            "served_by_service_water_heating_system",
-            "transfer_airflow_rate",
-            "transfer_airflow_source_zone",
-            "zonal_exhaust_flow",
-            "exhaust_airflow_rate_multiplier_schedule",
-            "makeup_airflow_rate",
-            "non_mechanical_cooling_fan_power",
-            "non_mechanical_cooling_fan_airflow",
-            "air_distribution_effectiveness",
-            "aggregation_factor",
-        ]
-
-        # Iterate over the no_children_attributes list and populate if the value is not None
-        for attr in no_children_attributes:
-            value = getattr(self, attr, None)
-            if value is not None:
-                self.zone_data_structure[attr] = value
+        # Populate the attributes that are not None
+        self.no_children_attributes.serialize(self, self.zone_data_structure)
 
     def get_output_requests(self):
         """Get the output requests for the zone."""
@@ -1130,7 +1219,7 @@ class Zone(ChildNode):
             space_occ_sch = space.get_obj(
                 space.get_inp(BDL_SpaceKeywords.PEOPLE_SCHEDULE)
             )
-            max_occ_fraction = self.try_max(space_occ_sch.hourly_values)
+            max_occ_fraction = space_occ_sch.get_max_value()
             space_number_of_people = self.try_float(
                 space.get_inp(BDL_SpaceKeywords.NUMBER_OF_PEOPLE)
             )
@@ -1189,16 +1278,9 @@ class Zone(ChildNode):
             )
         ):
             min_oa_sch_allows_dcv_to_take_effect = (
-                any(
-                    system_min_oa_sch.hourly_values[i] == -999
-                    for i in range(len(system_min_oa_sch.hourly_values))
-                )
+                system_min_oa_sch.has_value(-999)
                 if system_fan_sch is None
-                else any(
-                    system_min_oa_sch.hourly_values[i] == -999
-                    for i in range(len(system_fan_sch.hourly_values))
-                    if system_fan_sch.hourly_values[i] == 1
-                )
+                else system_min_oa_sch.has_value_during(-999, system_fan_sch, 1)
             )
 
         if (
@@ -1224,18 +1306,14 @@ class Zone(ChildNode):
 
                 else:
                     # check if hourly value is -999 for all flow schedules while the fan schedule value is 1
-                    min_oa_sch_allows_dcv_to_take_effect = False
-                    for i in range(len(terminal_flow_schedules[0].hourly_values)):
-                        if (
-                            system_fan_sch is None
-                            or system_fan_sch.hourly_values[i] == 1
-                        ):
-                            if all(
-                                sched.hourly_values[i] == -999
-                                for sched in terminal_flow_schedules
-                            ):
-                                min_oa_sch_allows_dcv_to_take_effect = True
-                                break
+                    flag_mask = (
+                        system_fan_sch.get_value_mask(1)
+                        if system_fan_sch is not None
+                        else -1
+                    )
+                    for sched in terminal_flow_schedules:
+                        flag_mask &= sched.get_value_mask(-999)
+                    min_oa_sch_allows_dcv_to_take_effect = flag_mask != 0
 
             else:
                 min_oa_sch_allows_dcv_to_take_effect = True
@@ -0,0 +1,104 @@
+class BDLObjectRegistry(dict):
+    """
+    Dictionary of the BDL objects of an RMD by u_name that also keeps the objects bucketed by BDL command, in insertion
+    order. Objects of a command can be iterated without scanning or sorting every object in the RMD.
+    Objects can also be deferred, in which case they are only created when first accessed through get or [].
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        # {bdl command: {u_name: object}}
+        self.command_objects = {}
+        # {u_name: function that creates and registers the object}
+        self.deferred_objects = {}
+        self.update(*args, **kwargs)
+
+    def __missing__(self, u_name):
+        if u_name in self.deferred_objects:
+            self.deferred_objects.pop(u_name)()
+            return super().__getitem__(u_name)
+        raise KeyError(u_name)
+
+    def get(self, u_name, default=None):
+        if u_name in self.deferred_objects and u_name not in self:
+            self.deferred_objects.pop(u_name)()
+        return super().get(u_name, default)
+
+    def defer(self, u_name, create_obj):
+        """
+        Defer the creation of an object until it is first accessed.
+        :param u_name: (str) u_name of the object
+        :param create_obj: function without arguments that creates the object and adds it to the registry
+        """
+        self.deferred_objects[u_name] = create_obj
+
+    def __setitem__(self, u_name, obj):
+        # An object replaced by one of the same command keeps its position, as it does in the dictionary
+        if u_name in self and getattr(self[u_name], "bdl_command", None) != getattr(
+            obj, "bdl_command", None
+        ):
+            self._remove_from_command(u_name, self[u_name])
+        self.deferred_objects.pop(u_name, None)
+        super().__setitem__(u_name, obj)
+        self.command_objects.setdefault(getattr(obj, "bdl_command", None), {})[
+            u_name
+        ] = obj
+
+    def __delitem__(self, u_name):
+        self._remove_from_command(u_name, self[u_name])
+        super().__delitem__(u_name)
+
+    def pop(self, u_name, *default):
+        if u_name in self:
+            self._remove_from_command(u_name, self[u_name])
+        return super().pop(u_name, *default)
+
+    def popitem(self):
+        u_name, obj = super().popitem()
+        self._remove_from_command(u_name, obj)
+        return u_name, obj
+
+    def setdefault(self, u_name, default=None):
+        if u_name not in self and u_name not in self.deferred_objects:
+            self[u_name] = default
+        return self[u_name]
+
+    def update(self, *args, **kwargs):
+        for u_name, obj in dict(*args, **kwargs).items():
+            self[u_name] = obj
+
+    def __reduce__(self):
+        # Rebuild the command buckets through __setitem__ when copied or pickled
+        return (
+            self.__class__,
+            (),
+            {"deferred_objects": self.deferred_objects},
+            None,
+            iter(dict.items(self)),
+        )
+
+    def clear(self):
+        super().clear()
+        self.command_objects.clear()
+        self.deferred_objects.clear()
+
+    def objects(self, command) -> list:
+        """
+        Return the objects of a BDL command in the order they were added.
+        :param command: (str) BDL command
+        """
+        return list(self.command_objects.get(command, {}).values())
+
+    def commands(self) -> list:
+        """
+        Return the BDL commands of the objects in the order they were first added.
+        """
+        return list(self.command_objects)
+
+    def _remove_from_command(self, u_name, obj):
+        command = getattr(obj, "bdl_command", None)
+        objects = self.command_objects.get(command)
+        if objects is not None:
+            objects.pop(u_name, None)
+            if not objects:
+                del self.command_objects[command]
@@ -0,0 +1,95 @@
+from operator import attrgetter
+
+
+class DataGroupSerializer:
+    """
+    Serializer of a fixed list of object attributes into a data group dictionary. It is declared once per class, and
+    reads all the attribute values with a single attrgetter call instead of one getattr per attribute.
+    Values that are None are left out of the data group, as are attributes that the object does not have.
+    """
+
+    def __init__(self, attributes, prefix=""):
+        """
+        :param attributes: (list) names of the attributes to serialize
+        :param prefix: (str) prefix removed from the attribute names to get the data group keys, e.g. "terminals_"
+        """
+        self.attributes = tuple(attributes)
+        self.keys = tuple(attr.removeprefix(prefix) for attr in self.attributes)
+        if not self.attributes:
+            self.get_values = lambda obj: ()
+        elif len(self.attributes) == 1:
+            get_value = attrgetter(self.attributes[0])
+            self.get_values = lambda obj: (get_value(obj),)
+        else:
+            self.get_values = attrgetter(*self.attributes)
+
+    def read_values(self, obj) -> tuple:
+        try:
+            return self.get_values(obj)
+        except AttributeError:
+            return tuple(getattr(obj, attr, None) for attr in self.attributes)
+
+    def serialize(self, obj, data_structure=None) -> dict:
+        """
+        Add the attributes of obj that are not None to the data structure.
+        :param obj: object to serialize
+        :param data_structure: (dict) data group to populate, a new dictionary by default
+        :return: the data group
+        """
+        data_structure = {} if data_structure is None else data_structure
+        for key, value in zip(self.keys, self.read_values(obj)):
+            if value is not None:
+                data_structure[key] = value
+        return data_structure
+
+    def serialize_index(self, obj, index, data_structure=None) -> dict:
+        """
+        Add the index-th value of the list attributes of obj to the data structure when it is not None, e.g. for the
+        pumps of a pump object with a quantity greater than 1.
+        :param obj: object to serialize
+        :param index: (int) index of the values in the attribute lists
+        :param data_structure: (dict) data group to populate, a new dictionary by default
+        :return: the data group
+        """
+        data_structure = {} if data_structure is None else data_structure
+        for key, values in zip(self.keys, self.read_values(obj)):
+            if values is not None and values[index] is not None:
+                data_structure[key] = values[index]
+        return data_structure
+
+    def serialize_groups(self, obj) -> list:
+        """
+        Return a data group for each index of the list attributes of obj, leaving out the data groups with no values.
+        Attributes that are not lists have a single value.
+        :param obj: object to serialize
+        """
+        value_lists = [
+            value if isinstance(value, list) else [value]
+            for value in self.read_values(obj)
+        ]
+        data_structures = []
+        for values in zip(*value_lists):
+            data_structure = {
+                key: value for key, value in zip(self.keys, values) if value is not None
+            }
+            if data_structure:
+                data_structures.append(data_structure)
+        return data_structures
+
+    @classmethod
+    def from_prefix(cls, obj, prefix, excluded_prefix=None):
+        """
+        Create the serializer of the attributes of obj whose names start with prefix, keyed by the rest of their names.
+        :param obj: object whose attributes are serialized
+        :param prefix: (str) prefix of the attribute names, e.g. "terminals_"
+        :param excluded_prefix: (str) longer prefix of attribute names to leave out, e.g. "fan_sys" for "fan_"
+        """
+        return cls(
+            [
+                attr
+                for attr in dir(obj)
+                if attr.startswith(prefix)
+                and not (excluded_prefix and attr.startswith(excluded_prefix))
+            ],
+            prefix,
+        )
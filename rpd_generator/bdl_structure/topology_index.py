@@ -0,0 +1,115 @@
+from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+
+BDL_Commands = BDLEnums.bdl_enums["Commands"]
+BDL_CirculationLoopKeywords = BDLEnums.bdl_enums["CirculationLoopKeywords"]
+BDL_SystemKeywords = BDLEnums.bdl_enums["SystemKeywords"]
+BDL_ZoneKeywords = BDLEnums.bdl_enums["ZoneKeywords"]
+BDL_ChillerKeywords = BDLEnums.bdl_enums["ChillerKeywords"]
+BDL_BoilerKeywords = BDLEnums.bdl_enums["BoilerKeywords"]
+BDL_DWHeaterKeywords = BDLEnums.bdl_enums["DomesticWaterHeaterKeywords"]
+BDL_HeatRejectionKeywords = BDLEnums.bdl_enums["HeatRejectionKeywords"]
+BDL_GroundLoopHXKeywords = BDLEnums.bdl_enums["GroundLoopHXKeywords"]
+BDL_SteamAndCHWaterMeterKeywords = BDLEnums.bdl_enums[
+    "SteamAndChilledWaterMeterKeywords"
+]
+BDL_EquipCtrlKeywords = BDLEnums.bdl_enums["EquipCtrlKeywords"]
+
+
+class TopologyIndex:
+    """
+    Reverse-reference index of the circulation loop topology. Maps each loop name to the objects that reference it, so
+    that plant objects can find the objects attached to a loop without scanning every object in the RMD.
+    Built from the keyword-value pairs once the inputs are loaded.
+    """
+
+    # Keywords through which each command references a loop
+    LOOP_KEYWORDS = {
+        BDL_Commands.CIRCULATION_LOOP: [BDL_CirculationLoopKeywords.PRIMARY_LOOP],
+        BDL_Commands.SYSTEM: [
+            BDL_SystemKeywords.CHW_LOOP,
+            BDL_SystemKeywords.HW_LOOP,
+            BDL_SystemKeywords.PHW_LOOP,
+        ],
+        BDL_Commands.ZONE: [
+            BDL_ZoneKeywords.CHW_LOOP,
+            BDL_ZoneKeywords.HW_LOOP,
+            BDL_ZoneKeywords.CW_LOOP,
+        ],
+        BDL_Commands.CHILLER: [
+            BDL_ChillerKeywords.CHW_LOOP,
+            BDL_ChillerKeywords.CW_LOOP,
+            BDL_ChillerKeywords.HTREC_LOOP,
+        ],
+        BDL_Commands.BOILER: [BDL_BoilerKeywords.HW_LOOP],
+        BDL_Commands.DW_HEATER: [BDL_DWHeaterKeywords.DHW_LOOP],
+        BDL_Commands.HEAT_REJECTION: [BDL_HeatRejectionKeywords.CW_LOOP],
+        BDL_Commands.GROUND_LOOP_HX: [BDL_GroundLoopHXKeywords.CIRCULATION_LOOP],
+        BDL_Commands.STEAM_METER: [BDL_SteamAndCHWaterMeterKeywords.CIRCULATION_LOOP],
+        BDL_Commands.EQUIP_CTRL: [BDL_EquipCtrlKeywords.CIRCULATION_LOOP],
+    }
+
+    # Pump keywords and the loop keyword of the same object that the pump serves. None means the object is the loop.
+    PUMP_KEYWORDS = {
+        BDL_Commands.CIRCULATION_LOOP: [(BDL_CirculationLoopKeywords.LOOP_PUMP, None)],
+        BDL_Commands.CHILLER: [
+            (BDL_ChillerKeywords.CHW_PUMP, BDL_ChillerKeywords.CHW_LOOP),
+            (BDL_ChillerKeywords.CW_PUMP, BDL_ChillerKeywords.CW_LOOP),
+        ],
+        BDL_Commands.BOILER: [(BDL_BoilerKeywords.HW_PUMP, BDL_BoilerKeywords.HW_LOOP)],
+        BDL_Commands.HEAT_REJECTION: [
+            (BDL_HeatRejectionKeywords.CW_PUMP, BDL_HeatRejectionKeywords.CW_LOOP)
+        ],
+    }
+
+    def __init__(self, rmd):
+        # {loop name: {command: {keyword: [objects]}}}
+        self.loop_connections = {}
+        # {loop name: [pump names]}
+        self.loop_pumps = {}
+
+        for command in self.LOOP_KEYWORDS:
+            for obj in rmd.objects(command):
+                for keyword in self.LOOP_KEYWORDS[command]:
+                    loop_name = obj.get_inp(keyword)
+                    if isinstance(loop_name, str):
+                        self.loop_connections.setdefault(loop_name, {}).setdefault(
+                            command, {}
+                        ).setdefault(keyword, []).append(obj)
+
+                for pump_keyword, loop_keyword in self.PUMP_KEYWORDS.get(command, []):
+                    pump_name = obj.get_inp(pump_keyword)
+                    loop_name = (
+                        obj.get_inp(loop_keyword) if loop_keyword else obj.u_name
+                    )
+                    if isinstance(pump_name, str) and isinstance(loop_name, str):
+                        pumps = self.loop_pumps.setdefault(loop_name, [])
+                        if pump_name not in pumps:
+                            pumps.append(pump_name)
+
+    def get_connected_objects(self, loop_name, command, keyword=None) -> list:
+        """
+        Return the objects of a command that reference a loop.
+        :param loop_name: (str) u_name of the circulation loop
+        :param command: (str) BDL command of the objects
+        :param keyword: (str) only return objects that reference the loop through this keyword
+        :return: list of objects without duplicates
+        """
+        connections = self.loop_connections.get(loop_name, {}).get(command, {})
+        if keyword is not None:
+            return list(connections.get(keyword, []))
+
+        objects = []
+        seen = set()
+        for keyword_objects in connections.values():
+            for obj in keyword_objects:
+                if id(obj) not in seen:
+                    seen.add(id(obj))
+                    objects.append(obj)
+        return objects
+
+    def get_loop_pump_names(self, loop_name) -> list:
+        """
+        Return the u_names of the pumps that serve a loop, either as the loop pump or as the pump of an attached object.
+        :param loop_name: (str) u_name of the circulation loop
+        """
+        return list(self.loop_pumps.get(loop_name, []))
@@ -29,9 +29,16 @@ class Config:
     def set_active_ruleset(ruleset_name: str):
         ruleset_dict = Config.RULESETS.get(ruleset_name)
         if ruleset_dict:
-            Config.ACTIVE_RULESET = Ruleset(
-                name=ruleset_name,
-                enum_filename=ruleset_dict.get("enum_filename"),
-                output_filename=ruleset_dict.get("output_filename"),
+            Config.use_ruleset(
+                Ruleset(
+                    name=ruleset_name,
+                    enum_filename=ruleset_dict.get("enum_filename"),
+                    output_filename=ruleset_dict.get("output_filename"),
+                )
             )
-            SchemaEnums.update_schema_enum(Config.ACTIVE_RULESET)
+
+    @staticmethod
+    def use_ruleset(ruleset: Ruleset):
+        """Make ruleset the active ruleset, e.g. in a worker process with the ruleset active in the main process"""
+        Config.ACTIVE_RULESET = ruleset
+        SchemaEnums.update_schema_enum(ruleset)
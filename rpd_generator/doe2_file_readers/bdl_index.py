@@ -0,0 +1,183 @@
+import io
+import json
+import locale
+import mmap
+import os
+import re
+from pathlib import Path
+
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+
+# Lines that ModelInputReader acts on outside of a data record: the DOE-2 version, command headers and DATA FOR lines.
+# Lines end with \r\n, \n or \r, as in a file opened in text mode.
+INDEXED_LINE_PATTERN = re.compile(
+    rb'(?:^|(?<=[\r\n]))[^\r\n]*?(?:" = |\$LIBRARY-ENTRY|DATA FOR|JJHirsch DOE-2 Version:)[^\r\n]*'
+)
+# End of a data record: the first line after the DATA FOR line that is empty or does not start with "-"
+DATA_RECORD_END_PATTERN = re.compile(rb"(?:\r\n|\r(?!\n)|\n)(?!-)")
+# End of the library entry text of a curve, which ModelInputReader reads for its unrounded coefficients
+LIBRARY_ENTRY_END_PATTERN = re.compile(rb"\.\.[^\r\n]*")
+INDEX_VERSION = 1
+
+
+def get_index_path(bdl_file_path) -> Path:
+    """
+    Return the path of the index that is stored next to a BDL file.
+    :param bdl_file_path: (str or Path) path of the BDL file
+    """
+    bdl_file_path = Path(bdl_file_path)
+    return bdl_file_path.with_name(f"{bdl_file_path.stem}.bdl-index.json")
+
+
+class BDLIndex:
+    """
+    Byte-offset index over a BDL file with Diagnostic Comments, for reading the inputs of individual objects without
+    reading the whole file. The file is scanned once for the command header and the DATA FOR records of each object,
+    and the index is saved next to the file and reused until the file changes. get parses only the lines of one
+    object, with ModelInputReader, so it returns the same keyword-value pairs as read_input_bdl_file.
+    The file stays memory mapped until the index is closed.
+    """
+
+    def __init__(self, bdl_file_path):
+        """
+        :param bdl_file_path: (str or Path) path of the BDL file
+        """
+        self.bdl_file_path = Path(bdl_file_path)
+        self.model_input_reader = ModelInputReader()
+        self.bdl_file = open(self.bdl_file_path, "rb")
+        stat = os.fstat(self.bdl_file.fileno())
+        self.file_key = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        # An empty file cannot be mapped
+        self.data = (
+            mmap.mmap(self.bdl_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if stat.st_size
+            else b""
+        )
+        self.doe2_version = None
+        # {u_name: [command, parent, [[start, end], ...]]} in the order of the file
+        self.objects = {}
+        if not self._load_index():
+            self._build_index()
+            self._save_index()
+
+    def get(self, u_name: str):
+        """
+        Read the keyword-value pairs of one object.
+        :param u_name: unique name of the object
+        :return: dict: the command dictionary of the object, see ModelInputReader.read_input_bdl_file, or None if the
+            file has no object by that name
+        """
+        entry = self.objects.get(u_name)
+        if entry is None:
+            return None
+        command, parent, byte_ranges = entry
+        object_data = b"\n".join(self.data[start:end] for start, end in byte_ranges)
+        lines = io.TextIOWrapper(io.BytesIO(object_data))
+        file_commands = self.model_input_reader.read_bdl_lines(lines)["file_commands"]
+        command_dict = file_commands[command][u_name]
+        # The headers of the parents are not read, so the parent is the one found when the index was built
+        if "parent" in command_dict:
+            command_dict["parent"] = parent
+        return command_dict
+
+    def get_u_names(self, command=None) -> list:
+        """
+        :param command: optional BDL command of the objects, e.g. "ZONE"
+        :return: list of the unique names of the objects in the order of the file
+        """
+        return [
+            u_name
+            for u_name, entry in self.objects.items()
+            if command is None or entry[0] == command
+        ]
+
+    def __contains__(self, u_name):
+        return u_name in self.objects
+
+    def __len__(self):
+        return len(self.objects)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.bdl_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _build_index(self):
+        """
+        Scan the file for the lines that ModelInputReader acts on outside of a data record, and record the byte range
+        of the command header and of the DATA FOR records of each object. Parents are tracked as the reader does.
+        """
+        reader = self.model_input_reader
+        encoding = locale.getpreferredencoding(False)
+        matches = list(INDEXED_LINE_PATTERN.finditer(self.data))
+        for i, match in enumerate(matches):
+            line = match.group().decode(encoding)
+            if "JJHirsch DOE-2 Version:" in line:
+                self.doe2_version = line.split(":")[1].split()[0].strip()
+                continue
+
+            if '" = ' in line or "$LIBRARY-ENTRY" in line:
+                unique_name, command = (
+                    reader._parse_command_line(line)
+                    if '" = ' in line
+                    else reader._parse_library_entry(line)
+                )
+                if command not in reader.bdl_command_dict:
+                    continue
+                header_end = match.end()
+                if "CURVE-FIT" in line:
+                    entry_end = LIBRARY_ENTRY_END_PATTERN.search(self.data, header_end)
+                    header_end = entry_end.end() if entry_end else len(self.data)
+                reader._track_current_parents(unique_name, command)
+                parent = reader._set_parent(command, {}).get("parent")
+                self.objects[unique_name] = [
+                    command,
+                    parent,
+                    [[match.start(), header_end]],
+                ]
+
+            elif "DATA FOR" in line:
+                entry = self.objects.get(line[32:].rstrip())
+                if entry is None:
+                    continue
+                record_end = DATA_RECORD_END_PATTERN.search(self.data, match.end())
+                record_end = record_end.start() if record_end else len(self.data)
+                if i + 1 < len(matches):
+                    record_end = min(record_end, matches[i + 1].start())
+                entry[2].append([match.start(), record_end])
+
+    def _load_index(self) -> bool:
+        """
+        Load the saved index if it was built from the file as it is now.
+        :return: bool: True if the index was loaded
+        """
+        try:
+            with open(get_index_path(self.bdl_file_path)) as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return False
+        if index.get("version") != INDEX_VERSION or index.get("file") != self.file_key:
+            return False
+        self.doe2_version = index["doe2_version"]
+        self.objects = index["objects"]
+        return True
+
+    def _save_index(self):
+        index = {
+            "version": INDEX_VERSION,
+            "file": self.file_key,
+            "doe2_version": self.doe2_version,
+            "objects": self.objects,
+        }
+        try:
+            with open(get_index_path(self.bdl_file_path), "w") as index_file:
+                json.dump(index, index_file)
+        except OSError:
+            # The index is only kept in memory when it cannot be saved next to the file
+            pass
@@ -0,0 +1,41 @@
+# First characters of the strings that float accepts, so that text values are not parsed as numbers
+NUMBER_START_CHARACTERS = frozenset("0123456789+-.iInN")
+
+
+class BDLValue(str):
+    """
+    Value of a keyword read from a BDL file. It is the string as read, so it compares, hashes and serializes
+    like one, and it also holds the number it decodes to and its units. Values are decoded once when the file is
+    read, so that try_float and try_int do not parse the same strings again for every object that uses them.
+    """
+
+    # Every keyword value of the model is a BDLValue, so the values do not carry a __dict__
+    __slots__ = ("units", "number")
+
+    def __new__(cls, value: str, units=None):
+        """
+        :param value: string as read from the file
+        :param units: optional units that DOE-2 reports for the keyword, e.g. "SQFT"
+        """
+        bdl_value = super().__new__(cls, value)
+        bdl_value.units = units
+        bdl_value.number = decode_number(value)
+        return bdl_value
+
+    def __reduce__(self):
+        return BDLValue, (str(self), self.units)
+
+
+def decode_number(value: str):
+    """
+    :param value: string as read from the file
+    :return: float: the number that the string represents, or None if it is not a number
+    """
+    # Values in fixed-width columns are padded with spaces, which float ignores
+    first_character = value.lstrip()[:1]
+    if not first_character or first_character not in NUMBER_START_CHARACTERS:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
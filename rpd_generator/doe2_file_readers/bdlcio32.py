@@ -1,4 +1,6 @@
 import ctypes
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
@@ -20,10 +22,18 @@ def process_input_file(
     :param bdl_dll_name: Name of the BDL DLL to load (default: "DOEBDL23.DLL")
     :return:
     """
+    bdlcio32 = load_bdlcio32(bdlcio_dll, bdl_dll_name)
+    read_input(bdlcio32, doe2_data_dir, work_dir, file_name, lib_file_name)
 
-    if lib_file_name is None:
-        lib_file_name = str(Path(doe2_data_dir) / "USRLIB.DAT")
 
+def load_bdlcio32(bdlcio_dll: str, bdl_dll_name="DOEBDL23.DLL"):
+    """
+    Load the BDLCIO32.dll file and initialize it with a BDL DLL. The DLL holds global state, so it must only be used
+    by one thread of a process at a time.
+    :param bdlcio_dll: location of the dll file as a string
+    :param bdl_dll_name: Name of the BDL DLL to load (default: "DOEBDL23.DLL")
+    :return: the initialized DLL
+    """
     bdlcio32 = ctypes.WinDLL(bdlcio_dll)
     # Define the prototype of BDLCIO32_InitByName
     bdlcio32.BDLCIO32_InitByName.argtypes = [ctypes.c_char_p]
@@ -46,6 +56,22 @@ def process_input_file(
         ctypes.POINTER(ctypes.c_int),
     ]
     bdlcio32.BDLCIO32_ReadInput.restype = ctypes.c_long
+    return bdlcio32
+
+
+def read_input(
+    bdlcio32, doe2_data_dir: str, work_dir: str, file_name: str, lib_file_name=None
+):
+    """
+    Process an input file into a BDL file with an initialized BDLCIO32 DLL, see load_bdlcio32.
+    :param bdlcio32: the initialized DLL
+    :param doe2_data_dir: location of the DOE-2 data directory as a string
+    :param work_dir: parent directory location of the input file as a string
+    :param file_name: file name of the input file as a string
+    :param lib_file_name: optional location of the USRLIB.DAT file as a string
+    """
+    if lib_file_name is None:
+        lib_file_name = str(Path(doe2_data_dir) / "USRLIB.DAT")
 
     no_scrn_msg = 0
     write_nhk_file = 0
@@ -65,4 +91,123 @@ def process_input_file(
     except OSError as e:
         print(f"Error processing INP file to BDL: {e}")
 
-    return
+
+class InpConverter:
+    """
+    Converts prepared INP files into BDL files with Diagnostic Comments, written next to each INP file.
+    """
+
+    def convert(self, inp_path: Path) -> Path:
+        """
+        :param inp_path: path of the prepared INP file
+        :return: path of the BDL file
+        """
+        raise NotImplementedError
+
+    def convert_all(self, inp_paths: list) -> list:
+        """
+        Convert several INP files, concurrently where the converter allows it.
+        :param inp_paths: paths of the prepared INP files
+        :return: list of the paths of the BDL files in the order of inp_paths
+        """
+        return [self.convert(Path(inp_path)) for inp_path in inp_paths]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# BDLCIO32 DLL of a Bdlcio32Converter worker process, initialized once when the worker starts
+_worker_bdlcio32 = None
+
+
+def _initialize_bdlcio32_worker(bdlcio_dll: str, bdl_dll_name: str):
+    global _worker_bdlcio32
+    _worker_bdlcio32 = load_bdlcio32(bdlcio_dll, bdl_dll_name)
+
+
+def _read_input_in_worker(
+    doe2_data_dir: str, work_dir: str, file_name: str, lib_file_name
+):
+    read_input(_worker_bdlcio32, doe2_data_dir, work_dir, file_name, lib_file_name)
+
+
+class Bdlcio32Converter(InpConverter):
+    """
+    Converts INP files with BDLCIO32 in long-lived worker processes. The DLL holds global state and cannot be called
+    from several threads, so each worker process loads and initializes its own copy once, and then converts the INP
+    files dispatched to it one at a time. Worker processes are started as conversions are submitted.
+    """
+
+    def __init__(
+        self,
+        bdlcio_dll: str,
+        doe2_data_dir: str,
+        max_workers=None,
+        lib_file_name=None,
+        bdl_dll_name="DOEBDL23.DLL",
+    ):
+        """
+        :param bdlcio_dll: location of the dll file as a string
+        :param doe2_data_dir: location of the DOE-2 data directory as a string
+        :param max_workers: (int) number of worker processes, defaults to the number of CPUs
+        :param lib_file_name: optional location of the USRLIB.DAT file as a string
+        :param bdl_dll_name: Name of the BDL DLL to load (default: "DOEBDL23.DLL")
+        """
+        self.doe2_data_dir = doe2_data_dir
+        self.lib_file_name = lib_file_name
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_bdlcio32_worker,
+            initargs=(bdlcio_dll, bdl_dll_name),
+        )
+
+    def convert(self, inp_path: Path) -> Path:
+        return self.convert_all([inp_path])[0]
+
+    def convert_all(self, inp_paths: list) -> list:
+        inp_paths = [Path(inp_path) for inp_path in inp_paths]
+        futures = [
+            self.executor.submit(
+                _read_input_in_worker,
+                self.doe2_data_dir,
+                str(inp_path.parent) + "\\",
+                inp_path.name,
+                self.lib_file_name,
+            )
+            for inp_path in inp_paths
+        ]
+        for future in futures:
+            future.result()
+        return [inp_path.with_suffix(".BDL") for inp_path in inp_paths]
+
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class CopyBdlConverter(InpConverter):
+    """
+    Stand-in for Bdlcio32Converter that copies a BDL file generated beforehand, e.g. next to a test model, instead of
+    processing the INP file. It lets tests and benchmarks run without eQUEST.
+    """
+
+    def __init__(self, bdl_dirs: list):
+        """
+        :param bdl_dirs: directories searched in order for a BDL file with the name of the INP file
+        """
+        self.bdl_dirs = [Path(bdl_dir) for bdl_dir in bdl_dirs]
+
+    def convert(self, inp_path: Path) -> Path:
+        inp_path = Path(inp_path)
+        bdl_path = inp_path.with_suffix(".BDL")
+        for bdl_dir in self.bdl_dirs:
+            source_path = bdl_dir / bdl_path.name
+            if source_path.is_file():
+                shutil.copyfile(source_path, bdl_path)
+                return bdl_path
+        raise FileNotFoundError(f"No BDL file found for {inp_path.name}")
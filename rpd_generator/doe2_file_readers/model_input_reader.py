@@ -3,6 +3,8 @@ import pkgutil
 import importlib
 import re
 from rpd_generator.bdl_structure import *
+from rpd_generator.doe2_file_readers.bdl_value import BDLValue
+from rpd_generator.utilities.projection import expand_projection
 
 
 def _get_bdl_commands_for_rpd() -> dict:
@@ -80,12 +82,18 @@ class ModelInputReader:
         self.current_parent_floor = None
         self.current_parent_space = None
         self.current_parent = None
+        # Keywords, values and u_names repeat across thousands of objects, so each distinct string is kept only once
+        self.interned_strings = {}
+        # Values are decoded once for each distinct string and units, see BDLValue
+        self.decoded_values = {}
 
-    def read_input_bdl_file(self, bdl_file_path: str) -> dict:
+    def read_input_bdl_file(self, bdl_file_path: str, projection=None) -> dict:
         """
         Read BDL input file and return a dictionary of object instances.
 
         :param bdl_file_path: Path to the BDL file.
+        :param projection: Optional names of the parts of the model to read, see projection.expand_projection. The
+            data records of the other commands are skipped without being parsed.
         :return: A dictionary with BDL commands as keys and dictionaries filled with keyword-value pairs as values.
 
         Example:
@@ -119,125 +127,171 @@ class ModelInputReader:
         """
 
         with open(bdl_file_path, "r") as bdl_file:
-            doe2_version = None
-            file_commands = {}
-
-            active_command_dict = None
-            record_data_for = False
-            special_read_flag = False
-            special_data = {}
-            multiline_key = None
-            multiline_value = []
-
-            for line in bdl_file:
-
-                # Skip empty lines
-                if not line.strip():
-                    record_data_for = False
-                    continue
-
-                # Extract the DOE-2 version from the file
-                if "JJHirsch DOE-2 Version:" in line:
-                    doe2_version = line.split(":")[1].split()[0].strip()
-                    continue
-
-                # When the data record is complete, reset the flag and add the command to the file_commands dictionary
-                if record_data_for and line[0] != "-":
-                    record_data_for = False
-
-                # If the line contains a command, parse the command and set the active command dictionary
-                if '" = ' in line or "$LIBRARY-ENTRY" in line:
-                    unique_name, command = (
-                        self._parse_command_line(line)
-                        if '" = ' in line
-                        else self._parse_library_entry(line)
+            return self.read_bdl_lines(bdl_file, expand_projection(projection))
+
+    def read_bdl_lines(self, lines, commands=None) -> dict:
+        """
+        Read the lines of a BDL input file, or of a part of one, see read_input_bdl_file.
+
+        :param lines: Iterable of the lines, e.g. an open BDL file.
+        :param commands: Optional set of the BDL commands to read. Parents are tracked through the other commands.
+        :return: A dictionary with the DOE-2 version and the file commands, see read_input_bdl_file.
+        """
+        self.interned_strings = {}
+        self.decoded_values = {}
+        doe2_version = None
+        file_commands = {}
+
+        active_command_dict = None
+        record_data_for = False
+        special_read_flag = False
+        special_data = {}
+        multiline_key = None
+        multiline_value = []
+
+        for line in lines:
+
+            # Skip empty lines
+            if not line.strip():
+                record_data_for = False
+                continue
+
+            # Extract the DOE-2 version from the file
+            if "JJHirsch DOE-2 Version:" in line:
+                doe2_version = line.split(":")[1].split()[0].strip()
+                continue
+
+            # When the data record is complete, reset the flag and add the command to the file_commands dictionary
+            if record_data_for and line[0] != "-":
+                record_data_for = False
+
+            # If the line contains a command, parse the command and set the active command dictionary
+            if '" = ' in line or "$LIBRARY-ENTRY" in line:
+                unique_name, command = (
+                    self._parse_command_line(line)
+                    if '" = ' in line
+                    else self._parse_library_entry(line)
+                )
+                unique_name = self._intern(unique_name)
+                # check if the command type is one that the RPD Generator uses:
+                if command in self.bdl_command_dict:
+                    self._track_current_parents(unique_name, command)
+                    if commands is not None and command not in commands:
+                        continue
+
+                    # check if the library entry requires special handling
+                    if "CURVE-FIT" in line:
+                        special_read_flag = True
+
+                    command_dict = {"command": command}
+                    command_dict = self._set_parent(command, command_dict)
+                    # Ensure every BDL command is accessible by unique name
+                    file_commands[unique_name] = command_dict
+                continue
+
+            # Flag the start of the data record and set the active command dictionary
+            elif "DATA FOR" in line:
+                obj_u_name = line[32:].rstrip()
+                active_command_dict = file_commands.get(obj_u_name)
+                if active_command_dict:
+                    record_data_for = True
+                continue
+
+            # Parse the definition line and add the keyword and value to the active command dictionary
+            elif record_data_for and " = " in line:
+                keyword, value, units = self._parse_definition_line(line)
+                keyword, value = self._intern(keyword), self._decode_value(value, units)
+
+                if keyword in active_command_dict and isinstance(
+                    active_command_dict[keyword], list
+                ):
+                    active_command_dict[keyword].append(value)
+
+                elif keyword in active_command_dict:
+                    active_command_dict[keyword] = [
+                        active_command_dict[keyword],
+                        value,
+                    ]
+
+                else:
+                    active_command_dict[keyword] = value
+
+            elif special_read_flag:
+                active_command_dict = file_commands.get(unique_name)
+
+                # Parse keyword-value pairs
+                keywords_values = re.split(r"\s+(?![^(]*\))|=", line[15:])
+                if any("(" in item for item in keywords_values):
+                    # Combine all parts starting from the "("
+                    paren_idx = next(
+                        i for i, item in enumerate(keywords_values) if "(" in item
                     )
-                    # check if the command type is one that the RPD Generator uses:
-                    if command in self.bdl_command_dict:
-
-                        # check if the library entry requires special handling
-                        if "CURVE-FIT" in line:
-                            special_read_flag = True
-
-                        command_dict = {"command": command}
-                        self._track_current_parents(unique_name, command)
-                        command_dict = self._set_parent(command, command_dict)
-                        # Ensure every BDL command is accessible by unique name
-                        file_commands[unique_name] = command_dict
-                    continue
-
-                # Flag the start of the data record and set the active command dictionary
-                elif "DATA FOR" in line:
-                    obj_u_name = line[32:].rstrip()
-                    active_command_dict = file_commands.get(obj_u_name)
-                    if active_command_dict:
-                        record_data_for = True
-                    continue
-
-                # Parse the definition line and add the keyword and value to the active command dictionary
-                elif record_data_for and " = " in line:
-                    keyword, value, units = self._parse_definition_line(line)
-
-                    if keyword in active_command_dict and isinstance(
-                        active_command_dict[keyword], list
-                    ):
-                        active_command_dict[keyword].append(value)
-
-                    elif keyword in active_command_dict:
-                        active_command_dict[keyword] = [
-                            active_command_dict[keyword],
-                            value,
-                        ]
+                    keywords_values = keywords_values[:paren_idx] + [
+                        " ".join(keywords_values[paren_idx:])
+                    ]
 
+                # filter out empty strings and ".."
+                keywords_values = [
+                    item for item in keywords_values if item and item != ".."
+                ]
+
+                if multiline_key:
+                    keywords_values.insert(0, multiline_key)
+                    multiline_value += line[15:].split(")")[0] + ")"
+                    keywords_values[1] = multiline_value
+                    multiline_key = None
+
+                for i in range(0, len(keywords_values), 2):
+                    key = keywords_values[i]
+                    value = keywords_values[i + 1]
+                    if "(" in value:
+                        special_data[key] = self._parse_parentheses_values(value)
                     else:
-                        active_command_dict[keyword] = value
+                        special_data[key] = value
+
+                if "(" in line and ")" not in line:
+                    multiline_key = keywords_values[-2]
+                    multiline_value = keywords_values[-1]
+
+                # End special read block at `..`
+                if ".." in line:
+                    special_read_flag = False
+                    if active_command_dict and "COEF" in special_data:
+                        active_command_dict["COEF"] = self._decode_value(
+                            special_data["COEF"]
+                        )
+                    special_data = {}
 
-                elif special_read_flag:
-                    active_command_dict = file_commands.get(unique_name)
+        file_commands = self._group_by_command(file_commands)
+        self.interned_strings = {}
+        self.decoded_values = {}
+        return {"doe2_version": doe2_version, "file_commands": file_commands}
 
-                    # Parse keyword-value pairs
-                    keywords_values = re.split(r"\s+(?![^(]*\))|=", line[15:])
-                    if any("(" in item for item in keywords_values):
-                        # Combine all parts starting from the "("
-                        paren_idx = next(
-                            i for i, item in enumerate(keywords_values) if "(" in item
-                        )
-                        keywords_values = keywords_values[:paren_idx] + [
-                            " ".join(keywords_values[paren_idx:])
-                        ]
+    def _intern(self, string):
+        """
+        Return the first instance of an equal string read from the file.
 
-                    # filter out empty strings and ".."
-                    keywords_values = [
-                        item for item in keywords_values if item and item != ".."
-                    ]
+        :param string: String read from the file.
+        :return: str: The shared instance of the string.
+        """
+        return self.interned_strings.setdefault(string, string)
+
+    def _decode_value(self, value, units=None):
+        """
+        Return the shared instance of a value read from the file, with its number decoded.
 
-                    if multiline_key:
-                        keywords_values.insert(0, multiline_key)
-                        multiline_value += line[15:].split(")")[0] + ")"
-                        keywords_values[1] = multiline_value
-                        multiline_key = None
-
-                    for i in range(0, len(keywords_values), 2):
-                        key = keywords_values[i]
-                        value = keywords_values[i + 1]
-                        if "(" in value:
-                            special_data[key] = self._parse_parentheses_values(value)
-                        else:
-                            special_data[key] = value
-
-                    if "(" in line and ")" not in line:
-                        multiline_key = keywords_values[-2]
-                        multiline_value = keywords_values[-1]
-
-                    # End special read block at `..`
-                    if ".." in line:
-                        special_read_flag = False
-                        if active_command_dict and "COEF" in special_data:
-                            active_command_dict["COEF"] = special_data["COEF"]
-                        special_data = {}
-
-            file_commands = self._group_by_command(file_commands)
-            return {"doe2_version": doe2_version, "file_commands": file_commands}
+        :param value: String read from the file, or a list of them.
+        :param units: Optional units that DOE-2 reports for the keyword.
+        :return: BDLValue, or a list of them.
+        """
+        if isinstance(value, list):
+            return [self._decode_value(item, units) for item in value]
+        if value is None:
+            return None
+        bdl_value = self.decoded_values.get((value, units))
+        if bdl_value is None:
+            bdl_value = self.decoded_values[(value, units)] = BDLValue(value, units)
+        return bdl_value
 
     @staticmethod
     def _parse_command_line(line):
@@ -0,0 +1,169 @@
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from rpd_generator.doe2_file_readers.bdl_index import BDLIndex
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.utilities.projection import expand_projection
+
+# Number of chunks per worker, so that workers that finish early take on the remaining chunks
+CHUNKS_PER_WORKER = 4
+
+
+def read_input_bdl_file_parallel(
+    bdl_file_path: str, max_workers=None, projection=None
+) -> dict:
+    """
+    Read a BDL file with Diagnostic Comments in two phases, see ModelInputReader.read_input_bdl_file.
+    Parents depend on the order of the objects in the file, so the first phase scans the command header and DATA FOR
+    lines sequentially for the unique name, command, parent and byte ranges of each object, see BDLIndex. The second
+    phase splits the objects into chunks of about equal size, which end at record boundaries, and parses the
+    keyword-value pairs of each chunk in a pool of processes. The chunks are merged in the order of the file.
+
+    :param bdl_file_path: Path to the BDL file.
+    :param max_workers: Optional number of worker processes. Defaults to the number of processors. With a single
+        worker the chunks are parsed in this process.
+    :param projection: Optional names of the parts of the model to read, see projection.expand_projection.
+    :return: A dictionary with the DOE-2 version and the file commands, see ModelInputReader.read_input_bdl_file.
+    """
+    commands = expand_projection(projection)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with BDLIndex(bdl_file_path) as bdl_index:
+        doe2_version = bdl_index.doe2_version
+        objects = [
+            (u_name, command, parent, byte_ranges)
+            for u_name, (command, parent, byte_ranges) in bdl_index.objects.items()
+            if commands is None or command in commands
+        ]
+
+    chunks = _split_into_chunks(objects, max_workers * CHUNKS_PER_WORKER)
+    if max_workers == 1:
+        _initialize_bdl_worker(str(bdl_file_path))
+        try:
+            chunk_results = [_parse_chunk_in_worker(chunk) for chunk in chunks]
+        finally:
+            _close_bdl_worker()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_bdl_worker,
+            initargs=(str(bdl_file_path),),
+        ) as executor:
+            chunk_results = list(executor.map(_parse_chunk_in_worker, chunks))
+
+    return {
+        "doe2_version": doe2_version,
+        "file_commands": _merge_chunk_results(objects, chunk_results),
+    }
+
+
+def _split_into_chunks(objects: list, chunk_count: int) -> list:
+    """
+    Split the objects into consecutive chunks with about the same number of bytes to parse.
+    :param objects: list of (u_name, command, parent, byte_ranges) in the order of the file
+    :param chunk_count: number of chunks to aim for
+    :return: list of lists of (u_name, byte_ranges)
+    """
+    sizes = [
+        sum(end - start for start, end in byte_ranges)
+        for _, _, _, byte_ranges in objects
+    ]
+    chunk_size = max(sum(sizes) / max(chunk_count, 1), 1)
+
+    chunks = []
+    chunk = []
+    size = 0
+    for (u_name, _, _, byte_ranges), object_size in zip(objects, sizes):
+        chunk.append((u_name, byte_ranges))
+        size += object_size
+        if size >= chunk_size:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _merge_chunk_results(objects: list, chunk_results: list) -> dict:
+    """
+    Merge the keyword-value pairs parsed by the workers into file commands grouped by command in the order of the
+    file. Strings that the workers interned separately are interned again across the whole file.
+    :param objects: list of (u_name, command, parent, byte_ranges) from the first phase
+    :param chunk_results: list of {u_name: command_dict} from the second phase
+    :return: dict: file commands, see ModelInputReader.read_input_bdl_file
+    """
+    parsed_objects = {}
+    for chunk_result in chunk_results:
+        parsed_objects.update(chunk_result)
+
+    interned_strings = {}
+    # Equal values with different units are decoded separately, see BDLValue
+    decoded_values = {}
+
+    def intern(value):
+        if isinstance(value, list):
+            return [intern(item) for item in value]
+        return decoded_values.setdefault(
+            (type(value), value, getattr(value, "units", None)), value
+        )
+
+    file_commands = {}
+    for u_name, command, parent, _ in objects:
+        command_dict = {
+            interned_strings.setdefault(keyword, keyword): intern(value)
+            for keyword, value in parsed_objects[u_name].items()
+        }
+        # The parents tracked by a worker only cover its chunk, so the parent is the one found in the first phase
+        if "parent" in command_dict:
+            command_dict["parent"] = parent
+        file_commands.setdefault(command, {})[
+            interned_strings.setdefault(u_name, u_name)
+        ] = command_dict
+    return file_commands
+
+
+_worker_bdl_file = None
+_worker_bdl_data = None
+_worker_model_input_reader = None
+
+
+def _initialize_bdl_worker(bdl_file_path: str):
+    global _worker_bdl_file, _worker_bdl_data, _worker_model_input_reader
+    _worker_bdl_file = open(bdl_file_path, "rb")
+    # An empty file cannot be mapped
+    _worker_bdl_data = (
+        mmap.mmap(_worker_bdl_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if os.fstat(_worker_bdl_file.fileno()).st_size
+        else b""
+    )
+    _worker_model_input_reader = ModelInputReader()
+
+
+def _close_bdl_worker():
+    global _worker_bdl_file, _worker_bdl_data
+    if isinstance(_worker_bdl_data, mmap.mmap):
+        _worker_bdl_data.close()
+    _worker_bdl_file.close()
+    _worker_bdl_file = _worker_bdl_data = None
+
+
+def _parse_chunk_in_worker(chunk: list) -> dict:
+    """
+    Parse the command header and DATA FOR records of each object of a chunk.
+    :param chunk: list of (u_name, byte_ranges)
+    :return: dict: {u_name: command_dict}
+    """
+    chunk_data = b"\n".join(
+        _worker_bdl_data[start:end]
+        for _, byte_ranges in chunk
+        for start, end in byte_ranges
+    )
+    lines = io.TextIOWrapper(io.BytesIO(chunk_data))
+    file_commands = _worker_model_input_reader.read_bdl_lines(lines)["file_commands"]
+    parsed_objects = {}
+    for command_group in file_commands.values():
+        parsed_objects.update(command_group)
+    return {u_name: parsed_objects[u_name] for u_name, _ in chunk}
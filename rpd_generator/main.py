@@ -1,8 +1,11 @@
+import argparse
+import atexit
+import copy
+import functools
 import json
-import shutil
-import tempfile
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 from rpd_generator.artifacts.ruleset_project_description import (
     RulesetProjectDescription,
@@ -10,139 +13,487 @@ from rpd_generator.artifacts.ruleset_project_description import (
 from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
 from rpd_generator.artifacts.building_segment import BuildingSegment
 from rpd_generator.artifacts.building import Building
-from rpd_generator.doe2_file_readers.bdlcio32 import process_input_file
+from rpd_generator.doe2_file_readers.bdlcio32 import Bdlcio32Converter
 from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
 from rpd_generator.bdl_structure import *
+from rpd_generator.bdl_structure.bdl_commands.schedule import Schedule
 from rpd_generator.config import Config
 from rpd_generator.utilities import validate_configuration
 from rpd_generator.utilities import unit_converter
 from rpd_generator.utilities import ensure_valid_rpd
+from rpd_generator.utilities import incremental_regeneration
+from rpd_generator.utilities import definition_reachability
+from rpd_generator.utilities import model_staging
+from rpd_generator.utilities.profiling import profiler
+from rpd_generator.utilities.projection import expand_projection
+from rpd_generator.utilities.progress import NULL_PROGRESS
+
+
+def write_rpd_json_from_inp(inp_path_str, progress=None):
+    """
+    Generate an RPD JSON file next to an INP file.
+    :param inp_path_str: path of the INP file
+    :param progress: (ProgressReporter) receives progress events, and may cancel the generation between steps
+    """
+    inp_path = Path(inp_path_str)
+    progress = progress or NULL_PROGRESS
+    processing_dir = model_staging.get_processing_dir(inp_path)
+    # Stage the files for processing in the project's processing directory
+    progress.report("Preparing model files")
+    bdl_path = stage_inp(inp_path, processing_dir)
+
+    # Generate the RPD json file in the project directory
+    write_rpd_json_from_bdl(
+        str(bdl_path), str(inp_path.with_suffix(".json")), progress=progress
+    )
 
 
-def write_rpd_json_from_inp(inp_path_str):
-    inp_path = Path(inp_path_str)
-    # Create a temporary directory to store the files for processing
-    with tempfile.TemporaryDirectory() as temp_dir:
-
-        # Prepare the inp file for processing and save the revised copy to the temporary directory
-        temp_file_path = prepare_inp(inp_path, Path(temp_dir))
-
-        # Copy the model output files to the temporary directory (.erp, .lrp, .srp, .nhk)
-        copy_files_to_temp_dir(inp_path, Path(temp_dir))
-
-        # Set the paths for the inp file, json file, and the directories
-        temp_inp_path = Path(temp_file_path)
-        bdl_path = temp_inp_path.with_suffix(".BDL")
-        json_path = temp_inp_path.with_suffix(".json")
-        doe23_path = Path(Config.DOE23_DATA_PATH) / "DOE23"
-        bdlcio32_path = Path(Config.EQUEST_INSTALL_PATH) / "Bdlcio32.dll"
-
-        # Process the inp file to create the BDL file with Diagnostic Comments (defaults and evaluated values) in the temporary directory
-        process_input_file(
-            str(bdlcio32_path),
-            str(doe23_path) + "\\",
-            str(temp_inp_path.parent) + "\\",
-            temp_inp_path.name,
+def write_rpd_json_from_bdl(
+    bdl_path: str, json_file_path: str, incremental=False, progress=None
+):
+    """
+    Generate an RPD JSON file from a BDL file.
+    :param bdl_path: path of the BDL file
+    :param json_file_path: path of the RPD JSON file to write
+    :param incremental: when True, reuse the previous generation cached next to json_file_path and repopulate only
+        the systems affected by changes to the BDL file since then. Falls back to a full generation when there is no
+        cache or the changes cannot be patched into the previous RPD.
+    :param progress: (ProgressReporter) receives progress events, and may cancel the generation between steps
+    """
+    progress = progress or NULL_PROGRESS
+    bdl_input_reader = ModelInputReader()
+    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+    progress.report("Parsing BDL file")
+    with profiler.span("read_input_bdl_file", "RPD", Path(bdl_path).name):
+        model_input_data = bdl_input_reader.read_input_bdl_file(bdl_path)
+
+    write_rpd_json_from_model_input_data(
+        bdl_path, model_input_data, json_file_path, incremental, progress
+    )
+
+
+def write_rpd_json_from_model_input_data(
+    bdl_path: str,
+    model_input_data: dict,
+    json_file_path: str,
+    incremental=False,
+    progress=None,
+):
+    """
+    Generate an RPD JSON file from the model input data read from a BDL file.
+    :param bdl_path: path of the model in the processing directory, next to its simulation output files
+    :param model_input_data: (dict) model input data, see ModelInputReader.read_input_bdl_file
+    :param json_file_path: path of the RPD JSON file to write
+    :param incremental: see write_rpd_json_from_bdl
+    :param progress: (ProgressReporter) receives progress events, and may cancel the generation between steps
+    """
+    progress = progress or NULL_PROGRESS
+    rpd_data_structure = None
+    if incremental:
+        # Populating the objects modifies their keyword-value pairs, so the parse is cached as it was read
+        parsed_model_input_data = copy.deepcopy(model_input_data)
+        rpd_data_structure = _regenerate_rpd_from_previous(
+            bdl_path, json_file_path, model_input_data, progress
+        )
+    if rpd_data_structure is None:
+        rpd_data_structure = _generate_rpd(
+            bdl_path, model_input_data, progress=progress
+        )
+    if incremental:
+        incremental_regeneration.write_generation_cache(
+            json_file_path, parsed_model_input_data, rpd_data_structure
         )
 
-        # Generate the RPD json file in the temporary directory
-        write_rpd_json_from_bdl(str(bdl_path), str(json_path))
+    progress.report("Post-processing")
+    with profiler.span("make_ids_unique", "RPD"):
+        ensure_valid_rpd.make_ids_unique(rpd_data_structure)
+    with profiler.span("convert_to_schema_units", "RPD"):
+        unit_converter.convert_to_schema_units(rpd_data_structure)
+    with profiler.span("write_json", "RPD"):
+        with open(json_file_path, "w") as json_file:
+            json.dump(rpd_data_structure, json_file, indent=4)
 
-        # Copy the json file from the temporary directory back to the project directory
-        shutil.copy(str(json_path), inp_path.parent)
+    print(f"RPD JSON file created.")
 
+    if profiler.enabled:
+        report_path, trace_path = profiler.write_reports(json_file_path)
+        print(f"Profiling report written to {report_path} and {trace_path}")
 
-def write_rpd_json_from_bdl(bdl_path: str, json_file_path: str):
-    bdl_input_reader = ModelInputReader()
-    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+
+def _generate_rpd(
+    bdl_path: str, model_input_data: dict, skipped_u_names=None, progress=None
+):
     rpd = RulesetProjectDescription()
-    rmd = generate_rmds_from_bdls(bdl_input_reader, [bdl_path])[0]
+    rmd = generate_rmd_from_model_input_data(bdl_path, model_input_data, progress)
     # Add the RPD object to the bdl_obj_instances dictionary
     rmd.bdl_obj_instances["ASHRAE 229"] = rpd
     # Populate 229 data structures associated with the BDL objects
-    rmd.populate_rmd_data()
+    rmd.populate_rmd_data(skipped_u_names=skipped_u_names, progress=progress)
     # Insert the RMD data into the RPD data structure
     rmd.insert_to_rpd(rpd)
 
-    rpd.populate_data_group()
-    ensure_valid_rpd.make_ids_unique(rpd.rpd_data_structure)
-    unit_converter.convert_to_schema_units(rpd.rpd_data_structure)
-    with open(json_file_path, "w") as json_file:
-        json.dump(rpd.rpd_data_structure, json_file, indent=4)
+    with profiler.span("populate_data_group", "RPD"):
+        rpd.populate_data_group()
+    return rpd.rpd_data_structure
 
-    print(f"RPD JSON file created.")
+
+def _regenerate_rpd_from_previous(
+    bdl_path: str, json_file_path: str, model_input_data: dict, progress=None
+):
+    """
+    Regenerate the systems affected by changes since the previous parse of the BDL file and patch them into the
+    previous RPD. Simulation results of the unaffected systems and zones are carried over from the previous RPD.
+    :return: the patched RPD, or None if a full generation is required
+    """
+    previous_generation = incremental_regeneration.load_previous_generation(
+        json_file_path
+    )
+    if previous_generation is None:
+        return None
+    previous_model_input_data, previous_rpd = previous_generation
+    if previous_model_input_data["doe2_version"] != model_input_data["doe2_version"]:
+        return None
+
+    previous_file_commands = previous_model_input_data["file_commands"]
+    file_commands = model_input_data["file_commands"]
+    changed = incremental_regeneration.diff_file_commands(
+        previous_file_commands, file_commands
+    )
+    if changed is None:
+        return None
+    affected_systems = incremental_regeneration.get_affected_systems(
+        previous_file_commands, file_commands, changed
+    )
+    if affected_systems is None:
+        return None
+
+    regenerated_rpd = _generate_rpd(
+        bdl_path,
+        model_input_data,
+        incremental_regeneration.get_skipped_u_names(file_commands, affected_systems),
+        progress,
+    )
+    with profiler.span("merge_regenerated_rpd", "RPD"):
+        rpd_data_structure = incremental_regeneration.merge_regenerated_rpd(
+            previous_rpd, regenerated_rpd, file_commands, affected_systems
+        )
+    if rpd_data_structure is not None:
+        print(
+            f"Regenerated {len(affected_systems)} of {len(file_commands.get('SYSTEM', {}))} systems."
+        )
+    return rpd_data_structure
 
 
-def generate_rmds_from_bdls(bdl_input_reader: ModelInputReader, selected_models: list):
+def generate_rmds_from_bdls(
+    bdl_input_reader: ModelInputReader,
+    selected_models: list,
+    progress=None,
+    projection=None,
+):
+    """
+    Generate the RMD of each BDL file.
+    :param bdl_input_reader: ModelInputReader that reads the BDL files
+    :param selected_models: paths of the BDL files
+    :param progress: (ProgressReporter) receives progress events, and may cancel the generation between steps
+    :param projection: optional names of the parts of the models to generate, see projection.expand_projection.
+        Pass the same projection to populate_rmd_data.
+    :return: list of RMDs in the order of selected_models
+    """
+    progress = progress or NULL_PROGRESS
     rmds = []
     for model_path_str in selected_models:
-        model_path = Path(model_path_str)
-        rmd = RulesetModelDescription(model_path.stem)
-        rmd.file_path = str(model_path.with_suffix(""))
+        progress.report("Parsing BDL file")
+        with profiler.span("read_input_bdl_file", "RPD", Path(model_path_str).name):
+            model_input_data = bdl_input_reader.read_input_bdl_file(
+                model_path_str, projection
+            )
+        rmds.append(
+            generate_rmd_from_model_input_data(
+                model_path_str, model_input_data, progress, projection
+            )
+        )
+    return rmds
+
 
-        default_building = Building("Default Building", rmd)
-        default_building_segment = BuildingSegment(
-            "Default Building Segment", default_building
+def generate_rmd_from_model_input_data(
+    model_path_str: str, model_input_data: dict, progress=None, projection=None
+):
+    progress = progress or NULL_PROGRESS
+    projected_commands = expand_projection(projection)
+    model_path = Path(model_path_str)
+    rmd = RulesetModelDescription(model_path.stem)
+    rmd.file_path = str(model_path.with_suffix(""))
+
+    default_building = Building("Default Building", rmd)
+    default_building_segment = BuildingSegment(
+        "Default Building Segment", default_building
+    )
+    rmd.bdl_obj_instances["Default Building"] = default_building
+    rmd.bdl_obj_instances["Default Building Segment"] = default_building_segment
+
+    rmd.doe2_version = model_input_data["doe2_version"]
+    if rmd.doe2_version is not None:
+        rmd.doe2_data_path = (
+            Config.DOE23_DATA_PATH
+            if rmd.doe2_version.split("-")[1] == "2.3"
+            else Config.DOE22_DATA_PATH
         )
-        rmd.bdl_obj_instances["Default Building"] = default_building
-        rmd.bdl_obj_instances["Default Building Segment"] = default_building_segment
-
-        model_input_data = bdl_input_reader.read_input_bdl_file(str(model_path))
-        rmd.doe2_version = model_input_data["doe2_version"]
-        if rmd.doe2_version is not None:
-            rmd.doe2_data_path = (
-                Config.DOE23_DATA_PATH
-                if rmd.doe2_version.split("-")[1] == "2.3"
-                else Config.DOE22_DATA_PATH
-            )
 
-        for command in rmd.COMMAND_PROCESSING_ORDER:
-            special_handling = {}
-            if command == "ZONE":
-                special_handling["ZONE"] = (
-                    lambda obj, cmd_dict: rmd.space_map.setdefault(
-                        cmd_dict["SPACE"], obj
-                    )
-                )
+    # Definitions that nothing in the model references are only created if they are accessed
+    unreferenced_definitions = definition_reachability.get_unreferenced_definitions(
+        model_input_data["file_commands"]
+    )
+    for i, command in enumerate(rmd.COMMAND_PROCESSING_ORDER):
+        progress.report("Creating objects", i + 1, len(rmd.COMMAND_PROCESSING_ORDER))
+        if projected_commands is not None and command not in projected_commands:
+            continue
+        special_handling = {}
+        if command == "ZONE":
+            special_handling["ZONE"] = lambda obj, cmd_dict: rmd.space_map.setdefault(
+                cmd_dict["SPACE"], obj
+            )
+        with profiler.span("create_objects", command):
             _process_command_group(
                 command,
                 model_input_data["file_commands"],
                 rmd,
                 special_handling,
+                unreferenced_definitions.get(command),
             )
-        rmds.append(rmd)
-    return rmds
+    return rmd
 
 
-def generate_rmd_from_inp(inp_path_str: str, processing_dir: TemporaryDirectory):
+def generate_rmd_from_inp(
+    inp_path_str: str, processing_dir: Path = None, progress=None
+):
     inp_path = Path(inp_path_str)
-    temp_dir = processing_dir.name
+    progress = progress or NULL_PROGRESS
+    if processing_dir is None:
+        processing_dir = model_staging.get_processing_dir(inp_path)
+
+    progress.report("Preparing model files")
+    bdl_path = stage_inp(inp_path, Path(processing_dir))
 
-    # Prepare the inp file for processing and save the revised copy to the temporary directory
-    temp_file_path = prepare_inp(inp_path, Path(temp_dir))
+    # Generate the RMD object from the BDL file in the processing directory
+    bdl_input_reader = ModelInputReader()
+    rmd = generate_rmds_from_bdls(bdl_input_reader, [str(bdl_path)], progress)[0]
 
-    # Copy the model output files to the temporary directory (.erp, .lrp, .srp, .nhk)
-    copy_files_to_temp_dir(inp_path, Path(temp_dir))
+    return rmd
 
-    # Set the paths for the inp file, json file, and the directories
-    temp_inp_path = Path(temp_file_path)
-    bdl_path = temp_inp_path.with_suffix(".BDL")
-    doe23_path = Path(Config.DOE23_DATA_PATH) / "DOE23"
-    bdlcio32_path = Path(Config.EQUEST_INSTALL_PATH) / "Bdlcio32.dll"
-
-    # Process the inp file to create the BDL file with Diagnostic Comments (defaults and evaluated values) in the temporary directory
-    process_input_file(
-        str(bdlcio32_path),
-        str(doe23_path) + "\\",
-        str(temp_inp_path.parent) + "\\",
-        temp_inp_path.name,
+
+# Class attributes set on Schedule while the project calendar objects populate
+SCHEDULE_CALENDAR_ATTRIBUTES = [
+    "year",
+    "day_of_week_for_january_1",
+    "holiday_type",
+    "holiday_months",
+    "holiday_days",
+    "annual_calendar",
+]
+
+
+def generate_populated_rmds(
+    inp_path_strs: list,
+    rpd: RulesetProjectDescription,
+    max_workers=None,
+    progress=None,
+    mp_context=None,
+) -> list:
+    """
+    Generate and populate the RMD of each INP file. The models are independent, so when there are several each one is
+    generated in its own worker process. Project-level data is merged into rpd in the order of inp_path_strs, as if
+    the models were populated one after the other.
+    :param inp_path_strs: paths of the INP files, e.g. the proposed model and the baseline rotations
+    :param rpd: RulesetProjectDescription that the RMDs belong to
+    :param max_workers: (int) number of worker processes, defaults to one per model up to the number of CPUs. With a
+        single worker the models are generated in this process.
+    :param progress: (ProgressReporter) receives progress events, and may cancel the generation. Worker processes
+        only report when each model is complete, and models already running in a worker finish in the background.
+    :param mp_context: (multiprocessing context) starts the worker processes, defaults to the platform's start method
+    :return: list of populated RMDs in the order of inp_path_strs
+    """
+    progress = progress or NULL_PROGRESS
+    if max_workers is None:
+        max_workers = min(len(inp_path_strs), os.cpu_count() or 1)
+    # Convert the INP files together, so that the models are not converted one after the other in their workers
+    progress.report("Preparing model files")
+    stage_inps(
+        inp_path_strs,
+        [model_staging.get_processing_dir(Path(path)) for path in inp_path_strs],
     )
+    if max_workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_initialize_rmd_worker,
+            initargs=(
+                Config.EQUEST_INSTALL_PATH and str(Config.EQUEST_INSTALL_PATH),
+                Config.DOE22_DATA_PATH and str(Config.DOE22_DATA_PATH),
+                Config.DOE23_DATA_PATH and str(Config.DOE23_DATA_PATH),
+                Config.ACTIVE_RULESET,
+            ),
+        )
+        try:
+            futures = [
+                executor.submit(_generate_populated_rmd, path) for path in inp_path_strs
+            ]
+            pending = set(futures)
+            while pending:
+                progress.report(
+                    "Generating models", len(futures) - len(pending), len(futures)
+                )
+                _, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            progress.report("Generating models", len(futures), len(futures))
+            results = [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=not progress.is_cancelled(), cancel_futures=True)
+    else:
+        results = [_generate_populated_rmd(path, progress) for path in inp_path_strs]
 
-    # Generate the RMD object from the BDL file in the temporary directory
-    bdl_input_reader = ModelInputReader()
-    rmd = generate_rmds_from_bdls(bdl_input_reader, [str(bdl_path)])[0]
+    rmds = []
+    for rmd, project_data in results:
+        for key, value in project_data["calendar"].items():
+            rpd.calendar.setdefault(key, value)
+        for key, value in project_data["weather"].items():
+            rpd.weather.setdefault(key, value)
+        for attr, value in project_data["schedule_calendar"].items():
+            setattr(Schedule, attr, value)
+        rmd.bdl_obj_instances["ASHRAE 229"] = rpd
+        rmds.append(rmd)
+    return rmds
 
-    return rmd
+
+def _initialize_rmd_worker(
+    equest_install_path, doe22_data_path, doe23_data_path, active_ruleset
+):
+    Config.EQUEST_INSTALL_PATH = equest_install_path
+    Config.DOE22_DATA_PATH = doe22_data_path
+    Config.DOE23_DATA_PATH = doe23_data_path
+    Config.use_ruleset(active_ruleset)
+
+
+def _generate_populated_rmd(inp_path_str: str, progress=None):
+    """
+    Generate and populate the RMD of an INP file against its own RulesetProjectDescription.
+    :return: tuple of the RMD and the project-level data its objects populated
+    """
+    rpd = RulesetProjectDescription()
+    RulesetProjectDescription.bdl_command_dict = ModelInputReader().bdl_command_dict
+    rmd = generate_rmd_from_inp(inp_path_str, progress=progress)
+    rmd.bdl_obj_instances["ASHRAE 229"] = rpd
+    rmd.populate_rmd_data(progress=progress)
+    project_data = {
+        "calendar": rpd.calendar,
+        "weather": rpd.weather,
+        "schedule_calendar": {
+            attr: getattr(Schedule, attr) for attr in SCHEDULE_CALENDAR_ATTRIBUTES
+        },
+    }
+    return rmd, project_data
+
+
+def stage_inp(inp_path: Path, processing_dir: Path, converter=None) -> Path:
+    """
+    Prepare an INP file, process it into a BDL file with Diagnostic Comments and stage the model output files in the
+    processing directory. Preparing and processing are skipped when the INP file has not changed since the last run.
+    :param inp_path: path of the INP file
+    :param processing_dir: directory where the files are staged, see model_staging.get_processing_dir
+    :param converter: (InpConverter) converts the prepared INP file, see get_inp_converter by default
+    :return: path of the BDL file
+    """
+    return stage_inps([inp_path], [processing_dir], converter)[0]
+
+
+def stage_inps(inp_paths: list, processing_dirs: list, converter=None) -> list:
+    """
+    Stage several INP files like stage_inp. The INP files that need processing are converted together, so that the
+    converter can process them concurrently.
+    :param inp_paths: paths of the INP files
+    :param processing_dirs: processing directory of each INP file
+    :return: list of the paths of the BDL files in the order of inp_paths
+    :raises FileNotFoundError: if the converter did not write the BDL file of an INP file
+    """
+    doe23_path = Path(Config.DOE23_DATA_PATH) / "DOE23"
+    inp_paths = [Path(inp_path) for inp_path in inp_paths]
+    processing_dirs = [Path(processing_dir) for processing_dir in processing_dirs]
+
+    converted_inp_paths = []
+    for inp_path, processing_dir in zip(inp_paths, processing_dirs):
+        if not model_staging.is_prepared_inp_current(
+            inp_path, processing_dir, str(doe23_path)
+        ):
+            # The processing directory is reused, so the BDL file of the previous run is removed. A conversion that
+            # fails without writing a BDL file then cannot leave the previous model in its place.
+            (processing_dir / inp_path.name).with_suffix(".BDL").unlink(missing_ok=True)
+            # Prepare the inp file for processing and save the revised copy to the processing directory
+            prepare_inp(inp_path, processing_dir)
+            converted_inp_paths.append((inp_path, processing_dir))
+
+    if converted_inp_paths:
+        # Process the inp files to create the BDL files with Diagnostic Comments (defaults and evaluated values)
+        (converter or get_inp_converter()).convert_all(
+            [
+                processing_dir / inp_path.name
+                for inp_path, processing_dir in converted_inp_paths
+            ]
+        )
+        unconverted_inp_paths = []
+        for inp_path, processing_dir in converted_inp_paths:
+            if (processing_dir / inp_path.name).with_suffix(".BDL").is_file():
+                model_staging.record_prepared_inp(
+                    inp_path, processing_dir, str(doe23_path)
+                )
+            else:
+                unconverted_inp_paths.append(str(inp_path))
+        if unconverted_inp_paths:
+            raise FileNotFoundError(
+                f"No BDL file was written for: {', '.join(unconverted_inp_paths)}"
+            )
+
+    # Link the model output files into the processing directory (.erp, .lrp, .srp, .nhk)
+    for inp_path, processing_dir in zip(inp_paths, processing_dirs):
+        for model_file in model_staging.stage_output_files(inp_path, processing_dir):
+            print(f"File {model_file} not found in {model_file.parent}")
+
+    return [
+        (processing_dir / inp_path.name).with_suffix(".BDL")
+        for inp_path, processing_dir in zip(inp_paths, processing_dirs)
+    ]
+
+
+# Converter of the INP files processed by this process, see get_inp_converter
+_inp_converter = None
+
+
+def get_inp_converter():
+    """
+    Return the converter of the INP files processed by this process. By default, it is a Bdlcio32Converter whose
+    worker processes are started on the first conversion and kept until the process exits.
+    """
+    global _inp_converter
+    if _inp_converter is None:
+        set_inp_converter(
+            Bdlcio32Converter(
+                str(Path(Config.EQUEST_INSTALL_PATH) / "Bdlcio32.dll"),
+                str(Path(Config.DOE23_DATA_PATH) / "DOE23") + "\\",
+            )
+        )
+    return _inp_converter
+
+
+def set_inp_converter(converter):
+    """
+    Replace the converter of the INP files processed by this process, e.g. with a CopyBdlConverter for tests and
+    benchmarks. The previous converter is closed.
+    :param converter: (InpConverter) the new converter, or None to go back to the default
+    """
+    global _inp_converter
+    if _inp_converter is not None:
+        atexit.unregister(_inp_converter.close)
+        _inp_converter.close()
+    _inp_converter = converter
+    if converter is not None:
+        atexit.register(converter.close)
 
 
 def prepare_inp(model_path: Path, output_dir: Path = None) -> str:
@@ -180,27 +531,6 @@ def prepare_inp(model_path: Path, output_dir: Path = None) -> str:
     return str(temp_file_path)
 
 
-def copy_files_to_temp_dir(inp_path, temp_dir):
-    file_extensions = [".erp", ".lrp", ".srp", ".nhk"]
-    model_dir = inp_path.parent
-    model_name = inp_path.stem
-
-    for ext in file_extensions:
-
-        model_file = model_dir / f"{model_name}{ext}"
-        alternate_search_file = model_dir / f"{model_name} - Baseline Design{ext}"
-
-        if model_file.exists():
-            shutil.copy2(model_file, temp_dir)
-
-        elif alternate_search_file.exists():
-            destination_file = temp_dir / f"{model_name}{ext}"
-            shutil.copy2(alternate_search_file, destination_file)
-
-        else:
-            print(f"File {model_file} not found in {model_dir}")
-
-
 def _create_obj_instance(u_name, command, command_dict, rmd):
     command_class = RulesetProjectDescription.bdl_command_dict[command]
     is_child = command in [
@@ -230,9 +560,18 @@ def _process_command_group(
     file_bdl_commands: dict,
     rmd: RulesetModelDescription,
     special_handling=None,
+    deferred_u_names=None,
 ):
     for u_name in file_bdl_commands.get(command_group, {}):
         cmd_dict = file_bdl_commands[command_group][u_name]
+        if deferred_u_names and u_name in deferred_u_names:
+            rmd.bdl_obj_instances.defer(
+                u_name,
+                functools.partial(
+                    _create_deferred_obj, u_name, command_group, cmd_dict, rmd
+                ),
+            )
+            continue
         obj = _create_obj_instance(u_name, command_group, cmd_dict, rmd)
         if special_handling and command_group in special_handling:
             special_handling[command_group](obj, cmd_dict)
@@ -240,7 +579,32 @@ def _process_command_group(
         rmd.bdl_obj_instances[u_name] = obj
 
 
+def _create_deferred_obj(u_name, command, command_dict, rmd):
+    with profiler.span("create_objects", command, u_name):
+        obj = _create_obj_instance(u_name, command, command_dict, rmd)
+        obj.add_inputs(command_dict)
+        rmd.bdl_obj_instances[u_name] = obj
+    rmd.populate_deferred_obj(obj)
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate an RPD JSON file.")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="OUTPUT_DIR",
+        help="Write a profiling report and a Chrome trace-event file. Defaults to the RPD directory.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Repopulate only the systems affected by changes to the BDL file since the previous run.",
+    )
+    args = parser.parse_args()
+    if args.profile is not None:
+        profiler.enable(args.profile or None)
 
     # Test generating an RPD JSON file from one of the test BDL files
     validate_configuration.find_equest_installation()
@@ -260,4 +624,5 @@ if __name__ == "__main__":
             / "E-1"
             / "229 Test Case E-1 (PSZHP).json"
         ),
+        incremental=args.incremental,
     )
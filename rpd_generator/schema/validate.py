@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 import jsonschema
 
@@ -292,7 +293,11 @@ def non_schema_validate_rmd(rmd_obj):
     return {"passed": passed, "error": error if error else None}
 
 
-def schema_validate_rmd(rmd_obj):
+@lru_cache(maxsize=None)
+def get_schema_validator():
+    """
+    Load the schemas and compile the validator once per process.
+    """
     with open(SCHEMA_PATH) as json_file:
         schema = json.load(json_file)
     with open(SCHEMA_ENUM_PATH) as json_file:
@@ -308,7 +313,11 @@ def schema_validate_rmd(rmd_obj):
     resolver = jsonschema.RefResolver.from_schema(schema, store=schema_map)
 
     validator = jsonschema.validators.validator_for(schema)
-    validator = validator(schema, resolver=resolver)
+    return validator(schema, resolver=resolver)
+
+
+def schema_validate_rmd(rmd_obj):
+    validator = get_schema_validator()
 
     try:
         validator.validate(rmd_obj)
@@ -0,0 +1,53 @@
+# BDL commands that define library data used by other objects. They are only created when something in the model
+# references them. SCHEDULE-PD is not deferred because every schedule is written to the RPD.
+DEFERRABLE_COMMANDS = [
+    "MATERIAL",
+    "LAYERS",
+    "CONSTRUCTION",
+    "GLASS-TYPE",
+    "CURVE-FIT",
+    "DAY-SCHEDULE-PD",
+    "WEEK-SCHEDULE-PD",
+]
+
+
+def get_unreferenced_definitions(file_commands: dict) -> dict:
+    """
+    Find the definitions that are not referenced, directly or through other definitions, by any other object of the
+    model. Every keyword value that matches the u_name of a definition counts as a reference.
+    :param file_commands: file_commands of a parse
+    :return: dictionary of command: set of u_names
+    """
+    definition_commands = {
+        u_name: command
+        for command in DEFERRABLE_COMMANDS
+        for u_name in file_commands.get(command, {})
+    }
+
+    referenced = set()
+    to_visit = [
+        command_dict
+        for command, command_dicts in file_commands.items()
+        if command not in DEFERRABLE_COMMANDS
+        for command_dict in command_dicts.values()
+    ]
+    while to_visit:
+        command_dict = to_visit.pop()
+        for u_name in _get_referenced_names(command_dict, definition_commands):
+            if u_name not in referenced:
+                referenced.add(u_name)
+                to_visit.append(file_commands[definition_commands[u_name]][u_name])
+
+    unreferenced = {}
+    for u_name, command in definition_commands.items():
+        if u_name not in referenced:
+            unreferenced.setdefault(command, set()).add(u_name)
+    return unreferenced
+
+
+def _get_referenced_names(command_dict: dict, definition_commands: dict):
+    for value in command_dict.values():
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if isinstance(item, str) and item in definition_commands:
+                yield item
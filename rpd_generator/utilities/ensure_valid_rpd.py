@@ -1,5 +1,4 @@
 import re
-import copy
 
 
 def make_ids_unique(
@@ -32,7 +31,9 @@ def make_ids_unique(
 
         if obj_id in visited:
             if parent is not None and key is not None:
-                data_copy = copy.deepcopy(data)
+                # Shared data groups, e.g. the constructions of surfaces, are copied where they are revisited so
+                # that each occurrence gets its own ids
+                data_copy = _copy_data_structure(data)
                 parent[key] = data_copy
                 data = data_copy
                 obj_id = id(data)
@@ -42,27 +43,7 @@ def make_ids_unique(
         visited.add(obj_id)
 
         if "id" in data:
-            current_id = data["id"]
-
-            if current_id in seen_ids:
-                match = re.search(r"--(\d+)$", current_id)
-                if match:
-                    number = int(match.group(1)) + 1
-                    unique_id = re.sub(r"--\d+$", f"--{number}", current_id)
-                else:
-                    seen_ids[current_id] += 1
-                    unique_id = f"{current_id}--{seen_ids[current_id]}"
-
-                while unique_id in seen_ids:
-                    match = re.search(r"--(\d+)$", unique_id)
-                    if match:
-                        number = int(match.group(1)) + 1
-                        unique_id = re.sub(r"--\d+$", f"--{number}", unique_id)
-
-                data["id"] = unique_id
-                seen_ids[unique_id] = 0
-            else:
-                seen_ids[current_id] = 0
+            data["id"] = _get_unique_id(data["id"], seen_ids)
 
         keys_to_remove = []
         for k, value in list(data.items()):
@@ -96,3 +77,43 @@ def make_ids_unique(
 
         for item in items_to_remove:
             data.remove(item)
+
+
+def _copy_data_structure(data: dict | list) -> dict | list:
+    """
+    Copy the dictionaries and lists of a data structure. Other values are immutable and are not copied.
+    """
+    if isinstance(data, dict):
+        return {k: _copy_data_structure(value) for k, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_data_structure(item) for item in data]
+    return data
+
+
+def _get_unique_id(current_id, seen_ids: dict):
+    """
+    Return the id with a number appended to the end of it if it has been seen, and mark the returned id as seen.
+    :param current_id: id of a data group
+    :param seen_ids: dictionary of ids that have been seen with a counter
+    :return: unique id
+    """
+    if current_id not in seen_ids:
+        seen_ids[current_id] = 0
+        return current_id
+
+    match = re.search(r"--(\d+)$", current_id)
+    if match:
+        number = int(match.group(1)) + 1
+        unique_id = re.sub(r"--\d+$", f"--{number}", current_id)
+    else:
+        seen_ids[current_id] += 1
+        unique_id = f"{current_id}--{seen_ids[current_id]}"
+
+    while unique_id in seen_ids:
+        match = re.search(r"--(\d+)$", unique_id)
+        if match:
+            number = int(match.group(1)) + 1
+            unique_id = re.sub(r"--\d+$", f"--{number}", unique_id)
+
+    seen_ids[unique_id] = 0
+    return unique_id
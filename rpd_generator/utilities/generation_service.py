@@ -0,0 +1,309 @@
+import contextlib
+import io
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from rpd_generator import main
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers.bdlcio32 import Bdlcio32Converter
+from rpd_generator.doe2_file_readers.model_output_reader import get_nhr_dict
+from rpd_generator.schema import validate
+from rpd_generator.utilities import unit_converter
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8229
+# Finished jobs are kept so that clients can collect their results, up to this many
+MAX_FINISHED_JOBS = 1000
+
+
+def _initialize_worker(
+    equest_install_path, doe22_data_path, doe23_data_path, active_ruleset
+):
+    """
+    Runs once in each worker process. Imports, schemas, unit resources, the NHRList index and the INP converter are
+    loaded here so that jobs do not pay for them.
+    """
+    Config.EQUEST_INSTALL_PATH = equest_install_path
+    Config.DOE22_DATA_PATH = doe22_data_path
+    Config.DOE23_DATA_PATH = doe23_data_path
+    Config.use_ruleset(active_ruleset)
+    if equest_install_path and doe23_data_path:
+        # Each job converts one model, so one BDLCIO32 worker kept warm per job worker is enough
+        main.set_inp_converter(
+            Bdlcio32Converter(
+                str(Path(equest_install_path) / "Bdlcio32.dll"),
+                str(Path(doe23_data_path) / "DOE23") + "\\",
+                max_workers=1,
+            )
+        )
+    validate.get_schema_validator()
+    unit_converter.load_unit_resources()
+    if doe23_data_path:
+        with contextlib.suppress(OSError):
+            get_nhr_dict(f"{doe23_data_path}/DOE23/NHRList.txt")
+
+
+def _run_generate_job(request: dict) -> dict:
+    if request.get("inp_path"):
+        main.write_rpd_json_from_inp(request["inp_path"])
+        return {}
+    main.write_rpd_json_from_bdl(
+        request["bdl_path"],
+        request["json_path"],
+        incremental=bool(request.get("incremental", False)),
+    )
+    return {"json_path": request["json_path"]}
+
+
+def _run_validate_job(request: dict) -> dict:
+    with open(request["json_path"]) as json_file:
+        rpd = json.load(json_file)
+    return validate.validate_rmd(rpd, test=bool(request.get("schema_only", False)))
+
+
+JOB_TYPES = {
+    "generate": (_run_generate_job, ["bdl_path", "json_path"]),
+    "validate": (_run_validate_job, ["json_path"]),
+}
+
+
+def run_job(request: dict) -> dict:
+    """
+    Run one job in a worker process and capture anything it prints.
+    :param request: job request, see GenerationService.submit
+    :return: dictionary with the job result and the captured log
+    """
+    run_function, _ = JOB_TYPES[request["type"]]
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = run_function(request)
+    return {"result": result, "log": log.getvalue()}
+
+
+class Job:
+    """Bookkeeping for a submitted job. The work itself runs in the worker pool."""
+
+    def __init__(self, request: dict):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = "queued"
+        self.future = None
+        self.result = None
+        self.log = ""
+        self.error = None
+        self.submitted = time.time()
+        self.finished = None
+        self.done = threading.Event()
+
+    def to_dict(self) -> dict:
+        status = self.status
+        if status == "queued" and self.future is not None and self.future.running():
+            status = "running"
+        return {
+            "id": self.id,
+            "type": self.request["type"],
+            "status": status,
+            "result": self.result,
+            "log": self.log,
+            "error": self.error,
+            "submitted": self.submitted,
+            "finished": self.finished,
+        }
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class GenerationService:
+    """
+    Runs generate and validate jobs on a bounded pool of warm worker processes. Jobs beyond the pool size wait in a
+    queue of at most max_queued_jobs; further submissions are rejected until the queue drains.
+    """
+
+    def __init__(self, max_workers=2, max_queued_jobs=64):
+        self.max_workers = max_workers
+        self.max_queued_jobs = max_queued_jobs
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(
+                Config.EQUEST_INSTALL_PATH and str(Config.EQUEST_INSTALL_PATH),
+                Config.DOE22_DATA_PATH and str(Config.DOE22_DATA_PATH),
+                Config.DOE23_DATA_PATH and str(Config.DOE23_DATA_PATH),
+                Config.ACTIVE_RULESET,
+            ),
+        )
+        self.jobs = OrderedDict()
+        self.pending_jobs = 0
+        self.lock = threading.Lock()
+
+    def submit(self, request: dict) -> Job:
+        """
+        Queue a job.
+        :param request: dictionary with a "type" of "generate" or "validate".
+            generate: "bdl_path" and "json_path", optional "incremental"; or "inp_path" alone.
+            validate: "json_path", optional "schema_only".
+        :return: the queued Job
+        """
+        job_type = request.get("type")
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Unknown job type: {job_type}")
+        _, required_keys = JOB_TYPES[job_type]
+        if job_type == "generate" and request.get("inp_path"):
+            required_keys = []
+        missing_keys = [key for key in required_keys if not request.get(key)]
+        if missing_keys:
+            raise ValueError(f"Missing job parameters: {', '.join(missing_keys)}")
+
+        job = Job(request)
+        with self.lock:
+            if self.pending_jobs >= self.max_workers + self.max_queued_jobs:
+                raise QueueFullError("The job queue is full.")
+            self.pending_jobs += 1
+            self.jobs[job.id] = job
+        job.future = self.executor.submit(run_job, request)
+        job.future.add_done_callback(lambda f: self._finish_job(job, f))
+        return job
+
+    def get_job(self, job_id: str, wait=0.0):
+        """
+        :param job_id: id returned by submit
+        :param wait: (float) seconds to wait for the job to finish before returning its current status
+        :return: the Job, or None if the id is unknown
+        """
+        job = self.jobs.get(job_id)
+        if job is not None and wait > 0:
+            job.done.wait(wait)
+        return job
+
+    def get_status(self) -> dict:
+        with self.lock:
+            running = sum(
+                job.to_dict()["status"] == "running" for job in self.jobs.values()
+            )
+            return {
+                "workers": self.max_workers,
+                "max_queued_jobs": self.max_queued_jobs,
+                "pending_jobs": self.pending_jobs,
+                "running_jobs": running,
+            }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def _finish_job(self, job: Job, future):
+        error = future.exception() if not future.cancelled() else None
+        with self.lock:
+            if future.cancelled():
+                job.status = "cancelled"
+            elif error is not None:
+                job.status = "failed"
+                job.error = f"{type(error).__name__}: {error}"
+            else:
+                output = future.result()
+                job.status = "succeeded"
+                job.result = output["result"]
+                job.log = output["log"]
+            job.finished = time.time()
+            self.pending_jobs -= 1
+            self._prune_finished_jobs()
+        job.done.set()
+
+    def _prune_finished_jobs(self):
+        finished_ids = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished_ids[: max(0, len(finished_ids) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+
+class GenerationRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /jobs              submit a job; the body is the job request as JSON
+    GET  /jobs/<id>?wait=S  job status and result, waiting up to S seconds for the job to finish
+    GET  /status            worker pool and queue status
+    """
+
+    service: GenerationService = None
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("The job request must be a JSON object.")
+            job = self.service.submit(request)
+        except QueueFullError as err:
+            self._send_json(503, {"error": str(err)})
+            return
+        except ValueError as err:
+            self._send_json(400, {"error": str(err)})
+            return
+        self._send_json(202, job.to_dict())
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/status":
+            self._send_json(200, self.service.get_status())
+            return
+        if not url.path.startswith("/jobs/"):
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        try:
+            wait = float(parse_qs(url.query).get("wait", ["0"])[0])
+        except ValueError:
+            self._send_json(400, {"error": "wait must be a number of seconds"})
+            return
+        job = self.service.get_job(url.path[len("/jobs/") :], wait)
+        if job is None:
+            self._send_json(404, {"error": "Unknown job"})
+            return
+        self._send_json(200, job.to_dict())
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, data: dict):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(
+    service: GenerationService, host=DEFAULT_HOST, port=DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    handler = type(
+        "BoundGenerationRequestHandler",
+        (GenerationRequestHandler,),
+        {"service": service},
+    )
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, max_workers=2, max_queued_jobs=64):
+    """
+    Run the generation service until interrupted.
+    """
+    service = GenerationService(max_workers, max_queued_jobs)
+    server = create_server(service, host, port)
+    print(f"RPD generation service listening on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
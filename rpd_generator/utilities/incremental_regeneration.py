@@ -0,0 +1,246 @@
+import json
+from pathlib import Path
+
+# BDL commands that make up the building tree. Changes to these commands are patched into the previous RPD one system
+# at a time. Any other change requires the full RPD to be regenerated.
+BUILDING_TREE_COMMANDS = [
+    "SYSTEM",
+    "ZONE",
+    "SPACE",
+    "EXTERIOR-WALL",
+    "INTERIOR-WALL",
+    "UNDERGROUND-WALL",
+    "WINDOW",
+    "DOOR",
+]
+
+
+def get_generation_cache_path(json_file_path) -> Path:
+    """
+    Return the path of the generation cache that is stored next to the RPD.
+    :param json_file_path: (str or Path) path of the RPD JSON file
+    """
+    json_file_path = Path(json_file_path)
+    return json_file_path.with_name(f"{json_file_path.stem}.generation-cache.json")
+
+
+def write_generation_cache(json_file_path, model_input_data: dict, rpd: dict):
+    """
+    Save the BDL parse and the RPD generated from it. The RPD must be saved before its ids are made unique and its
+    units are converted, so that patched objects go through the same steps as a full generation.
+    :param json_file_path: (str or Path) path of the RPD JSON file
+    :param model_input_data: dictionary returned by ModelInputReader.read_input_bdl_file
+    :param rpd: RPD data structure
+    """
+    with open(get_generation_cache_path(json_file_path), "w") as cache_file:
+        json.dump({"model_input_data": model_input_data, "rpd": rpd}, cache_file)
+
+
+def load_previous_generation(json_file_path):
+    """
+    Load the BDL parse and the RPD saved by the previous generation.
+    :param json_file_path: (str or Path) path of the RPD JSON file
+    :return: tuple of the previous model input data and the previous RPD, or None if there is no cache
+    """
+    cache_path = get_generation_cache_path(json_file_path)
+    if not cache_path.is_file():
+        return None
+
+    with open(cache_path) as cache_file:
+        cache = json.load(cache_file)
+    return cache["model_input_data"], cache["rpd"]
+
+
+def diff_file_commands(previous_file_commands: dict, file_commands: dict):
+    """
+    Find the objects whose keyword-value pairs changed between two parses of a BDL file.
+    :param previous_file_commands: file_commands of the previous parse
+    :param file_commands: file_commands of the current parse
+    :return: set of (command, u_name) tuples, or None if objects were added, removed or reordered
+    """
+    changed = set()
+    for command in previous_file_commands.keys() | file_commands.keys():
+        previous_commands = previous_file_commands.get(command, {})
+        commands = file_commands.get(command, {})
+        # The order of objects determines the order of the RPD lists, so only changes to existing objects are diffed
+        if list(previous_commands) != list(commands):
+            return None
+
+        for u_name, command_dict in commands.items():
+            if previous_commands[u_name] != command_dict:
+                changed.add((command, u_name))
+    return changed
+
+
+def get_system_by_u_name(file_commands: dict) -> dict:
+    """
+    Map each object in the building tree to the system that serves the zone it belongs to.
+    :param file_commands: file_commands of a parse
+    :return: dictionary of u_name to system u_name
+    """
+    system_by_u_name = {u_name: u_name for u_name in file_commands.get("SYSTEM", {})}
+    for zone_name, zone_dict in file_commands.get("ZONE", {}).items():
+        system_name = zone_dict.get("parent")
+        system_by_u_name[zone_name] = system_name
+        space_name = zone_dict.get("SPACE")
+        if space_name is not None:
+            system_by_u_name[space_name] = system_name
+
+    # Walls are children of spaces, and windows and doors are children of walls
+    for command in [
+        "EXTERIOR-WALL",
+        "INTERIOR-WALL",
+        "UNDERGROUND-WALL",
+        "WINDOW",
+        "DOOR",
+    ]:
+        for u_name, command_dict in file_commands.get(command, {}).items():
+            system_by_u_name[u_name] = system_by_u_name.get(command_dict.get("parent"))
+    return system_by_u_name
+
+
+def get_affected_systems(
+    previous_file_commands: dict, file_commands: dict, changed: set
+):
+    """
+    Find the systems whose building tree must be regenerated. Zones update the data of the system that serves them,
+    so a change anywhere in a system's tree regenerates the system with all of its zones, spaces and surfaces.
+    :param previous_file_commands: file_commands of the previous parse
+    :param file_commands: file_commands of the current parse
+    :param changed: set of (command, u_name) tuples returned by diff_file_commands
+    :return: set of system u_names, or None if a change is outside the building tree
+    """
+    affected_systems = set()
+    previous_system_by_u_name = get_system_by_u_name(previous_file_commands)
+    system_by_u_name = get_system_by_u_name(file_commands)
+
+    for command, u_name in changed:
+        if command not in BUILDING_TREE_COMMANDS:
+            return None
+        # An object may have moved, so the systems from both parses are affected
+        for system_name in [
+            previous_system_by_u_name.get(u_name),
+            system_by_u_name.get(u_name),
+        ]:
+            if system_name is None:
+                return None
+            affected_systems.add(system_name)
+
+    # Zones read the populated data of the DOAS that serves their system, so a system and its DOAS are regenerated
+    # together
+    doas_links = _get_doas_links(previous_file_commands) | _get_doas_links(
+        file_commands
+    )
+    linked_systems = affected_systems
+    while linked_systems:
+        linked_systems = {
+            linked_system
+            for system_name, doas_name in doas_links
+            for linked_system in (system_name, doas_name)
+            if system_name in affected_systems or doas_name in affected_systems
+        } - affected_systems
+        affected_systems |= linked_systems
+    return affected_systems
+
+
+def get_skipped_u_names(file_commands: dict, affected_systems: set) -> set:
+    """
+    Return the u_names of the building tree objects that are served by unaffected systems. Those objects are created
+    but not repopulated, and their data is carried over from the previous RPD.
+    :param file_commands: file_commands of the current parse
+    :param affected_systems: set of system u_names returned by get_affected_systems
+    """
+    return {
+        u_name
+        for u_name, system_name in get_system_by_u_name(file_commands).items()
+        if system_name is not None and system_name not in affected_systems
+    }
+
+
+def merge_regenerated_rpd(
+    previous_rpd: dict,
+    regenerated_rpd: dict,
+    file_commands: dict,
+    affected_systems: set,
+):
+    """
+    Patch the regenerated zones and systems into the previous RPD. Everything outside the building segment's zones and
+    HVAC systems is taken from the regenerated RPD.
+    :param previous_rpd: RPD generated from the previous parse
+    :param regenerated_rpd: RPD generated with only the affected systems' building trees populated
+    :param file_commands: file_commands of the current parse
+    :param affected_systems: set of system u_names returned by get_affected_systems
+    :return: merged RPD, or None if the regenerated objects cannot be matched to the previous RPD
+    """
+    previous_segment = _get_building_segment(previous_rpd)
+    regenerated_segment = _get_building_segment(regenerated_rpd)
+    if previous_segment is None or regenerated_segment is None:
+        return None
+
+    zone_parents = {
+        zone_name: zone_dict.get("parent")
+        for zone_name, zone_dict in file_commands.get("ZONE", {}).items()
+        if zone_dict.get("parent") in affected_systems
+    }
+    zone_names = set(zone_parents)
+    # Zonal systems create a derived system for every zone after the first
+    system_ids = affected_systems | {
+        f"{system_name} - {zone_name}"
+        for zone_name, system_name in zone_parents.items()
+    }
+
+    zones = _patch_by_id(
+        previous_segment.get("zones", []),
+        regenerated_segment.get("zones", []),
+        zone_names,
+    )
+    hvac_systems = _patch_by_id(
+        previous_segment.get("heating_ventilating_air_conditioning_systems", []),
+        regenerated_segment.get("heating_ventilating_air_conditioning_systems", []),
+        system_ids,
+    )
+    if zones is None or hvac_systems is None:
+        return None
+
+    regenerated_segment["zones"] = zones
+    regenerated_segment["heating_ventilating_air_conditioning_systems"] = hvac_systems
+    return regenerated_rpd
+
+
+def _get_doas_links(file_commands: dict) -> set:
+    return {
+        (system_name, system_dict["DOA-SYSTEM"])
+        for system_name, system_dict in file_commands.get("SYSTEM", {}).items()
+        if system_dict.get("DOA-SYSTEM")
+    }
+
+
+def _get_building_segment(rpd: dict):
+    try:
+        return rpd["ruleset_model_descriptions"][0]["buildings"][0][
+            "building_segments"
+        ][0]
+    except (KeyError, IndexError):
+        return None
+
+
+def _patch_by_id(previous_objects: list, regenerated_objects: list, ids: set):
+    """
+    Replace the objects in previous_objects whose id is in ids with the regenerated objects that have the same id.
+    :return: patched list, or None if the regenerated objects do not replace the previous objects one for one
+    """
+    previous_ids = [obj.get("id") for obj in previous_objects]
+    replaced_ids = [obj_id for obj_id in previous_ids if obj_id in ids]
+    regenerated_by_id = {obj.get("id"): obj for obj in regenerated_objects}
+
+    if (
+        len(regenerated_by_id) != len(regenerated_objects)
+        or len(set(replaced_ids)) != len(replaced_ids)
+        or set(replaced_ids) != set(regenerated_by_id)
+    ):
+        return None
+
+    return [
+        regenerated_by_id[obj_id] if obj_id in ids else obj
+        for obj_id, obj in zip(previous_ids, previous_objects)
+    ]
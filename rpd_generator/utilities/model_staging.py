@@ -0,0 +1,128 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+OUTPUT_FILE_EXTENSIONS = [".erp", ".lrp", ".srp", ".nhk"]
+STAGING_ROOT = Path(tempfile.gettempdir()) / "rpd_generator"
+
+
+def get_processing_dir(inp_path: Path) -> Path:
+    """
+    Return the processing directory of a project. The same directory is reused across runs so that staged files and
+    prepared inputs can be reused.
+    :param inp_path: path of the project's INP file
+    """
+    inp_path = Path(inp_path).resolve()
+    project_key = hashlib.sha1(str(inp_path.parent).lower().encode()).hexdigest()
+    processing_dir = STAGING_ROOT / f"{inp_path.parent.name}-{project_key[:12]}"
+    processing_dir.mkdir(parents=True, exist_ok=True)
+    return processing_dir
+
+
+def get_file_hash(file_path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def is_prepared_inp_current(inp_path: Path, processing_dir: Path, key="") -> bool:
+    """
+    Check whether the INP file was already prepared and processed into a BDL file in processing_dir, and has not
+    changed since.
+    :param inp_path: path of the project's INP file
+    :param processing_dir: processing directory returned by get_processing_dir
+    :param key: (str) anything else the prepared files depend on, e.g. the DOE-2 data path
+    """
+    inp_path = Path(inp_path)
+    hash_path = processing_dir / f"{inp_path.name}.sha256"
+    prepared_files = [
+        processing_dir / inp_path.name,
+        processing_dir / f"{inp_path.stem}.BDL",
+    ]
+    if not hash_path.is_file() or not all(path.is_file() for path in prepared_files):
+        return False
+    return hash_path.read_text() == _get_inp_key(inp_path, key)
+
+
+def record_prepared_inp(inp_path: Path, processing_dir: Path, key=""):
+    """
+    Record the hash of an INP file once it has been prepared and processed into a BDL file in processing_dir.
+    """
+    inp_path = Path(inp_path)
+    hash_path = processing_dir / f"{inp_path.name}.sha256"
+    hash_path.write_text(_get_inp_key(inp_path, key))
+
+
+def stage_output_files(inp_path: Path, processing_dir: Path) -> list:
+    """
+    Make the simulation output files (.erp, .lrp, .srp, .nhk) of a model available in processing_dir under the name of
+    the model. Files are hard linked or symlinked when the filesystem allows it and copied otherwise.
+    :param inp_path: path of the project's INP file
+    :param processing_dir: processing directory returned by get_processing_dir
+    :return: list of the source files that were not found
+    """
+    inp_path = Path(inp_path)
+    model_dir = inp_path.parent
+    model_name = inp_path.stem
+    missing_files = []
+
+    for ext in OUTPUT_FILE_EXTENSIONS:
+        model_file = model_dir / f"{model_name}{ext}"
+        alternate_search_file = model_dir / f"{model_name} - Baseline Design{ext}"
+
+        if model_file.exists():
+            source_file = model_file
+        elif alternate_search_file.exists():
+            source_file = alternate_search_file
+        else:
+            missing_files.append(model_file)
+            continue
+        stage_file(source_file, processing_dir / f"{model_name}{ext}")
+    return missing_files
+
+
+def stage_file(source_file: Path, destination_file: Path):
+    """
+    Make source_file available at destination_file without copying it if possible.
+    A destination that is already a link to the source, or an identical copy of it, is left untouched.
+    """
+    if _is_staged(source_file, destination_file):
+        return
+    if destination_file.is_symlink() or destination_file.exists():
+        destination_file.unlink()
+
+    try:
+        os.link(source_file, destination_file)
+        return
+    except OSError:
+        pass
+    try:
+        os.symlink(source_file.resolve(), destination_file)
+        return
+    except OSError:
+        pass
+    shutil.copy2(source_file, destination_file)
+
+
+def _is_staged(source_file: Path, destination_file: Path) -> bool:
+    if not destination_file.exists():
+        return False
+    if os.path.samefile(source_file, destination_file):
+        return True
+    if destination_file.is_symlink():
+        return False
+    # A copy made by a previous run is reused if the source has not been modified since
+    source_stat = source_file.stat()
+    destination_stat = destination_file.stat()
+    return (
+        source_stat.st_size == destination_stat.st_size
+        and source_stat.st_mtime_ns == destination_stat.st_mtime_ns
+    )
+
+
+def _get_inp_key(inp_path: Path, key: str) -> str:
+    return f"{get_file_hash(inp_path)} {key}"
@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+PROFILE_ENV_VAR = "RPD_GENERATOR_PROFILE"
+
+
+class _NullSpan:
+    """Context manager returned when profiling is disabled so that instrumented code pays almost nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Times one stage of the pipeline and records it against the active BDL command type."""
+
+    def __init__(self, profiler, stage, command, u_name):
+        self.profiler = profiler
+        self.stage = stage
+        self.command = command
+        self.u_name = u_name
+        self.start = None
+
+    def __enter__(self):
+        stack = self.profiler.active_spans
+        if self.command is None:
+            # Stages such as get_output_data inherit the command type of the object that called them
+            self.command = stack[-1].command if stack else "RPD"
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = time.perf_counter()
+        self.profiler.active_spans.pop()
+        self.profiler.record_span(self, end)
+        return False
+
+
+class Profiler:
+    """
+    Opt-in profiler for the RPD generation pipeline. Aggregates time, call counts and simulation output (DLL) requests
+    per stage and per BDL command type, and keeps trace events that can be viewed as a flame graph.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir = None
+        self.stats = {}
+        self.trace_events = []
+        self.active_spans = []
+        self.start_time = time.perf_counter()
+
+    def enable(self, output_dir=None):
+        """
+        Start collecting profiling data.
+        :param output_dir: directory where the reports are written. When None, reports are written next to the RPD.
+        """
+        self.enabled = True
+        self.output_dir = output_dir
+        self.reset()
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Discard all collected data."""
+        self.stats = {}
+        self.trace_events = []
+        self.active_spans = []
+        self.start_time = time.perf_counter()
+
+    def span(self, stage, command=None, u_name=None):
+        """
+        Return a context manager that times a stage of the pipeline.
+        :param stage: (str) name of the stage, e.g. "populate_data_elements"
+        :param command: (str) BDL command type the stage is attributed to; inherited from the enclosing span if None
+        :param u_name: (str) optional u_name of the object being processed, only used in the trace events
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, command, u_name)
+
+    def record_span(self, span, end):
+        entry = self._get_entry(span.stage, span.command)
+        entry["calls"] += 1
+        entry["total_time"] += end - span.start
+
+        args = {"command": span.command}
+        if span.u_name is not None:
+            args["u_name"] = span.u_name
+        self.trace_events.append(
+            {
+                "name": span.stage,
+                "cat": span.command,
+                "ph": "X",
+                "ts": (span.start - self.start_time) * 1e6,
+                "dur": (end - span.start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def record_dll_call(self, num_requests):
+        """
+        Count one call into D2Result.dll against the innermost active span.
+        :param num_requests: (int) number of output values requested by the call
+        """
+        if not self.enabled:
+            return
+        if self.active_spans:
+            span = self.active_spans[-1]
+            entry = self._get_entry(span.stage, span.command)
+        else:
+            entry = self._get_entry("unattributed", "RPD")
+        entry["dll_calls"] += 1
+        entry["dll_requests"] += num_requests
+
+    def _get_entry(self, stage, command):
+        key = (stage, command)
+        entry = self.stats.get(key)
+        if entry is None:
+            entry = {"calls": 0, "total_time": 0.0, "dll_calls": 0, "dll_requests": 0}
+            self.stats[key] = entry
+        return entry
+
+    def get_report(self):
+        """
+        Summarize the collected data by stage and by BDL command type.
+        Time is inclusive: a stage's time includes the time of any stages nested inside it.
+        """
+        stages = {}
+        commands = {}
+        for (stage, command), entry in self.stats.items():
+            stage_totals = stages.setdefault(
+                stage,
+                {"calls": 0, "total_time": 0.0, "dll_calls": 0, "dll_requests": 0},
+            )
+            for key, value in entry.items():
+                stage_totals[key] += value
+            commands.setdefault(command, {})[stage] = dict(entry)
+
+        return {
+            "elapsed_time": time.perf_counter() - self.start_time,
+            "stages": stages,
+            "commands": commands,
+        }
+
+    def write_reports(self, base_path):
+        """
+        Write the JSON summary report and the Chrome trace-event file.
+        :param base_path: (str or Path) path of the generated RPD; the report names are derived from its stem
+        :return: tuple of the report path and the trace path
+        """
+        base_path = Path(base_path)
+        output_dir = Path(self.output_dir) if self.output_dir else base_path.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        report_path = output_dir / f"{base_path.stem}.profile.json"
+        trace_path = output_dir / f"{base_path.stem}.trace.json"
+
+        with open(report_path, "w") as report_file:
+            json.dump(self.get_report(), report_file, indent=4)
+        with open(trace_path, "w") as trace_file:
+            json.dump(
+                {"traceEvents": self.trace_events, "displayTimeUnit": "ms"},
+                trace_file,
+            )
+        return report_path, trace_path
+
+
+def enable_from_environment():
+    """
+    Enable the profiler if the RPD_GENERATOR_PROFILE environment variable is set. The value may be a directory to
+    write the reports to, or any of "1", "true", "yes" to write them next to the generated RPD.
+    """
+    value = os.environ.get(PROFILE_ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return
+    output_dir = None if value.lower() in ("1", "true", "yes") else value
+    profiler.enable(output_dir)
+
+
+profiler = Profiler()
+enable_from_environment()
@@ -0,0 +1,80 @@
+import queue
+import threading
+import time
+
+
+class GenerationCancelled(Exception):
+    pass
+
+
+class ProgressReporter:
+    """
+    Publishes the progress events of an RPD generation to a thread-safe queue, and carries a cooperative cancel
+    request. The pipeline calls report at each step, which raises GenerationCancelled once cancel has been called.
+    """
+
+    def __init__(self, min_interval=0.1):
+        """
+        :param min_interval: (float) minimum number of seconds between two events of a counted step. The first event
+            of a step and its last item are always reported.
+        """
+        self.events = queue.Queue()
+        self.min_interval = min_interval
+        self.cancel_event = threading.Event()
+        self.last_report_time = 0.0
+        self.last_stage = None
+
+    def report(self, stage, completed=None, total=None):
+        """
+        Publish a progress event.
+        :param stage: (str) description of the step, e.g. "Populating objects"
+        :param completed: (int) number of items of the step that are complete
+        :param total: (int) number of items of the step
+        """
+        self.check_cancelled()
+        now = time.monotonic()
+        if (
+            completed is not None
+            and completed < total
+            and stage == self.last_stage
+            and now - self.last_report_time < self.min_interval
+        ):
+            return
+        self.last_report_time = now
+        self.last_stage = stage
+        self.events.put({"stage": stage, "completed": completed, "total": total})
+
+    def get_events(self) -> list:
+        """Return the events published since the last call without blocking."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise GenerationCancelled()
+
+
+class _NullProgressReporter:
+    """Progress reporter used when nobody listens, so that the pipeline pays almost nothing."""
+
+    def report(self, stage, completed=None, total=None):
+        pass
+
+    def check_cancelled(self):
+        pass
+
+    def is_cancelled(self) -> bool:
+        return False
+
+
+NULL_PROGRESS = _NullProgressReporter()
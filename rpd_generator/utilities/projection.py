@@ -0,0 +1,157 @@
+# A projection names the parts of the RPD to produce, as RPD data groups or BDL commands. Only the commands of the
+# projection and the commands they depend on are parsed, created and populated.
+
+# RPD data groups that a projection can name, mapped to the BDL commands that produce them and the data groups nested
+# in them. The output data group of the RMD is populated from the simulation results of the whole model, and no
+# command produces it.
+DATA_GROUP_COMMANDS = {
+    "zones": [
+        "ZONE",
+        "SPACE",
+        "EXTERIOR-WALL",
+        "INTERIOR-WALL",
+        "UNDERGROUND-WALL",
+        "WINDOW",
+        "DOOR",
+    ],
+    "terminals": ["ZONE"],
+    "spaces": ["SPACE"],
+    "surfaces": [
+        "EXTERIOR-WALL",
+        "INTERIOR-WALL",
+        "UNDERGROUND-WALL",
+        "WINDOW",
+        "DOOR",
+    ],
+    "subsurfaces": ["WINDOW", "DOOR"],
+    "constructions": ["CONSTRUCTION"],
+    "heating_ventilating_air_conditioning_systems": ["SYSTEM"],
+    "schedules": ["SCHEDULE-PD"],
+    "fluid_loops": ["CIRCULATION-LOOP"],
+    "pumps": ["PUMP"],
+    "boilers": ["BOILER"],
+    "chillers": ["CHILLER"],
+    "heat_rejections": ["HEAT-REJECTION"],
+    "service_water_heating_equipment": ["DW-HEATER"],
+    "output": [],
+}
+OUTPUT_DATA_GROUP = "output"
+
+# Projections of the model that consumers commonly need
+PRESET_PROJECTIONS = {
+    "envelope": [
+        "FLOOR",
+        "SPACE",
+        "EXTERIOR-WALL",
+        "INTERIOR-WALL",
+        "UNDERGROUND-WALL",
+        "WINDOW",
+        "DOOR",
+    ],
+    "hvac": ["SYSTEM", "ZONE"],
+}
+
+# Commands that the commands of a preset only need as containers or reference by name. Their objects are created and
+# populated, but the commands they depend on are not: the spaces of the envelope are inserted into zones, which are
+# children of systems, but the envelope does not need the fluid loops and plant that serve the systems.
+PRESET_REFERENCED_COMMANDS = {
+    "envelope": ["ZONE", "SYSTEM"],
+}
+
+# Commands of the model-level objects that every projection needs. Fixed shades set whether the building has site
+# shading.
+BASE_COMMANDS = [
+    "RUN-PERIOD-PD",
+    "SITE-PARAMETERS",
+    "BUILD-PARAMETERS",
+    "FIXED-SHADE",
+    "MASTER-METERS",
+    "FUEL-METER",
+    "ELEC-METER",
+    "STEAM-METER",
+    "CHW-METER",
+    "HOLIDAYS",
+]
+
+# Commands whose objects must be created and populated for the objects of a command to populate: their parents, the
+# objects they look up while populating, and the objects their data groups are inserted into.
+COMMAND_DEPENDENCIES = {
+    "FLOOR": [],
+    "SPACE": ["FLOOR", "ZONE", "SCHEDULE-PD"],
+    "ZONE": ["SYSTEM", "SPACE", "SCHEDULE-PD"],
+    "SYSTEM": ["ZONE", "CIRCULATION-LOOP", "CURVE-FIT", "SCHEDULE-PD"],
+    "EXTERIOR-WALL": ["SPACE", "CONSTRUCTION"],
+    "INTERIOR-WALL": ["SPACE", "CONSTRUCTION"],
+    "UNDERGROUND-WALL": ["SPACE", "CONSTRUCTION"],
+    "WINDOW": ["EXTERIOR-WALL", "GLASS-TYPE"],
+    "DOOR": ["EXTERIOR-WALL", "CONSTRUCTION"],
+    "CONSTRUCTION": ["LAYERS"],
+    "LAYERS": ["MATERIAL"],
+    "SCHEDULE-PD": ["WEEK-SCHEDULE-PD"],
+    "WEEK-SCHEDULE-PD": ["DAY-SCHEDULE-PD"],
+    "CIRCULATION-LOOP": [
+        "SYSTEM",
+        "ZONE",
+        "PUMP",
+        "BOILER",
+        "CHILLER",
+        "DW-HEATER",
+        "HEAT-REJECTION",
+        "GROUND-LOOP-HX",
+        "SCHEDULE-PD",
+    ],
+    "PUMP": ["CIRCULATION-LOOP"],
+    "BOILER": ["CIRCULATION-LOOP", "CURVE-FIT"],
+    "CHILLER": ["CIRCULATION-LOOP", "CURVE-FIT"],
+    "DW-HEATER": ["CIRCULATION-LOOP", "CURVE-FIT", "SCHEDULE-PD"],
+    "HEAT-REJECTION": ["CIRCULATION-LOOP", "CURVE-FIT"],
+    "GROUND-LOOP-HX": ["CIRCULATION-LOOP"],
+}
+
+
+def expand_projection(projection):
+    """
+    Expand a projection to the BDL commands it needs, including the commands they depend on.
+    :param projection: names of presets, RPD data groups or BDL commands, or None for the whole model
+    :return: set of BDL commands, or None for the whole model
+    """
+    if projection is None:
+        return None
+    if isinstance(projection, str):
+        projection = [projection]
+
+    to_visit = list(BASE_COMMANDS)
+    referenced_commands = set()
+    for name in projection:
+        if name in PRESET_PROJECTIONS:
+            to_visit.extend(PRESET_PROJECTIONS[name])
+            referenced_commands.update(PRESET_REFERENCED_COMMANDS.get(name, []))
+        elif name in DATA_GROUP_COMMANDS:
+            to_visit.extend(DATA_GROUP_COMMANDS[name])
+        elif name.isupper():
+            to_visit.append(name)
+        else:
+            raise ValueError(f"Unknown projection: {name}")
+
+    # Referenced commands that the projection also names are expanded like the others
+    referenced_commands.difference_update(to_visit)
+    commands = set()
+    while to_visit:
+        command = to_visit.pop()
+        if command not in commands:
+            commands.add(command)
+            if command not in referenced_commands:
+                to_visit.extend(COMMAND_DEPENDENCIES.get(command, []))
+    return commands | referenced_commands
+
+
+def includes_output(projection) -> bool:
+    """
+    :param projection: see expand_projection
+    :return: bool: True if the projection includes the simulation results of the model
+    """
+    if projection is None:
+        return True
+    if isinstance(projection, str):
+        projection = [projection]
+    return OUTPUT_DATA_GROUP in projection
@@ -1,6 +1,7 @@
 import os
 import json
 import pint
+from functools import lru_cache
 from jsonpath_ng.ext import parse
 
 
@@ -21,8 +22,9 @@ path_to_json_paths = os.path.join(
 )
 
 
-def convert_to_schema_units(rpd_json):
-    """Converts the units of the json data to the standard units defined in the schema"""
+@lru_cache(maxsize=None)
+def load_unit_resources():
+    """Load the eQUEST units, the schema units and the data group json paths once per process"""
     with open(path_to_equest_units) as f:
         equest_units = json.load(f)
 
@@ -32,6 +34,18 @@ def convert_to_schema_units(rpd_json):
     with open(path_to_json_paths) as f:
         item_paths = json.load(f)
 
+    return equest_units, schema_units, item_paths
+
+
+@lru_cache(maxsize=None)
+def _parse_json_path(json_path):
+    return parse(json_path)
+
+
+def convert_to_schema_units(rpd_json):
+    """Converts the units of the json data to the standard units defined in the schema"""
+    equest_units, schema_units, item_paths = load_unit_resources()
+
     processed_ids = set()
 
     def convert_units(dg, json_data, unit_dict):
@@ -56,7 +70,7 @@ def convert_to_schema_units(rpd_json):
         json_paths = item_paths.get(data_group)
 
         for json_path in json_paths:
-            jsonpath_expr = parse(json_path)
+            jsonpath_expr = _parse_json_path(json_path)
             matches = [m.value for m in jsonpath_expr.find(rpd_json)]
             unique_matches = [obj for obj in matches if id(obj) not in processed_ids]
             convert_units(data_group, unique_matches, elements_w_units)
@@ -1,39 +1,198 @@
 import os
 import configparser
+from collections import deque
 from pathlib import Path
 from rpd_generator.config import Config
 
 
-def find_equest_installation(installation_path=None):
+EQUEST_DIRECTORY_NAME = "eQUEST 3-65-7175"
+# Lowercase names of the files that identify an eQUEST installation directory
+EQUEST_TARGET_FILES = [
+    "equest.ini",
+    "equestd23.ini",
+    "d2result.dll",
+    "bdlcio32.dll",
+]
+# Directories are not searched deeper than this below the start of the search
+MAX_SEARCH_DEPTH = 4
+# Lowercase names of directories that never contain an eQUEST installation
+PRUNED_DIRECTORY_NAMES = {
+    "windows",
+    "windowsapps",
+    "common files",
+    "microsoft",
+    "microsoft office",
+    "microsoft visual studio",
+    "windows defender",
+    "windows kits",
+    "windowspowershell",
+    "internet explorer",
+    "reference assemblies",
+    "node_modules",
+    "programdata",
+    "users",
+}
+
+
+def find_equest_installation(installation_path=None, config_path=None):
     """
-    Search recursively for a directory that matches a target directory starting from start_path.
-    If found, checks if all target files exist within that directory in a case-insensitive manner.
+    Find the eQUEST installation directory and set the installation and DOE-2 data paths in Config.
+    The installation saved in the user configuration file is used if it is still valid. Otherwise, the known
+    installation locations are probed, then the start directories are searched breadth-first, skipping system
+    directories and directories deeper than MAX_SEARCH_DEPTH. The installation found is saved to the user
+    configuration file.
 
-    :return: Path of the directory if it exists with all target files, else None.
+    :param installation_path: directory selected by the user, which is either the installation or contains it
+    :param config_path: path of the user configuration file, see get_user_config_path
+    :return: Path of the installation directory, or None if it was not found
     """
-    if not installation_path:
-        start_path = Path(os.environ.get("ProgramFiles(x86)", "C:/"))
+    if not installation_path and load_user_configuration(config_path):
+        return Path(Config.EQUEST_INSTALL_PATH)
+
+    if installation_path:
+        start_paths = [Path(installation_path)]
+        candidates = [Path(installation_path)]
     else:
-        start_path = Path(installation_path)
-    target_dir = "eQUEST 3-65-7175".lower()  # Convert target directory to lowercase
-    target_files = [
-        "equest.ini",
-        "equestd23.ini",
-        "d2result.dll",
-        "bdlcio32.dll",
-    ]  # Converted target files to lowercase for comparison
-
-    for path in start_path.rglob("*"):
-        # Check if the current path is a directory and matches the target directory name (case-insensitive)
-        if path.is_dir() and path.name.lower() == target_dir:
-            # List all files in the current directory (case-insensitive match)
-            files_in_dir = [
-                file.name.lower() for file in path.iterdir() if file.is_file()
-            ]
-            # Check if all target files exist in the current directory (case-insensitive)
-            if all(file in files_in_dir for file in target_files):
-                Config.EQUEST_INSTALL_PATH = path
-                set_data_paths_from_config()
+        start_paths = get_default_search_paths()
+        candidates = [path / EQUEST_DIRECTORY_NAME for path in start_paths]
+
+    installation = next(
+        (path for path in candidates if is_equest_installation(path)), None
+    )
+    if installation is None:
+        installation = search_for_installation(start_paths)
+    if installation is None:
+        return None
+
+    Config.EQUEST_INSTALL_PATH = installation
+    set_data_paths_from_config()
+    save_user_configuration(config_path)
+    return installation
+
+
+def get_default_search_paths() -> list:
+    """Return the existing Program Files directories, where eQUEST is installed by default."""
+    paths = []
+    for path in [
+        os.environ.get("ProgramFiles(x86)"),
+        os.environ.get("ProgramFiles"),
+        "C:/Program Files (x86)",
+        "C:/Program Files",
+    ]:
+        if path and Path(path).is_dir() and Path(path) not in paths:
+            paths.append(Path(path))
+    return paths or [Path("C:/")]
+
+
+def is_equest_installation(path) -> bool:
+    """
+    Check if a directory has the name of the eQUEST installation directory and all the target files, in a
+    case-insensitive manner.
+    """
+    path = Path(path)
+    if path.name.lower() != EQUEST_DIRECTORY_NAME.lower():
+        return False
+    try:
+        with os.scandir(path) as entries:
+            file_names = {entry.name.lower() for entry in entries if entry.is_file()}
+    except OSError:
+        return False
+    return all(file_name in file_names for file_name in EQUEST_TARGET_FILES)
+
+
+def search_for_installation(start_paths, max_depth=MAX_SEARCH_DEPTH):
+    """
+    Search breadth-first for the eQUEST installation directory below the start directories.
+
+    :param start_paths: (list) directories to search
+    :param max_depth: (int) depth below the start directories of the deepest directories searched
+    :return: Path of the shallowest installation directory found, or None
+    """
+    queue = deque((Path(path), 0) for path in start_paths)
+    visited = set()
+    while queue:
+        path, depth = queue.popleft()
+        try:
+            with os.scandir(path) as entries:
+                directories = [
+                    entry for entry in entries if entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            continue
+
+        for entry in directories:
+            name = entry.name.lower()
+            if name == EQUEST_DIRECTORY_NAME.lower() and is_equest_installation(
+                entry.path
+            ):
+                return Path(entry.path)
+            if (
+                depth + 1 < max_depth
+                and name not in PRUNED_DIRECTORY_NAMES
+                and not name.startswith((".", "$"))
+                and entry.path not in visited
+            ):
+                visited.add(entry.path)
+                queue.append((Path(entry.path), depth + 1))
+    return None
+
+
+def get_user_config_path() -> Path:
+    """Return the path of the file where the installation found is saved between runs."""
+    config_dir = os.environ.get("APPDATA") or Path.home() / ".config"
+    return Path(config_dir) / "229RPDGenerator" / "installation.ini"
+
+
+def load_user_configuration(config_path=None) -> bool:
+    """
+    Set the paths in Config from the user configuration file if they are still valid. The paths are re-validated by
+    listing the installation directory and checking the data directories instead of a new search.
+
+    :param config_path: path of the user configuration file, see get_user_config_path
+    :return: True if the saved paths were valid and set in Config
+    """
+    config = configparser.ConfigParser(interpolation=None)
+    if not config.read(config_path or get_user_config_path()):
+        return False
+    paths = config["paths"] if config.has_section("paths") else {}
+    install_path = paths.get("equest_install_path")
+    doe22_data_path = paths.get("doe22_data_path")
+    doe23_data_path = paths.get("doe23_data_path")
+    if not (install_path and doe22_data_path and doe23_data_path):
+        return False
+    if not (
+        is_equest_installation(install_path)
+        and Path(doe22_data_path).is_dir()
+        and Path(doe23_data_path).is_dir()
+    ):
+        return False
+
+    Config.EQUEST_INSTALL_PATH = Path(install_path)
+    Config.DOE22_DATA_PATH = doe22_data_path
+    Config.DOE23_DATA_PATH = doe23_data_path
+    return True
+
+
+def save_user_configuration(config_path=None):
+    """
+    Save the installation and data paths in Config to the user configuration file.
+
+    :param config_path: path of the user configuration file, see get_user_config_path
+    """
+    config_path = Path(config_path or get_user_config_path())
+    config = configparser.ConfigParser(interpolation=None)
+    config["paths"] = {
+        "equest_install_path": str(Config.EQUEST_INSTALL_PATH or ""),
+        "doe22_data_path": str(Config.DOE22_DATA_PATH or ""),
+        "doe23_data_path": str(Config.DOE23_DATA_PATH or ""),
+    }
+    try:
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(config_path, "w") as config_file:
+            config.write(config_file)
+    except OSError:
+        # The installation is searched for again on the next run
+        pass
 
 
 def verify_equest_installation(installation_path=None):
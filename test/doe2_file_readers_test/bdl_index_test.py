@@ -0,0 +1,69 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.doe2_file_readers.bdl_index import BDLIndex, get_index_path
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+
+
+class TestBDLIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_file = Path(self.temp_dir.name) / "229 Test Case E-1 (PSZHP).BDL"
+        # The index is saved next to the BDL file, so the test reads a copy
+        shutil.copy(
+            Path(__file__).parents[2]
+            / "test"
+            / "full_rpd_test"
+            / "E-1"
+            / "229 Test Case E-1 (PSZHP).BDL",
+            self.test_file,
+        )
+        self.model_input_reader = ModelInputReader()
+        RulesetProjectDescription.bdl_command_dict = (
+            self.model_input_reader.bdl_command_dict
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_matches_full_read(self):
+        data = self.model_input_reader.read_input_bdl_file(str(self.test_file))
+        with BDLIndex(self.test_file) as bdl_index:
+            self.assertEqual(data["doe2_version"], bdl_index.doe2_version)
+            for command, command_group in data["file_commands"].items():
+                self.assertEqual(list(command_group), bdl_index.get_u_names(command))
+                for u_name, command_dict in command_group.items():
+                    self.assertDictEqual(command_dict, bdl_index.get(u_name))
+
+    def test_get_unknown_u_name(self):
+        with BDLIndex(self.test_file) as bdl_index:
+            self.assertIsNone(bdl_index.get("Unknown"))
+
+    def test_index_is_reused_until_file_changes(self):
+        with BDLIndex(self.test_file) as bdl_index:
+            zone_count = len(bdl_index.get_u_names("ZONE"))
+        self.assertTrue(get_index_path(self.test_file).is_file())
+
+        # A saved index is used as is
+        index_text = get_index_path(self.test_file).read_text()
+        get_index_path(self.test_file).write_text(
+            index_text.replace('"ZONE"', '"ZONE-INDEXED"')
+        )
+        with BDLIndex(self.test_file) as bdl_index:
+            self.assertEqual(zone_count, len(bdl_index.get_u_names("ZONE-INDEXED")))
+
+        # The index is rebuilt once the file changes
+        with open(self.test_file, "a") as bdl_file:
+            bdl_file.write("\n")
+        with BDLIndex(self.test_file) as bdl_index:
+            self.assertEqual(zone_count, len(bdl_index.get_u_names("ZONE")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from rpd_generator import main
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers.bdlcio32 import CopyBdlConverter, InpConverter
+
+
+class CountingCopyBdlConverter(CopyBdlConverter):
+    def __init__(self, bdl_dirs):
+        super().__init__(bdl_dirs)
+        self.converted_inp_names = []
+
+    def convert(self, inp_path):
+        self.converted_inp_names.append(Path(inp_path).name)
+        return super().convert(inp_path)
+
+
+class FailingConverter(InpConverter):
+    def convert(self, inp_path):
+        # Like BDLCIO32 when it fails: nothing is written and no error is raised
+        return Path(inp_path).with_suffix(".BDL")
+
+
+class TestBdlcio32(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.bdl_dir = Path(self.temp_dir.name) / "bdl"
+        self.model_dir = Path(self.temp_dir.name) / "project"
+        self.processing_dir = Path(self.temp_dir.name) / "processing"
+        for directory in (self.bdl_dir, self.model_dir, self.processing_dir):
+            directory.mkdir()
+        for model_name in ("Proposed", "Baseline"):
+            (self.model_dir / f"{model_name}.inp").write_text("INPUT ..\n")
+            (self.bdl_dir / f"{model_name}.BDL").write_text(f"{model_name} BDL")
+        self.doe23_data_path = Config.DOE23_DATA_PATH
+        Config.DOE23_DATA_PATH = self.temp_dir.name
+
+    def tearDown(self):
+        Config.DOE23_DATA_PATH = self.doe23_data_path
+        self.temp_dir.cleanup()
+
+    def test_copy_bdl_converter(self):
+        converter = CopyBdlConverter([self.model_dir, self.bdl_dir])
+        bdl_path = converter.convert(self.processing_dir / "Proposed.inp")
+        self.assertEqual(self.processing_dir / "Proposed.BDL", bdl_path)
+        self.assertEqual("Proposed BDL", bdl_path.read_text())
+
+    def test_copy_bdl_converter_missing_bdl(self):
+        converter = CopyBdlConverter([self.model_dir])
+        with self.assertRaises(FileNotFoundError):
+            converter.convert(self.processing_dir / "Proposed.inp")
+
+    def test_stage_inps_converts_changed_inps(self):
+        inp_paths = [self.model_dir / "Proposed.inp", self.model_dir / "Baseline.inp"]
+        processing_dirs = [self.processing_dir] * 2
+        with CountingCopyBdlConverter([self.bdl_dir]) as converter:
+            bdl_paths = main.stage_inps(inp_paths, processing_dirs, converter=converter)
+            self.assertEqual(
+                ["Proposed BDL", "Baseline BDL"],
+                [bdl_path.read_text() for bdl_path in bdl_paths],
+            )
+
+            # Only the INP file that changed is converted again
+            inp_paths[1].write_text("INPUT ..\nTITLE ..\n")
+            main.stage_inps(inp_paths, processing_dirs, converter=converter)
+            self.assertEqual(
+                ["Proposed.inp", "Baseline.inp", "Baseline.inp"],
+                converter.converted_inp_names,
+            )
+
+    def test_stage_inps_failed_conversion(self):
+        inp_paths = [self.model_dir / "Proposed.inp"]
+        processing_dirs = [self.processing_dir]
+        with CopyBdlConverter([self.bdl_dir]) as converter:
+            main.stage_inps(inp_paths, processing_dirs, converter=converter)
+
+        # The BDL file of the previous run is not used for the changed INP file, in this run or the next
+        inp_paths[0].write_text("INPUT ..\nTITLE ..\n")
+        for _ in range(2):
+            with self.assertRaises(FileNotFoundError):
+                main.stage_inps(
+                    inp_paths, processing_dirs, converter=FailingConverter()
+                )
+            self.assertFalse((self.processing_dir / "Proposed.BDL").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,6 +50,32 @@ class TestModelInputReader(unittest.TestCase):
             data["file_commands"]["MATERIAL"]["Carpet & No Pad"],
         )
 
+    def test_read_repeated_strings_are_shared(self):
+        data = self.model_input_reader.read_input_bdl_file(self.test_file)
+        zones = list(data["file_commands"]["ZONE"].values())
+        first_keyword = next(keyword for keyword in zones[0] if keyword == "TYPE")
+        for zone in zones[1:]:
+            keyword = next(keyword for keyword in zone if keyword == "TYPE")
+            self.assertIs(first_keyword, keyword)
+            self.assertIs(zones[0]["TYPE"], zone["TYPE"])
+
+    def test_read_values_are_decoded(self):
+        data = self.model_input_reader.read_input_bdl_file(self.test_file)
+        material = data["file_commands"]["MATERIAL"]["Carpet & No Pad"]
+        self.assertEqual(0.75, material["RESISTANCE"].number)
+        self.assertEqual("HR-SQFT-F /BTU", material["RESISTANCE"].units)
+        self.assertIsNone(material["TYPE"].number)
+        self.assertFalse(hasattr(material["RESISTANCE"], "__dict__"))
+        self.assertEqual(
+            [0.0, 0.999457, 0.000543],
+            [
+                value.number
+                for value in data["file_commands"]["CURVE-FIT"][
+                    "DW-Gas-Pilotless-HIR-fPLR"
+                ]["COEF"]
+            ],
+        )
+
     def test_special_read_curve_fit_coef(self):
         data = self.model_input_reader.read_input_bdl_file(self.test_file)
         self.assertEqual(
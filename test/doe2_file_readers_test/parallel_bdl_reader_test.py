@@ -0,0 +1,63 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.doe2_file_readers.parallel_bdl_reader import (
+    read_input_bdl_file_parallel,
+)
+
+
+class TestParallelBDLReader(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_file = Path(self.temp_dir.name) / "229 Test Case E-1 (PSZHP).BDL"
+        # The index of the first phase is saved next to the BDL file, so the test reads a copy
+        shutil.copy(
+            Path(__file__).parents[2]
+            / "test"
+            / "full_rpd_test"
+            / "E-1"
+            / "229 Test Case E-1 (PSZHP).BDL",
+            self.test_file,
+        )
+        self.model_input_reader = ModelInputReader()
+        RulesetProjectDescription.bdl_command_dict = (
+            self.model_input_reader.bdl_command_dict
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_same_file_commands(self, expected, actual):
+        self.assertEqual(expected["doe2_version"], actual["doe2_version"])
+        # The objects are merged in the order of the file
+        self.assertEqual(
+            [list(group) for group in expected["file_commands"].values()],
+            [list(group) for group in actual["file_commands"].values()],
+        )
+        self.assertDictEqual(expected["file_commands"], actual["file_commands"])
+
+    def test_matches_sequential_read(self):
+        data = self.model_input_reader.read_input_bdl_file(str(self.test_file))
+        for max_workers in (1, 2):
+            self.assert_same_file_commands(
+                data, read_input_bdl_file_parallel(str(self.test_file), max_workers)
+            )
+
+    def test_projection(self):
+        data = self.model_input_reader.read_input_bdl_file(
+            str(self.test_file), ["hvac"]
+        )
+        self.assert_same_file_commands(
+            data, read_input_bdl_file_parallel(str(self.test_file), 2, ["hvac"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
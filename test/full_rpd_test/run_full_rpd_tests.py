@@ -1,7 +1,12 @@
+import argparse
+import contextlib
+import io
 import sys
 import os
 import json
 import math
+import re
+from concurrent.futures import ProcessPoolExecutor
 from difflib import get_close_matches
 
 from rpd_generator.utilities.jsonpath_utils import (
@@ -89,6 +94,30 @@ def get_zones_from_json(json_data):
     )
 
 
+def index_by_id(json_path, json_data):
+    """Indexes the objects found at a json path by ID so aligned objects can be looked up without a filtered search
+    of the whole JSON for each object. The first object wins when IDs are repeated, as with find_one.
+    """
+    index = {}
+    for obj in find_all(json_path, json_data):
+        if isinstance(obj, dict):
+            index.setdefault(obj.get("id"), obj)
+    return index
+
+
+def get_group_path(json_key_path, group):
+    """Returns the part of the json key path up to the given group, e.g. everything before surfaces[*]. ."""
+    return json_key_path[: json_key_path.index("].", json_key_path.index(group)) + 1]
+
+
+def get_reference_group_path(json_key_path, group):
+    """Returns the group path used to find aligned reference objects. Aligned reference objects are only filtered by
+    ID, so any filter on the group is replaced by a wildcard."""
+    return re.sub(
+        rf"{group}\[\?\(.*?\)]", f"{group}[*]", get_group_path(json_key_path, group)
+    )
+
+
 def find_best_match(target, candidates, cutoff=0.4):
     """Finds the best match for a target in a list of candidates."""
     matches = get_close_matches(target, candidates, n=1, cutoff=cutoff)
@@ -193,12 +222,22 @@ def get_mapping(
 
 
 def match_by_id(generated_values, reference_values):
-    """Matches generated and reference objects by ID."""
-    mapping, used_ids = {}, set()
+    """Matches generated and reference objects by ID. Exact ID matches are found through a dictionary lookup and fuzzy
+    matching is only used for the objects that remain unmatched."""
+    mapping, used_ids, unmatched_objects = {}, set(), []
+    reference_ids = [ref.get("id") for ref in reference_values]
+    reference_id_set = set(reference_ids)
+
     for generated_object in generated_values:
-        best_match = find_best_match(
-            generated_object.get("id"), [ref.get("id") for ref in reference_values]
-        )
+        generated_id = generated_object.get("id")
+        if generated_id in reference_id_set and generated_id not in used_ids:
+            mapping[generated_id] = generated_id
+            used_ids.add(generated_id)
+        else:
+            unmatched_objects.append(generated_object)
+
+    for generated_object in unmatched_objects:
+        best_match = find_best_match(generated_object.get("id"), reference_ids)
         if best_match and best_match not in used_ids:
             mapping[generated_object.get("id")] = best_match
             used_ids.add(best_match)
@@ -208,22 +247,90 @@ def match_by_id(generated_values, reference_values):
 def match_by_attributes(
     generated_values, reference_values, generated_zone_id, reference_zone_id, attrs
 ):
-    """Matches generated and reference objects based on specified attributes."""
+    """Matches generated and reference objects based on specified attributes. Candidates that share a hash of the
+    generated object's attribute values are checked first and the remaining objects are scored against the remaining
+    candidates."""
     mapping = {}
+    remaining_references = dict(enumerate(reference_values))
+
+    reference_index = {}
+    for i, reference_object in remaining_references.items():
+        reference_index.setdefault(
+            get_attribute_hash(reference_object, attrs, reference_zone_id), []
+        ).append(i)
+
+    unmatched_objects = []
     for generated_object in generated_values:
+        candidate_indices = reference_index.get(
+            get_attribute_hash(generated_object, attrs, generated_zone_id), []
+        )
+        best_match_index = next(
+            (
+                i
+                for i in candidate_indices
+                if all(
+                    compare_attributes(
+                        generated_object,
+                        remaining_references[i],
+                        attr,
+                        generated_zone_id,
+                        reference_zone_id,
+                    )
+                    for attr in attrs
+                )
+            ),
+            None,
+        )
+        if best_match_index is None:
+            unmatched_objects.append(generated_object)
+            continue
+        candidate_indices.remove(best_match_index)
+        best_match = remaining_references.pop(best_match_index)
+        mapping[generated_object.get("id")] = best_match.get("id")
+
+    for generated_object in unmatched_objects:
         best_match = get_best_match_attrs(
             generated_object,
-            reference_values,
+            list(remaining_references.values()),
             attrs,
             generated_zone_id,
             reference_zone_id,
         )
         if best_match:
             mapping[generated_object.get("id")] = best_match.get("id")
-            reference_values.pop(reference_values.index(best_match))
+            del remaining_references[
+                next(
+                    i
+                    for i, reference_object in remaining_references.items()
+                    if reference_object is best_match
+                )
+            ]
     return mapping
 
 
+def get_attribute_hash(obj, attrs, zone_id):
+    """Builds a hashable key from the attributes compared exactly by compare_attributes. Area is compared with a
+    tolerance, so it is left out of the key and checked when the candidates are compared.
+    """
+    key = []
+    for attr in attrs:
+        value = obj.get(attr)
+        if attr == "area":
+            continue
+        elif attr == "azimuth" and isinstance(value, (int, float)):
+            # Interior walls may be defined from the adjacent zone, in which case the azimuth is reversed
+            if obj.get("adjacent_zone") == zone_id:
+                value = (value + 180) % 360
+            key.append(value)
+        elif isinstance(value, list):
+            key.append(len(value))
+        elif isinstance(value, (dict, set)):
+            key.append(repr(value))
+        else:
+            key.append(value)
+    return tuple(key)
+
+
 def match_sys_by_zones_served(generated_values, reference_values, object_id_map):
     mapping = {}
 
@@ -953,11 +1060,22 @@ def handle_special_cases(path_spec, object_id_map, generated_json, reference_jso
         generated_zones = get_zones_from_json(generated_json)
 
         generated_surfaces = find_all(
-            json_key_path[
-                : json_key_path.index("].", json_key_path.index("surfaces")) + 1
-            ],
-            generated_json,
+            get_group_path(json_key_path, "surfaces"), generated_json
+        )
+        generated_parent_zone_ids = {
+            surface["id"]: zone["id"]
+            for zone in generated_zones
+            for surface in zone.get("surfaces", [])
+        }
+        reference_surfaces_by_id = index_by_id(
+            get_group_path(json_key_path, "surfaces"), reference_json
+        )
+        unfiltered_reference_surfaces_by_id = index_by_id(
+            get_reference_group_path(json_key_path, "surfaces"), reference_json
         )
+        surface_data_path = json_key_path[
+            (json_key_path.index("].", json_key_path.index("surfaces"))) + 2 :
+        ]
 
         # Iterate through the generated surfaces to populate data for each surface individually, ensuring correct alignment via object mapping
         for generated_surface in generated_surfaces:
@@ -970,13 +1088,8 @@ def handle_special_cases(path_spec, object_id_map, generated_json, reference_jso
                 )
                 continue
 
-            aligned_reference_surface = find_one(
-                json_key_path[
-                    : json_key_path.index("].", json_key_path.index("surfaces")) + 1
-                ]
-                + f"[?(@.id == '{reference_surface_id}')]",
-                reference_json,
-                None,
+            aligned_reference_surface = reference_surfaces_by_id.get(
+                reference_surface_id
             )
 
             if not aligned_reference_surface:
@@ -985,38 +1098,17 @@ def handle_special_cases(path_spec, object_id_map, generated_json, reference_jso
                 )
                 continue
 
-            generated_parent_zone = next(
-                zone
-                for zone in generated_zones
-                if any(
-                    surface["id"] == generated_surface_id
-                    for surface in zone.get("surfaces", [])
-                )
-            )
-            generated_parent_zone_id = generated_parent_zone["id"]
+            generated_parent_zone_id = generated_parent_zone_ids[generated_surface_id]
             reference_parent_zone_id = object_id_map.get(generated_parent_zone_id)
 
             generated_value = generated_surface.get(json_key_path.split(".")[-1])
             aligned_generated_values[generated_surface_id] = generated_value
             # Extract values from aligned surfaces using the specified key path
-            if "surfaces[?(@" in json_key_path:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[?(",
-                        f"surfaces[?(@.id == '{reference_surface_id}' & ",
-                    ),
-                    reference_json,
-                    None,
-                )
-            else:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[*]",
-                        f"surfaces[?(@.id == '{reference_surface_id}')]",
-                    ),
-                    reference_json,
-                    None,
-                )
+            aligned_reference_value = find_one(
+                surface_data_path,
+                unfiltered_reference_surfaces_by_id.get(reference_surface_id),
+                None,
+            )
             aligned_reference_values[generated_surface_id] = aligned_reference_value
 
             mismatched_wall_origin_adjacent_zone = (
@@ -1068,6 +1160,9 @@ def handle_ordered_comparisons(
 
         generated_zones = get_zones_from_json(generated_json)
         generated_zone_ids = [zone["id"] for zone in generated_zones]
+        reference_zones_by_id = index_by_id(
+            get_group_path(json_key_path, "zones"), reference_json
+        )
 
         # Populate data for each zone individually and ensure correct alignment via object mapping
         for generated_zone in generated_zones:
@@ -1080,12 +1175,11 @@ def handle_ordered_comparisons(
             generated_value = find_one(zone_data_path, generated_zone)
             aligned_generated_values[generated_zone_id] = generated_value
             # Extract values from aligned zones using the specified key path
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "zones[*]", f"zones[?(@.id == '{reference_zone_id}')]"
-                ),
-                reference_json,
-                None,
+            reference_zone = reference_zones_by_id.get(reference_zone_id)
+            aligned_reference_value = (
+                find_one(zone_data_path, reference_zone, None)
+                if reference_zone
+                else None
             )
 
             aligned_reference_values[generated_zone_id] = aligned_reference_value
@@ -1116,39 +1210,27 @@ def handle_ordered_comparisons(
             generated_json,
         )
         generated_surface_ids = [surface["id"] for surface in generated_surfaces]
+        reference_surfaces_by_id = index_by_id(
+            get_reference_group_path(json_key_path, "surfaces"), reference_json
+        )
+        surface_data_path = json_key_path[
+            (json_key_path.index("].", json_key_path.index("surfaces"))) + 2 :
+        ]
 
         for generated_surface in generated_surfaces:
             generated_surface_id = generated_surface["id"]
             reference_surface_id = object_id_map.get(generated_surface_id)
 
-            generated_value = find_one(
-                # Extract the key path for the surface data (everything after surfaces[]. )
-                json_key_path[
-                    (json_key_path.index("].", json_key_path.index("surfaces"))) + 2 :
-                ],
-                generated_surface,
-            )
+            generated_value = find_one(surface_data_path, generated_surface)
             aligned_generated_values[generated_surface_id] = generated_value
 
             # Extract values from aligned surfaces using the specified key path
-            if "surfaces[?(@" in json_key_path:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[?(",
-                        f"surfaces[?(@.id == '{reference_surface_id}' & ",
-                    ),
-                    reference_json,
-                    None,
-                )
-            else:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[*]",
-                        f"surfaces[?(@.id == '{reference_surface_id}')]",
-                    ),
-                    reference_json,
-                    None,
-                )
+            reference_surface = reference_surfaces_by_id.get(reference_surface_id)
+            aligned_reference_value = (
+                find_one(surface_data_path, reference_surface, None)
+                if reference_surface
+                else None
+            )
 
             aligned_reference_values[generated_surface_id] = aligned_reference_value
 
@@ -1179,39 +1261,27 @@ def handle_ordered_comparisons(
             generated_json,
         )
         generated_terminal_ids = [terminal["id"] for terminal in generated_terminals]
+        reference_terminals_by_id = index_by_id(
+            get_reference_group_path(json_key_path, "terminals"), reference_json
+        )
+        terminal_data_path = json_key_path[
+            (json_key_path.index("].", json_key_path.index("terminals"))) + 2 :
+        ]
 
         for generated_terminal in generated_terminals:
             generated_terminal_id = generated_terminal["id"]
             reference_terminal_id = object_id_map.get(generated_terminal_id)
 
-            generated_value = find_one(
-                # Extract the key path for the terminal data (everything after terminals[]. )
-                json_key_path[
-                    (json_key_path.index("].", json_key_path.index("terminals"))) + 2 :
-                ],
-                generated_terminal,
-            )
+            generated_value = find_one(terminal_data_path, generated_terminal)
             aligned_generated_values[generated_terminal_id] = generated_value
 
             # Extract values from aligned terminals using the specified key path
-            if "terminals[?(@" in json_key_path:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "terminals[?(",
-                        f'terminals[?(@.id=="{reference_terminal_id}" & ',
-                    ),
-                    reference_json,
-                    None,
-                )
-            else:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "terminals[*]",
-                        f"terminals[?(@.id == '{reference_terminal_id}')]",
-                    ),
-                    reference_json,
-                    None,
-                )
+            reference_terminal = reference_terminals_by_id.get(reference_terminal_id)
+            aligned_reference_value = (
+                find_one(terminal_data_path, reference_terminal, None)
+                if reference_terminal
+                else None
+            )
 
             aligned_reference_values[generated_terminal_id] = aligned_reference_value
 
@@ -1644,14 +1714,29 @@ def run_file_comparison(spec_file, generated_json_file, reference_json_file):
     return warnings, errors
 
 
-def run_comparison_for_all_tests(test_dir):
-    """Runs JSON comparison for all test cases in the test directory."""
+def run_test_case_comparison(test, spec_file, generated_json_file, reference_json_file):
+    """Runs the comparison for one test case and returns its printed output with the number of errors, so that the
+    output of test cases compared in parallel is not interleaved."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        print(f"Running comparison for {test}...")
+        warnings, errors = run_file_comparison(
+            spec_file, generated_json_file, reference_json_file
+        )
+        print_results(test, warnings, errors)
+    return output.getvalue(), len(errors)
+
+
+def run_comparison_for_all_tests(test_dir, max_workers=None):
+    """Runs JSON comparison for all test cases in the test directory.
+    :param max_workers: number of processes comparing test cases in parallel. Defaults to the number of CPUs; use 1
+    to compare the test cases in this process.
+    """
 
     reference_dir = os.path.join(test_dir, "Correct Answer RPDs")
     spec_dir = os.path.join(test_dir, "Test Specifications")
 
-    total_errors = 0
-
+    test_cases = []
     for test in os.listdir(test_dir):
         # Only recognize directories starting with "E-" or "F-" as test cases
         if os.path.isdir(test_dir) and (test.startswith("E-") or test.startswith("F-")):
@@ -1675,17 +1760,37 @@ def run_comparison_for_all_tests(test_dir):
                 and os.path.isfile(generated_json_file)
                 and os.path.isfile(reference_json_file)
             ):
-                print(f"Running comparison for {test}...")
-                warnings, errors = run_file_comparison(
-                    spec_file, generated_json_file, reference_json_file
+                test_cases.append(
+                    (test, spec_file, generated_json_file, reference_json_file)
                 )
-                print_results(test, warnings, errors)
-                total_errors += len(errors)
+
+    if max_workers == 1:
+        results = (run_test_case_comparison(*test_case) for test_case in test_cases)
+        total_errors = print_test_case_results(results)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(run_test_case_comparison, *test_case)
+                for test_case in test_cases
+            ]
+            # Print in test case order rather than completion order to keep the output deterministic
+            total_errors = print_test_case_results(
+                future.result() for future in futures
+            )
 
     if total_errors > 0:
         sys.exit(1)
 
 
+def print_test_case_results(results):
+    """Prints the output of each test case comparison and returns the total number of errors."""
+    total_errors = 0
+    for output, error_count in results:
+        print(output, end="")
+        total_errors += error_count
+    return total_errors
+
+
 def print_results(test, warnings, errors):
     """Prints the comparison results."""
     if warnings:
@@ -1707,5 +1812,16 @@ def print_results(test, warnings, errors):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the generated test case RPDs to the correct answer RPDs."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of test cases compared in parallel. Defaults to the number of CPUs.",
+    )
+    args = parser.parse_args()
+
     test_directory = os.path.dirname(os.path.abspath(__file__))
-    run_comparison_for_all_tests(test_directory)
+    run_comparison_for_all_tests(test_directory, max_workers=args.workers)
@@ -395,6 +395,39 @@ class TestRunFullRPDTests(unittest.TestCase):
         )
         self.assertEqual({}, object_id_map)
 
+    def test_match_by_id_prefers_exact_ids(self):
+        generated_zones = [{"id": "Zone 1 Core"}, {"id": "Zone 1"}, {"id": "Zone 2"}]
+        reference_zones = [{"id": "Zone 2"}, {"id": "Zone 1"}, {"id": "Zone 1 Core"}]
+
+        object_id_map = rpd_tests.match_by_id(generated_zones, reference_zones)
+        self.assertEqual(
+            object_id_map,
+            {"Zone 1 Core": "Zone 1 Core", "Zone 1": "Zone 1", "Zone 2": "Zone 2"},
+        )
+
+    def test_match_by_attributes_reversed_azimuth(self):
+        generated_surfaces = [
+            {"id": "Wall A", "area": 100.0, "azimuth": 90},
+            {"id": "Wall B", "area": 100.0, "azimuth": 270},
+            {"id": "Wall C", "area": 50.0, "azimuth": 90},
+        ]
+        reference_surfaces = [
+            {"id": "Ref C", "area": 50.05, "azimuth": 90},
+            {"id": "Ref B", "area": 100.0, "azimuth": 90, "adjacent_zone": "Ref Zone"},
+            {"id": "Ref A", "area": 100.0, "azimuth": 90},
+        ]
+
+        object_id_map = rpd_tests.match_by_attributes(
+            generated_surfaces,
+            reference_surfaces,
+            "Zone",
+            "Ref Zone",
+            ["area", "azimuth"],
+        )
+        self.assertEqual(
+            object_id_map, {"Wall A": "Ref A", "Wall B": "Ref B", "Wall C": "Ref C"}
+        )
+
     def test_surface_mapping_mismatched_interior_walls(self):
         generated_json = {
             "id": "Test RPD",
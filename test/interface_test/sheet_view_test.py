@@ -0,0 +1,48 @@
+import importlib.util
+import tkinter
+import unittest
+from tkinter.font import Font
+
+HAS_INTERFACE_PACKAGES = all(
+    importlib.util.find_spec(package) for package in ("customtkinter", "tksheet")
+)
+
+
+@unittest.skipUnless(HAS_INTERFACE_PACKAGES, "customtkinter and tksheet are required")
+class TestSheetSubview(unittest.TestCase):
+
+    def setUp(self):
+        import customtkinter as ctk
+
+        try:
+            self.root = ctk.CTk()
+        except tkinter.TclError:
+            self.skipTest("A display is required")
+        self.root.withdraw()
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_populate_empty_subview(self):
+        from interface.sheet_view import COLUMN_PADDING, SheetColumn, SheetSubview
+
+        # A model without skylights, doors, etc. has subviews without rows
+        subview = SheetSubview(
+            self.root, [SheetColumn("Name"), SheetColumn("Floor")], group_label="Floor"
+        )
+        subview.populate_subview()
+
+        self.assertTrue(subview.is_subview_populated)
+        self.assertEqual(0, subview.sheet.get_total_rows())
+        header_font = Font(font=subview.sheet.header_font())
+        self.assertEqual(
+            [
+                header_font.measure(header) + COLUMN_PADDING
+                for header in ["Name", "Floor"]
+            ],
+            subview.sheet.get_column_widths(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -360,3 +360,34 @@ class TestExteriorWall(unittest.TestCase):
         self.assertEqual(
             expected_data_structure, self.exterior_wall.exterior_wall_data_structure
         )
+
+    def test_populate_data_with_exterior_walls_sharing_construction(self):
+        """Tests that exterior walls with the same construction and air film resistances share one construction data
+        structure, and that the construction's own data structure is not adjusted"""
+        self.floor.keyword_value_pairs = {BDL_FloorKeywords.AZIMUTH: "0"}
+        self.space.keyword_value_pairs = {BDL_SpaceKeywords.AZIMUTH: "0"}
+        self.construction.keyword_value_pairs = {
+            BDL_ConstructionKeywords.TYPE: BDL_ConstructionTypes.U_VALUE,
+            BDL_ConstructionKeywords.U_VALUE: "12.5",
+        }
+        exterior_wall2 = ExteriorWall("Exterior Wall 2", self.space, self.rmd)
+        for exterior_wall in [self.exterior_wall, exterior_wall2]:
+            exterior_wall.keyword_value_pairs = {
+                BDL_ExteriorWallKeywords.CONSTRUCTION: "Construction 1",
+                BDL_ExteriorWallKeywords.AREA: "300",
+                BDL_ExteriorWallKeywords.TILT: "90",
+            }
+
+        self.rmd.populate_rmd_data(testing=True)
+        self.assertIs(
+            self.exterior_wall.exterior_wall_data_structure["construction"],
+            exterior_wall2.exterior_wall_data_structure["construction"],
+        )
+        self.assertEqual(4.0, self.exterior_wall.construction["u_factor"])
+        self.assertEqual(
+            12.5, self.construction.construction_data_structure["u_factor"]
+        )
+        self.assertEqual(
+            [{"id": "Simplified Material"}],
+            self.construction.construction_data_structure["primary_layers"],
+        )
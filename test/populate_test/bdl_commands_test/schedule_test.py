@@ -28,3 +28,21 @@ class TestSchedules(unittest.TestCase):
     #     expected_data_structure = {}
     #
     #     self.assertEqual(expected_data_structure, self.schedule.schedule_data_structure)
+
+    def test_hourly_value_statistics(self):
+        self.schedule.hourly_values = [0.0, 1.0, -999.0, 1.0, 0.5]
+        fan_schedule = Schedule("Fan Schedule", self.rmd)
+        fan_schedule.hourly_values = [1.0, 1.0, 0.0, 1.0, 1.0]
+
+        self.assertEqual(1.0, self.schedule.get_max_value())
+        self.assertEqual(-999.0, self.schedule.get_min_value())
+        self.assertEqual(0b01010, self.schedule.get_value_mask(1))
+        self.assertTrue(self.schedule.has_value(-999))
+        self.assertFalse(self.schedule.is_always_value(1))
+        self.assertFalse(self.schedule.has_value_during(-999, fan_schedule, 1))
+        self.assertTrue(self.schedule.has_value_during(0, fan_schedule, 1))
+
+        # Replacing the hourly values discards the statistics
+        self.schedule.hourly_values = [1.0] * 5
+        self.assertTrue(self.schedule.is_always_value(1))
+        self.assertFalse(self.schedule.has_value(-999))
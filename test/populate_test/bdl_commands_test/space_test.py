@@ -303,6 +303,18 @@ class TestSpaces(unittest.TestCase):
         }
         self.assertEqual(expected_data_structure, self.space.space_data_structure)
 
+    @patch("rpd_generator.bdl_structure.base_node.BaseNode.get_output_data")
+    def test_populated_space_has_no_dict_attributes(self, mock_get_output_data):
+        """Tests that every attribute of a populated space is stored in a slot."""
+        mock_get_output_data.return_value = {}
+        self.space.keyword_value_pairs = {
+            BDL_SpaceKeywords.AREA: "400",
+            BDL_SpaceKeywords.NUMBER_OF_PEOPLE: "10",
+        }
+
+        self.rmd.populate_rmd_data(testing=True)
+        self.assertEqual({}, vars(self.space))
+
     @patch("rpd_generator.bdl_structure.base_node.BaseNode.get_output_data")
     def test_populate_data_with_space_process_hot_water_internal_energies(
         self, mock_get_output_data
@@ -691,3 +691,21 @@ class TestSystems(unittest.TestCase):
             }
 
             self.rmd.populate_rmd_data(testing=True)
+
+    def test_objects_by_command(self):
+        """
+        Verify that the RMD returns the objects of a command in the order they were added and sorts the commands in
+        processing order.
+        """
+        system2 = System("System 2", self.rmd)
+        self.assertEqual([self.system, system2], self.rmd.objects(BDL_Commands.SYSTEM))
+        self.assertEqual([self.zone1], self.rmd.objects(BDL_Commands.ZONE))
+        self.assertEqual([], self.rmd.objects(BDL_Commands.CHILLER))
+
+        sorted_commands = self.rmd.sort_commands()
+        self.assertLess(
+            sorted_commands.index(self.circ_loop), sorted_commands.index(self.system)
+        )
+        self.assertLess(
+            sorted_commands.index(system2), sorted_commands.index(self.zone1)
+        )
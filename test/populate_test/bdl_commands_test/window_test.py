@@ -224,3 +224,21 @@ class TestWindows(unittest.TestCase):
         self.rmd.populate_rmd_data(testing=True)
         expected_data_structure = {"classification": "WINDOW", "id": "Window 1"}
         self.assertEqual(expected_data_structure, self.window.window_data_structure)
+
+    @patch("rpd_generator.bdl_structure.base_node.BaseNode.get_output_data")
+    def test_populate_output_data_for_windows(self, mock_get_output_data):
+        """Tests that the outputs of all windows are requested at once and assigned to each window"""
+        window2 = Window("Window 2", self.exterior_wall, self.rmd)
+        mock_get_output_data.return_value = {
+            ("Window 1", "Window - Input - Glass center u-value"): 1.5,
+            ("Window 2", "Window - Input - Glass center u-value"): 2.5,
+        }
+
+        Window.populate_output_data([self.window, window2])
+        mock_get_output_data.assert_called_once()
+        self.assertEqual(
+            {"Window - Input - Glass center u-value": 1.5}, self.window.output_data
+        )
+        self.assertEqual(
+            {"Window - Input - Glass center u-value": 2.5}, window2.output_data
+        )
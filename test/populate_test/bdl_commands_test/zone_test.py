@@ -484,6 +484,20 @@ class TestZones(unittest.TestCase):
         }
         self.assertEqual(expected_data_structure, self.zone.zone_data_structure)
 
+    @patch("rpd_generator.bdl_structure.base_node.BaseNode.get_output_data")
+    def test_populated_zone_and_system_have_no_dict_attributes(
+        self, mock_get_output_data
+    ):
+        """Verify that every attribute of a populated zone and system is stored in a slot"""
+        self.system.keyword_value_pairs = {
+            BDL_SystemKeywords.FAN_SCHEDULE: "Fan Annual Schedule",
+            BDL_SystemKeywords.TYPE: BDL_SystemTypes.SUM,
+        }
+
+        self.rmd.populate_rmd_data(testing=True)
+        self.assertEqual({}, vars(self.zone))
+        self.assertEqual({}, vars(self.system))
+
     @patch("rpd_generator.bdl_structure.base_node.BaseNode.get_output_data")
     def test_populate_zone_with_exhaust_fan_data(self, mock_get_output_data):
         """
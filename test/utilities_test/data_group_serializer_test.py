@@ -0,0 +1,46 @@
+import unittest
+
+from rpd_generator.bdl_structure.data_group_serializer import DataGroupSerializer
+
+
+class Terminal:
+    def __init__(self):
+        self.reporting_name = None
+        self.notes = "Note"
+        self.terminals_id = ["Terminal 1", "Terminal 2", None]
+        self.terminals_type = ["VARIABLE_AIR_VOLUME", None, None]
+        self.terminals_is_supply_ducted = True
+
+
+class TestDataGroupSerializer(unittest.TestCase):
+    def test_serialize(self):
+        serializer = DataGroupSerializer(["reporting_name", "notes", "missing"])
+        self.assertEqual(
+            {"id": "Terminal", "notes": "Note"},
+            serializer.serialize(Terminal(), {"id": "Terminal"}),
+        )
+
+    def test_serialize_index(self):
+        serializer = DataGroupSerializer(
+            ["terminals_id", "terminals_type"], prefix="terminals_"
+        )
+        self.assertEqual(
+            {"id": "Terminal 2"}, serializer.serialize_index(Terminal(), 1)
+        )
+
+    def test_serialize_groups(self):
+        serializer = DataGroupSerializer.from_prefix(Terminal(), "terminals_")
+        self.assertEqual(
+            [
+                {
+                    "id": "Terminal 1",
+                    "is_supply_ducted": True,
+                    "type": "VARIABLE_AIR_VOLUME",
+                },
+            ],
+            serializer.serialize_groups(Terminal()),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from rpd_generator.bdl_structure.bdl_object_registry import BDLObjectRegistry
+from rpd_generator.utilities import definition_reachability
+
+
+def get_file_commands():
+    return {
+        "MATERIAL": {
+            "Material 1": {"command": "MATERIAL", "TYPE": "PROPERTIES"},
+            "Material 2": {"command": "MATERIAL", "TYPE": "RESISTANCE"},
+            "Library Material": {"command": "MATERIAL", "TYPE": "RESISTANCE"},
+        },
+        "LAYERS": {
+            "Layers 1": {"command": "LAYERS", "MATERIAL": ["Material 1", "Material 2"]},
+            "Library Layers": {"command": "LAYERS", "MATERIAL": ["Library Material"]},
+        },
+        "CONSTRUCTION": {
+            "Construction 1": {"command": "CONSTRUCTION", "LAYERS": "Layers 1"},
+            "Library Construction": {
+                "command": "CONSTRUCTION",
+                "LAYERS": "Library Layers",
+            },
+        },
+        "SCHEDULE-PD": {
+            "Schedule 1": {"command": "SCHEDULE-PD", "WEEK-SCHEDULES": ["Week 1"]},
+        },
+        "WEEK-SCHEDULE-PD": {
+            "Week 1": {"command": "WEEK-SCHEDULE-PD", "DAY-SCHEDULES": ["Day 1"]},
+        },
+        "DAY-SCHEDULE-PD": {
+            "Day 1": {"command": "DAY-SCHEDULE-PD", "VALUES": ["1"] * 24},
+            "Day 2": {"command": "DAY-SCHEDULE-PD", "VALUES": ["0"] * 24},
+        },
+        "EXTERIOR-WALL": {
+            "Wall 1": {
+                "command": "EXTERIOR-WALL",
+                "parent": "Space 1",
+                "CONSTRUCTION": "Construction 1",
+            },
+        },
+    }
+
+
+class TestDefinitionReachability(unittest.TestCase):
+    def test_get_unreferenced_definitions(self):
+        self.assertEqual(
+            {
+                "MATERIAL": {"Library Material"},
+                "LAYERS": {"Library Layers"},
+                "CONSTRUCTION": {"Library Construction"},
+                "DAY-SCHEDULE-PD": {"Day 2"},
+            },
+            definition_reachability.get_unreferenced_definitions(get_file_commands()),
+        )
+
+    def test_deferred_object_created_on_access(self):
+        registry = BDLObjectRegistry()
+        created = []
+
+        def create_obj():
+            created.append("Library Material")
+            registry["Library Material"] = "Material object"
+
+        registry.defer("Library Material", create_obj)
+        self.assertNotIn("Library Material", registry)
+        self.assertEqual("Material object", registry.get("Library Material"))
+        self.assertEqual("Material object", registry["Library Material"])
+        self.assertEqual(["Library Material"], created)
+        self.assertIsNone(registry.get("Missing Material"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from rpd_generator.utilities import ensure_valid_rpd
+
+
+def get_rpd_with_shared_construction():
+    construction = {
+        "id": "Construction 1",
+        "u_factor": 0.5,
+        "primary_layers": [{"id": "Material 1", "thickness": 0.1}],
+    }
+    return {
+        "id": "RPD",
+        "surfaces": [
+            {"id": "Wall 1", "construction": construction, "azimuth": 90.0},
+            {"id": "Wall 2", "construction": construction, "empty": {}},
+            {"id": "Construction 1", "construction": construction},
+        ],
+        "notes": ["text", 1, None, True, {}],
+    }
+
+
+class TestMakeIdsUnique(unittest.TestCase):
+    def test_make_ids_unique_copies_shared_data_groups(self):
+        rpd = get_rpd_with_shared_construction()
+        construction = rpd["surfaces"][0]["construction"]
+
+        ensure_valid_rpd.make_ids_unique(rpd)
+
+        self.assertEqual(
+            {
+                "id": "RPD",
+                "surfaces": [
+                    {
+                        "id": "Wall 1",
+                        "construction": {
+                            "id": "Construction 1",
+                            "u_factor": 0.5,
+                            "primary_layers": [{"id": "Material 1", "thickness": 0.1}],
+                        },
+                        "azimuth": 90.0,
+                    },
+                    {
+                        "id": "Wall 2",
+                        "construction": {
+                            "id": "Construction 1--1",
+                            "u_factor": 0.5,
+                            "primary_layers": [
+                                {"id": "Material 1--1", "thickness": 0.1}
+                            ],
+                        },
+                    },
+                    {
+                        "id": "Construction 1--2",
+                        "construction": {
+                            "id": "Construction 1--3",
+                            "u_factor": 0.5,
+                            "primary_layers": [
+                                {"id": "Material 1--2", "thickness": 0.1}
+                            ],
+                        },
+                    },
+                ],
+                "notes": ["text", 1, None, True],
+            },
+            rpd,
+        )
+        # The first occurrence keeps the shared data group, the others get copies
+
+        self.assertIs(construction, rpd["surfaces"][0]["construction"])
+        self.assertIsNot(construction, rpd["surfaces"][1]["construction"])
+
+
+if __name__ == "__main__":
+    unittest.main()
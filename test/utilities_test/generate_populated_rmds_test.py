@@ -0,0 +1,140 @@
+import multiprocessing
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from rpd_generator import main
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.schema.ruleset import Ruleset
+
+TEST_CASES_DIR = Path(__file__).parents[2] / "test" / "full_rpd_test"
+
+
+def generate_rmd_from_bdl(bdl_path_str, progress=None):
+    """Generate the RMD of a test case BDL file in place of an INP file, as the test cases have no INP files."""
+    return main.generate_rmds_from_bdls(ModelInputReader(), [bdl_path_str], progress)[0]
+
+
+@unittest.skipUnless(
+    "fork" in multiprocessing.get_all_start_methods(),
+    "The worker processes must be forked to inherit the patches",
+)
+class TestGeneratePopulatedRmds(unittest.TestCase):
+    """
+    Simulation results are replaced by constants, as the test cases have no simulation output files. The worker
+    processes are forked after the patches are started, so that they inherit the patches whatever the default start
+    method of the platform.
+    """
+
+    def setUp(self):
+        self.bdl_paths = [
+            str(TEST_CASES_DIR / "E-1" / "229 Test Case E-1 (PSZHP).BDL"),
+            str(next((TEST_CASES_DIR / "E-2").glob("*.BDL"))),
+            str(next((TEST_CASES_DIR / "E-3").glob("*.BDL"))),
+        ]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_paths = (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+        )
+        Config.EQUEST_INSTALL_PATH = self.temp_dir.name
+        Config.DOE22_DATA_PATH = self.temp_dir.name
+        Config.DOE23_DATA_PATH = self.temp_dir.name
+        self.patches = [
+            patch.object(main, "stage_inps", lambda *args: None),
+            patch.object(main, "generate_rmd_from_inp", generate_rmd_from_bdl),
+            patch(
+                "rpd_generator.bdl_structure.base_node.get_multiple_results",
+                lambda dll, data_path, file_path, values: [1.0] * len(values),
+            ),
+            patch(
+                "rpd_generator.bdl_structure.base_node.get_string_result",
+                lambda *args: "",
+            ),
+            patch(
+                "rpd_generator.bdl_structure.base_definition.get_string_result",
+                lambda *args: "",
+            ),
+        ]
+        for test_patch in self.patches:
+            test_patch.start()
+
+    def tearDown(self):
+        for test_patch in self.patches:
+            test_patch.stop()
+        (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+        ) = self.config_paths
+        self.temp_dir.cleanup()
+
+    def generate_rmd_data_structures(self, max_workers):
+        rpd = RulesetProjectDescription()
+        rmds = main.generate_populated_rmds(
+            self.bdl_paths,
+            rpd,
+            max_workers,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+        for rmd in rmds:
+            self.assertIs(rpd, rmd.bdl_obj_instances["ASHRAE 229"])
+        return [rmd.rmd_data_structure for rmd in rmds], rpd
+
+    def test_process_pool_matches_serial_generation(self):
+        serial_rmds, serial_rpd = self.generate_rmd_data_structures(max_workers=1)
+        pool_rmds, pool_rpd = self.generate_rmd_data_structures(max_workers=2)
+
+        self.assertEqual(serial_rmds, pool_rmds)
+        self.assertEqual(serial_rpd.calendar, pool_rpd.calendar)
+        self.assertEqual(serial_rpd.weather, pool_rpd.weather)
+
+    def test_process_pool_keeps_input_order(self):
+        rmds, _ = self.generate_rmd_data_structures(max_workers=3)
+        RulesetProjectDescription.bdl_command_dict = ModelInputReader().bdl_command_dict
+        serial_rmd_ids = [
+            generate_rmd_from_bdl(bdl_path).obj_id for bdl_path in self.bdl_paths
+        ]
+
+        self.assertEqual(serial_rmd_ids, [rmd["id"] for rmd in rmds])
+        self.assertEqual(len(set(serial_rmd_ids)), len(serial_rmd_ids))
+
+
+class TestRmdWorker(unittest.TestCase):
+    def setUp(self):
+        self.config = (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+            Config.ACTIVE_RULESET,
+        )
+
+    def tearDown(self):
+        (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+            active_ruleset,
+        ) = self.config
+        Config.use_ruleset(active_ruleset)
+
+    def test_worker_uses_the_active_ruleset(self):
+        ruleset = Ruleset(
+            name="Test Ruleset",
+            enum_filename=Config.ACTIVE_RULESET.enum_schema_filename,
+            output_filename=Config.ACTIVE_RULESET.output_schema_filename,
+        )
+        main._initialize_rmd_worker("eQUEST", "DOE22", "DOE23", ruleset)
+
+        self.assertEqual("DOE23", Config.DOE23_DATA_PATH)
+        self.assertEqual("Test Ruleset", Config.ACTIVE_RULESET.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from rpd_generator.utilities import generation_service
+
+
+class TestGenerationService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = generation_service.GenerationService(
+            max_workers=1, max_queued_jobs=1
+        )
+        cls.server = generation_service.create_server(cls.service, port=0)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever)
+        cls.server_thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server_thread.join()
+        cls.service.shutdown()
+
+    def post_job(self, request):
+        http_request = urllib.request.Request(
+            f"{self.url}/jobs",
+            data=json.dumps(request).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(http_request) as response:
+            return response.status, json.load(response)
+
+    def get_job(self, job_id, wait=30):
+        with urllib.request.urlopen(
+            f"{self.url}/jobs/{job_id}?wait={wait}"
+        ) as response:
+            return json.load(response)
+
+    def test_validate_job(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "model.json"
+            json_path.write_text(json.dumps({"id": 1}))
+
+            status, job = self.post_job(
+                {"type": "validate", "json_path": str(json_path)}
+            )
+            self.assertEqual(202, status)
+            job = self.get_job(job["id"])
+
+        self.assertEqual("succeeded", job["status"])
+        self.assertFalse(job["result"]["passed"])
+        self.assertIn("schema invalid", job["result"]["error"])
+
+    def test_failed_job(self):
+        status, job = self.post_job(
+            {"type": "validate", "json_path": "does_not_exist.json"}
+        )
+        job = self.get_job(job["id"])
+
+        self.assertEqual("failed", job["status"])
+        self.assertIn("FileNotFoundError", job["error"])
+
+    def test_invalid_job_request(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.post_job({"type": "generate", "bdl_path": "model.BDL"})
+        self.assertEqual(400, context.exception.code)
+
+    def test_queue_limit(self):
+        service = generation_service.GenerationService(max_workers=1, max_queued_jobs=0)
+        service.pending_jobs = 1
+        with self.assertRaises(generation_service.QueueFullError):
+            service.submit({"type": "validate", "json_path": "model.json"})
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,272 @@
+import copy
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from rpd_generator import main
+from rpd_generator.config import Config
+from rpd_generator.utilities import incremental_regeneration
+
+
+def get_file_commands():
+    return {
+        "SYSTEM": {
+            "Sys 1": {"command": "SYSTEM", "TYPE": "PSZ"},
+            "Sys 2": {"command": "SYSTEM", "TYPE": "PTAC"},
+        },
+        "ZONE": {
+            "Zone 1": {"command": "ZONE", "parent": "Sys 1", "SPACE": "Space 1"},
+            "Zone 2": {"command": "ZONE", "parent": "Sys 2", "SPACE": "Space 2"},
+        },
+        "SPACE": {
+            "Space 1": {"command": "SPACE", "parent": "Floor 1", "AREA": "100"},
+            "Space 2": {"command": "SPACE", "parent": "Floor 1", "AREA": "200"},
+        },
+        "EXTERIOR-WALL": {
+            "Wall 1": {"command": "EXTERIOR-WALL", "parent": "Space 1"},
+            "Wall 2": {"command": "EXTERIOR-WALL", "parent": "Space 2"},
+        },
+        "WINDOW": {
+            "Window 1": {"command": "WINDOW", "parent": "Wall 2", "HEIGHT": "5"},
+        },
+        "BOILER": {
+            "Boiler 1": {"command": "BOILER", "TYPE": "HW-BOILER"},
+        },
+    }
+
+
+def get_rpd(zone_ids, system_ids, value):
+    return {
+        "id": "RPD",
+        "ruleset_model_descriptions": [
+            {
+                "id": "RMD",
+                "buildings": [
+                    {
+                        "id": "Default Building",
+                        "building_segments": [
+                            {
+                                "id": "Default Building Segment",
+                                "zones": [
+                                    {"id": zone_id, "value": value}
+                                    for zone_id in zone_ids
+                                ],
+                                "heating_ventilating_air_conditioning_systems": [
+                                    {"id": system_id, "value": value}
+                                    for system_id in system_ids
+                                ],
+                            }
+                        ],
+                    }
+                ],
+                "boilers": [{"id": "Boiler 1", "value": value}],
+            }
+        ],
+    }
+
+
+class TestIncrementalRegeneration(unittest.TestCase):
+    def test_diff_file_commands(self):
+        previous_file_commands = get_file_commands()
+        file_commands = get_file_commands()
+        file_commands["WINDOW"]["Window 1"]["HEIGHT"] = "6"
+
+        changed = incremental_regeneration.diff_file_commands(
+            previous_file_commands, file_commands
+        )
+        self.assertEqual({("WINDOW", "Window 1")}, changed)
+
+    def test_diff_file_commands_added_object(self):
+        previous_file_commands = get_file_commands()
+        file_commands = get_file_commands()
+        file_commands["ZONE"]["Zone 3"] = {"command": "ZONE", "parent": "Sys 2"}
+
+        self.assertIsNone(
+            incremental_regeneration.diff_file_commands(
+                previous_file_commands, file_commands
+            )
+        )
+
+    def test_get_affected_systems(self):
+        previous_file_commands = get_file_commands()
+        file_commands = get_file_commands()
+        file_commands["WINDOW"]["Window 1"]["HEIGHT"] = "6"
+
+        affected_systems = incremental_regeneration.get_affected_systems(
+            previous_file_commands,
+            file_commands,
+            {("WINDOW", "Window 1")},
+        )
+        self.assertEqual({"Sys 2"}, affected_systems)
+        self.assertEqual(
+            {"Sys 1", "Zone 1", "Space 1", "Wall 1"},
+            incremental_regeneration.get_skipped_u_names(
+                file_commands, affected_systems
+            ),
+        )
+
+    def test_get_affected_systems_zone_moved(self):
+        previous_file_commands = get_file_commands()
+        file_commands = get_file_commands()
+        file_commands["ZONE"]["Zone 1"]["parent"] = "Sys 2"
+
+        affected_systems = incremental_regeneration.get_affected_systems(
+            previous_file_commands, file_commands, {("ZONE", "Zone 1")}
+        )
+        self.assertEqual({"Sys 1", "Sys 2"}, affected_systems)
+
+    def test_get_affected_systems_with_doas(self):
+        previous_file_commands = get_file_commands()
+        previous_file_commands["SYSTEM"]["DOAS 1"] = {
+            "command": "SYSTEM",
+            "TYPE": "DOAS",
+        }
+        previous_file_commands["SYSTEM"]["Sys 1"]["DOA-SYSTEM"] = "DOAS 1"
+        previous_file_commands["SYSTEM"]["Sys 2"]["DOA-SYSTEM"] = "DOAS 1"
+        file_commands = copy.deepcopy(previous_file_commands)
+        file_commands["ZONE"]["Zone 1"]["HEATING-CAPACITY"] = "-60000"
+
+        self.assertEqual(
+            {"Sys 1", "Sys 2", "DOAS 1"},
+            incremental_regeneration.get_affected_systems(
+                previous_file_commands, file_commands, {("ZONE", "Zone 1")}
+            ),
+        )
+
+    def test_get_affected_systems_outside_building_tree(self):
+        file_commands = get_file_commands()
+
+        self.assertIsNone(
+            incremental_regeneration.get_affected_systems(
+                file_commands, file_commands, {("BOILER", "Boiler 1")}
+            )
+        )
+
+    def test_merge_regenerated_rpd(self):
+        previous_rpd = get_rpd(["Zone 1", "Zone 2"], ["Sys 1", "Sys 2"], "old")
+        regenerated_rpd = get_rpd(["Zone 2"], ["Sys 2"], "new")
+
+        merged_rpd = incremental_regeneration.merge_regenerated_rpd(
+            previous_rpd, regenerated_rpd, get_file_commands(), {"Sys 2"}
+        )
+        self.assertEqual(
+            [{"id": "Zone 1", "value": "old"}, {"id": "Zone 2", "value": "new"}],
+            merged_rpd["ruleset_model_descriptions"][0]["buildings"][0][
+                "building_segments"
+            ][0]["zones"],
+        )
+        self.assertEqual(
+            [{"id": "Sys 1", "value": "old"}, {"id": "Sys 2", "value": "new"}],
+            merged_rpd["ruleset_model_descriptions"][0]["buildings"][0][
+                "building_segments"
+            ][0]["heating_ventilating_air_conditioning_systems"],
+        )
+        self.assertEqual(
+            [{"id": "Boiler 1", "value": "new"}],
+            merged_rpd["ruleset_model_descriptions"][0]["boilers"],
+        )
+
+    def test_merge_regenerated_rpd_unmatched_system(self):
+        previous_rpd = get_rpd(["Zone 1", "Zone 2"], ["Sys 1", "Sys 2"], "old")
+        regenerated_rpd = get_rpd(["Zone 2"], ["Sys 2", "Sys 2 - Zone 3"], "new")
+
+        self.assertIsNone(
+            incremental_regeneration.merge_regenerated_rpd(
+                previous_rpd, regenerated_rpd, get_file_commands(), {"Sys 2"}
+            )
+        )
+
+
+class TestIncrementalRegenerationEndToEnd(unittest.TestCase):
+    """
+    Generate an RPD from a test case BDL file, change one zone in the BDL file and compare the incremental
+    regeneration with a full generation. Simulation results are replaced by constants, as the test cases have no
+    simulation output files.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.bdl_path = Path(self.temp_dir.name) / "229 Test Case E-1 (PSZHP).BDL"
+        shutil.copy(
+            Path(__file__).parents[2]
+            / "test"
+            / "full_rpd_test"
+            / "E-1"
+            / "229 Test Case E-1 (PSZHP).BDL",
+            self.bdl_path,
+        )
+        self.config_paths = (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+        )
+        Config.EQUEST_INSTALL_PATH = self.temp_dir.name
+        Config.DOE22_DATA_PATH = self.temp_dir.name
+        Config.DOE23_DATA_PATH = self.temp_dir.name
+        self.output_patches = [
+            patch(
+                "rpd_generator.bdl_structure.base_node.get_multiple_results",
+                lambda dll, data_path, file_path, values: [1.0] * len(values),
+            ),
+            patch(
+                "rpd_generator.bdl_structure.base_node.get_string_result",
+                lambda *args: "",
+            ),
+            patch(
+                "rpd_generator.bdl_structure.base_definition.get_string_result",
+                lambda *args: "",
+            ),
+        ]
+        for output_patch in self.output_patches:
+            output_patch.start()
+
+    def tearDown(self):
+        for output_patch in self.output_patches:
+            output_patch.stop()
+        (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+        ) = self.config_paths
+        self.temp_dir.cleanup()
+
+    def test_incremental_matches_full_generation(self):
+        json_path = Path(self.temp_dir.name) / "incremental.json"
+        main.write_rpd_json_from_bdl(str(self.bdl_path), str(json_path), True)
+        previous_rpd = json.loads(json_path.read_text())
+
+        # Change the design heating temperature of the first zone
+        bdl_data = self.bdl_path.read_bytes()
+        design_heat_t = b"DESIGN-HEAT-T    =                      70.0000 F"
+        self.assertIn(design_heat_t, bdl_data)
+        self.bdl_path.write_bytes(
+            bdl_data.replace(
+                design_heat_t,
+                b"DESIGN-HEAT-T    =                      68.0000 F",
+                1,
+            )
+        )
+
+        with patch.object(
+            main, "_generate_rpd", wraps=main._generate_rpd
+        ) as generate_rpd:
+            main.write_rpd_json_from_bdl(str(self.bdl_path), str(json_path), True)
+        # The RPD is generated once, skipping the systems that did not change, and patched into the previous RPD
+        # without falling back to a full generation
+        generate_rpd.assert_called_once()
+        self.assertTrue(generate_rpd.call_args.args[2])
+
+        full_json_path = Path(self.temp_dir.name) / "full.json"
+        main.write_rpd_json_from_bdl(str(self.bdl_path), str(full_json_path))
+
+        incremental_rpd = json.loads(json_path.read_text())
+        full_rpd = json.loads(full_json_path.read_text())
+        self.assertNotEqual(previous_rpd, full_rpd)
+        self.assertEqual(full_rpd, incremental_rpd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from rpd_generator.utilities import model_staging
+
+
+class TestModelStaging(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model_dir = Path(self.temp_dir.name) / "project"
+        self.processing_dir = Path(self.temp_dir.name) / "processing"
+        self.model_dir.mkdir()
+        self.processing_dir.mkdir()
+        self.inp_path = self.model_dir / "Model.inp"
+        self.inp_path.write_text("INPUT ..\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_stage_output_files(self):
+        (self.model_dir / "Model.erp").write_text("erp")
+        (self.model_dir / "Model.lrp").write_text("lrp")
+        (self.model_dir / "Model - Baseline Design.srp").write_text("srp")
+
+        missing_files = model_staging.stage_output_files(
+            self.inp_path, self.processing_dir
+        )
+
+        self.assertEqual([self.model_dir / "Model.nhk"], missing_files)
+        self.assertEqual("erp", (self.processing_dir / "Model.erp").read_text())
+        self.assertEqual("srp", (self.processing_dir / "Model.srp").read_text())
+        self.assertTrue(
+            os.path.samefile(
+                self.model_dir / "Model.lrp", self.processing_dir / "Model.lrp"
+            )
+        )
+
+    def test_stage_file_replaces_stale_file(self):
+        source_file = self.model_dir / "Model.erp"
+        destination_file = self.processing_dir / "Model.erp"
+        source_file.write_text("old")
+        model_staging.stage_file(source_file, destination_file)
+
+        # The simulation writes a new file rather than updating the linked one
+        source_file.unlink()
+        source_file.write_text("new")
+        model_staging.stage_file(source_file, destination_file)
+
+        self.assertEqual("new", destination_file.read_text())
+
+    def test_prepared_inp_is_current_until_inp_changes(self):
+        self.assertFalse(
+            model_staging.is_prepared_inp_current(self.inp_path, self.processing_dir)
+        )
+
+        (self.processing_dir / "Model.inp").write_text("INPUT ..\n")
+        (self.processing_dir / "Model.BDL").write_text("BDL")
+        model_staging.record_prepared_inp(self.inp_path, self.processing_dir)
+        self.assertTrue(
+            model_staging.is_prepared_inp_current(self.inp_path, self.processing_dir)
+        )
+
+        self.inp_path.write_text("INPUT ..\nTITLE ..\n")
+        self.assertFalse(
+            model_staging.is_prepared_inp_current(self.inp_path, self.processing_dir)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
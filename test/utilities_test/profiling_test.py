@@ -0,0 +1,61 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from rpd_generator.utilities.profiling import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = Profiler()
+
+    def test_disabled_profiler_records_nothing(self):
+        with self.profiler.span("populate_data_elements", "ZONE"):
+            self.profiler.record_dll_call(12)
+
+        self.assertEqual({}, self.profiler.stats)
+        self.assertEqual([], self.profiler.trace_events)
+
+    def test_nested_span_inherits_command_and_counts_dll_requests(self):
+        self.profiler.enable()
+        for u_name in ["Zone 1", "Zone 2"]:
+            with self.profiler.span("populate_data_elements", "ZONE", u_name):
+                with self.profiler.span("get_output_data"):
+                    self.profiler.record_dll_call(12)
+                    self.profiler.record_dll_call(3)
+
+        report = self.profiler.get_report()
+        zone_stats = report["commands"]["ZONE"]
+        self.assertEqual(2, zone_stats["populate_data_elements"]["calls"])
+        self.assertEqual(2, zone_stats["get_output_data"]["calls"])
+        self.assertEqual(4, zone_stats["get_output_data"]["dll_calls"])
+        self.assertEqual(30, zone_stats["get_output_data"]["dll_requests"])
+        self.assertEqual(0, zone_stats["populate_data_elements"]["dll_calls"])
+        self.assertEqual(30, report["stages"]["get_output_data"]["dll_requests"])
+
+    def test_write_reports(self):
+        self.profiler.enable()
+        with self.profiler.span("make_ids_unique", "RPD"):
+            pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path, trace_path = self.profiler.write_reports(
+                Path(temp_dir) / "model.json"
+            )
+            with open(report_path) as report_file:
+                report = json.load(report_file)
+            with open(trace_path) as trace_file:
+                trace = json.load(trace_file)
+
+        self.assertEqual("model.profile.json", report_path.name)
+        self.assertEqual(1, report["stages"]["make_ids_unique"]["calls"])
+        self.assertEqual(1, len(trace["traceEvents"]))
+        event = trace["traceEvents"][0]
+        self.assertEqual("make_ids_unique", event["name"])
+        self.assertEqual("X", event["ph"])
+        self.assertEqual("RPD", event["args"]["command"])
+
+
+if __name__ == "__main__":
+    unittest.main()
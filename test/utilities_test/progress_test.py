@@ -0,0 +1,41 @@
+import unittest
+
+from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
+from rpd_generator.bdl_structure.bdl_commands.material_layers import Material
+from rpd_generator.utilities.progress import GenerationCancelled, ProgressReporter
+
+
+class TestProgressReporter(unittest.TestCase):
+    def test_counted_steps_are_throttled(self):
+        progress = ProgressReporter(min_interval=60)
+        progress.report("Parsing BDL file")
+        for i in range(100):
+            progress.report("Populating objects", i + 1, 100)
+
+        self.assertEqual(
+            [
+                {"stage": "Parsing BDL file", "completed": None, "total": None},
+                {"stage": "Populating objects", "completed": 1, "total": 100},
+                {"stage": "Populating objects", "completed": 100, "total": 100},
+            ],
+            progress.get_events(),
+        )
+        self.assertEqual([], progress.get_events())
+
+    def test_cancel(self):
+        progress = ProgressReporter()
+        progress.cancel()
+        with self.assertRaises(GenerationCancelled):
+            progress.report("Parsing BDL file")
+
+    def test_cancel_populate_rmd_data(self):
+        rmd = RulesetModelDescription("Test RMD")
+        Material("Material 1", rmd)
+        progress = ProgressReporter()
+        progress.cancel()
+        with self.assertRaises(GenerationCancelled):
+            rmd.populate_rmd_data(testing=True, progress=progress)
+
+
+if __name__ == "__main__":
+    unittest.main()
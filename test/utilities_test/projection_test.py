@@ -0,0 +1,82 @@
+import unittest
+from pathlib import Path
+
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.utilities.projection import expand_projection, includes_output
+
+
+class TestProjection(unittest.TestCase):
+    def test_expand_projection_whole_model(self):
+        self.assertIsNone(expand_projection(None))
+
+    def test_expand_projection_dependencies(self):
+        commands = expand_projection(["schedules"])
+        self.assertTrue(
+            {"SCHEDULE-PD", "WEEK-SCHEDULE-PD", "DAY-SCHEDULE-PD"} <= commands
+        )
+        self.assertNotIn("ZONE", commands)
+        self.assertNotIn("BOILER", commands)
+
+    def test_expand_projection_nested_data_groups(self):
+        commands = expand_projection("surfaces")
+        self.assertTrue(
+            {"WINDOW", "GLASS-TYPE", "CONSTRUCTION", "MATERIAL"} <= commands
+        )
+
+    def test_expand_projection_envelope_excludes_plant(self):
+        commands = expand_projection("envelope")
+        self.assertTrue(
+            {"SPACE", "ZONE", "SYSTEM", "FIXED-SHADE", "CONSTRUCTION"} <= commands
+        )
+        for command in [
+            "CIRCULATION-LOOP",
+            "PUMP",
+            "BOILER",
+            "CHILLER",
+            "HEAT-REJECTION",
+            "DW-HEATER",
+            "GROUND-LOOP-HX",
+            "CURVE-FIT",
+        ]:
+            self.assertNotIn(command, commands)
+
+    def test_expand_projection_named_referenced_commands(self):
+        self.assertIn("BOILER", expand_projection(["envelope", "hvac"]))
+
+    def test_expand_projection_unknown_name(self):
+        with self.assertRaises(ValueError):
+            expand_projection(["walls"])
+
+    def test_includes_output(self):
+        self.assertTrue(includes_output(None))
+        self.assertTrue(includes_output(["hvac", "output"]))
+        self.assertFalse(includes_output(["hvac"]))
+
+    def test_read_projection(self):
+        model_input_reader = ModelInputReader()
+        RulesetProjectDescription.bdl_command_dict = model_input_reader.bdl_command_dict
+        test_file = str(
+            Path(__file__).parents[2]
+            / "test"
+            / "full_rpd_test"
+            / "E-1"
+            / "229 Test Case E-1 (PSZHP).BDL"
+        )
+        data = model_input_reader.read_input_bdl_file(test_file)
+        projected_data = model_input_reader.read_input_bdl_file(
+            test_file, ["schedules"]
+        )
+
+        self.assertEqual(
+            data["file_commands"]["SCHEDULE-PD"],
+            projected_data["file_commands"]["SCHEDULE-PD"],
+        )
+        self.assertNotIn("ZONE", projected_data["file_commands"])
+        self.assertNotIn("MATERIAL", projected_data["file_commands"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from rpd_generator.config import Config
+from rpd_generator.utilities import validate_configuration
+
+
+def create_installation(parent_path, data_path):
+    install_path = Path(parent_path) / "eQUEST 3-65-7175"
+    install_path.mkdir(parents=True)
+    for file_name in ["eQUEST.ini", "eQUESTD23.ini"]:
+        (install_path / file_name).write_text(f'[paths]\nDataPath="{data_path}"\n')
+    for file_name in ["D2Result.dll", "BDLCIO32.DLL"]:
+        (install_path / file_name).touch()
+    return install_path
+
+
+class TestFindEQUESTInstallation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.config_path = self.root / "user" / "installation.ini"
+        self.data_path = self.root / "Documents" / "eQUEST 3-65-7175 Data"
+        self.data_path.mkdir(parents=True)
+
+        original_paths = (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+        )
+        self.addCleanup(self.restore_config, original_paths)
+        self.addCleanup(self.temp_dir.cleanup)
+
+    @staticmethod
+    def restore_config(original_paths):
+        (
+            Config.EQUEST_INSTALL_PATH,
+            Config.DOE22_DATA_PATH,
+            Config.DOE23_DATA_PATH,
+        ) = original_paths
+
+    def test_search_prunes_by_depth_and_name(self):
+        create_installation(self.root / "Windows" / "Program", self.data_path)
+        create_installation(self.root / "a" / "b" / "c" / "d", self.data_path)
+        self.assertIsNone(validate_configuration.search_for_installation([self.root]))
+
+        expected_path = create_installation(self.root / "Apps" / "DOE2", self.data_path)
+        self.assertEqual(
+            expected_path, validate_configuration.search_for_installation([self.root])
+        )
+
+    def test_installation_is_saved_and_revalidated(self):
+        install_path = create_installation(self.root / "Program Files", self.data_path)
+        with patch.object(
+            validate_configuration,
+            "get_default_search_paths",
+            return_value=[self.root / "Program Files"],
+        ):
+            self.assertEqual(
+                install_path,
+                validate_configuration.find_equest_installation(
+                    config_path=self.config_path
+                ),
+            )
+        self.assertEqual(str(self.data_path), Config.DOE23_DATA_PATH)
+        self.assertTrue(self.config_path.exists())
+
+        Config.EQUEST_INSTALL_PATH = None
+        with patch.object(
+            validate_configuration, "search_for_installation"
+        ) as mock_search:
+            self.assertEqual(
+                install_path,
+                validate_configuration.find_equest_installation(
+                    config_path=self.config_path
+                ),
+            )
+            mock_search.assert_not_called()
+
+        # A saved installation that no longer exists is searched for again
+        (install_path / "D2Result.dll").unlink()
+        self.assertFalse(
+            validate_configuration.load_user_configuration(self.config_path)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()